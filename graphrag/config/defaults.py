@@ -13,6 +13,8 @@ from graphrag.config.enums import (
     AuthType,
     CacheType,
     ChunkStrategyType,
+    ClusterGraphBackendType,
+    EmbedGraphBackendType,
     InputFileType,
     ModelType,
     NounPhraseExtractorType,
@@ -62,6 +64,15 @@ class CacheDefaults:
     cosmosdb_account_url: None = None
 
 
+@dataclass
+class CheckpointsDefaults:
+    """Default values for row checkpoints."""
+
+    enabled: bool = False
+    flush_rows: int = 100
+    flush_interval: float = 60.0
+
+
 @dataclass
 class ChunksDefaults:
     """Default values for chunks."""
@@ -82,6 +93,8 @@ class ClusterGraphDefaults:
     max_cluster_size: int = 10
     use_lcc: bool = True
     seed: int = 0xDEADBEEF
+    backend: ClusterGraphBackendType = ClusterGraphBackendType.Graspologic
+    incremental_update: bool = False
 
 
 @dataclass
@@ -94,6 +107,7 @@ class CommunityReportDefaults:
     max_input_length: int = 8000
     strategy: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
+    reuse_unchanged_reports: bool = True
 
 
 @dataclass
@@ -137,6 +151,9 @@ class EmbedGraphDefaults:
     iterations: int = 3
     random_seed: int = 597832
     use_lcc: bool = True
+    backend: EmbedGraphBackendType = EmbedGraphBackendType.Graspologic
+    workers: int | None = None
+    node_sample_rate: float = 1.0
 
 
 @dataclass
@@ -164,6 +181,8 @@ class ExtractClaimsDefaults:
     max_gleanings: int = 1
     strategy: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
+    joint_extraction: bool = False
+    joint_prompt: None = None
 
 
 @dataclass
@@ -175,6 +194,9 @@ class ExtractGraphDefaults:
         default_factory=lambda: ["organization", "person", "geo", "event"]
     )
     max_gleanings: int = 1
+    adaptive_gleaning: bool = False
+    min_gleaning_yield: int = 1
+    gleaning_min_density: None = None
     strategy: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
 
@@ -214,6 +236,8 @@ class ExtractGraphNLPDefaults:
     normalize_edge_weights: bool = True
     text_analyzer: TextAnalyzerDefaults = field(default_factory=TextAnalyzerDefaults)
     concurrent_requests: int = 25
+    batch_size: int = 100
+    num_processes: int = 1
 
 
 @dataclass
@@ -353,6 +377,7 @@ class SnapshotsDefaults:
 
     embeddings: bool = False
     graphml: bool = False
+    graph_arrow: bool = False
     raw_graph: bool = False
 
 
@@ -365,6 +390,8 @@ class SummarizeDescriptionsDefaults:
     max_input_tokens: int = 4_000
     strategy: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
+    batch_max_input_tokens: int = 0
+    batch_max_item_tokens: int = 500
 
 
 @dataclass
@@ -372,6 +399,9 @@ class UmapDefaults:
     """Default values for UMAP."""
 
     enabled: bool = False
+    sample_size: int | None = None
+    out_of_core: bool = False
+    incremental_update: bool = False
 
 
 @dataclass
@@ -393,6 +423,10 @@ class VectorStoreDefaults:
     api_key: None = None
     audience: None = None
     database_name: None = None
+    index_type: None = None
+    index_params: None = None
+    index_min_rows: int = 10_000
+    quantization: None = None
 
 
 @dataclass
@@ -414,6 +448,7 @@ class GraphRagConfigDefaults:
     embed_text: EmbedTextDefaults = field(default_factory=EmbedTextDefaults)
     chunks: ChunksDefaults = field(default_factory=ChunksDefaults)
     snapshots: SnapshotsDefaults = field(default_factory=SnapshotsDefaults)
+    checkpoints: CheckpointsDefaults = field(default_factory=CheckpointsDefaults)
     extract_graph: ExtractGraphDefaults = field(default_factory=ExtractGraphDefaults)
     extract_graph_nlp: ExtractGraphNLPDefaults = field(
         default_factory=ExtractGraphNLPDefaults
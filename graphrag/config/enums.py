@@ -65,6 +65,7 @@ class VectorStoreType(str, Enum):
     LanceDB = "lancedb"
     AzureAISearch = "azure_ai_search"
     CosmosDB = "cosmosdb"
+    Flat = "flat"
 
 
 class ReportingType(str, Enum):
@@ -172,3 +173,21 @@ class ModularityMetric(str, Enum):
 
     WeightedComponents = "weighted_components"
     """Weighted components modularity metric."""
+
+
+class ClusterGraphBackendType(str, Enum):
+    """Enum for the hierarchical Leiden clustering backend options."""
+
+    Graspologic = "graspologic"
+    """Run graspologic's hierarchical Leiden on a networkx graph."""
+    EdgeList = "edge_list"
+    """Run the native hierarchical Leiden directly on an integer edge list, without building a networkx graph."""
+
+
+class EmbedGraphBackendType(str, Enum):
+    """Enum for the node2vec graph embedding backend options."""
+
+    Graspologic = "graspologic"
+    """Run graspologic's node2vec on a networkx graph."""
+    Parallel = "parallel"
+    """Simulate walks in worker processes on the adjacency arrays, and train skip-gram with several workers."""
@@ -122,6 +122,8 @@ extract_claims:
   prompt: "prompts/extract_claims.txt"
   description: "{graphrag_config_defaults.extract_claims.description}"
   max_gleanings: {graphrag_config_defaults.extract_claims.max_gleanings}
+  joint_extraction: false # if true, claims are extracted in the extract_graph prompt
+  joint_prompt: "prompts/extract_graph_claims.txt"
 
 community_reports:
   model_id: {graphrag_config_defaults.community_reports.model_id}
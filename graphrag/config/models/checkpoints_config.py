@@ -0,0 +1,25 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+from graphrag.config.defaults import graphrag_config_defaults
+
+
+class CheckpointsConfig(BaseModel):
+    """Configuration section for row-level checkpoints of long-running LLM operations."""
+
+    enabled: bool = Field(
+        description="A flag indicating whether to checkpoint completed rows so an interrupted workflow can resume.",
+        default=graphrag_config_defaults.checkpoints.enabled,
+    )
+    flush_rows: int = Field(
+        description="The number of completed rows after which a checkpoint shard is written.",
+        default=graphrag_config_defaults.checkpoints.flush_rows,
+    )
+    flush_interval: float = Field(
+        description="The number of seconds after which a checkpoint shard is written.",
+        default=graphrag_config_defaults.checkpoints.flush_interval,
+    )
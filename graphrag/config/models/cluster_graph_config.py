@@ -6,6 +6,7 @@
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import ClusterGraphBackendType
 
 
 class ClusterGraphConfig(BaseModel):
@@ -23,3 +24,11 @@ class ClusterGraphConfig(BaseModel):
         description="The seed to use for the clustering.",
         default=graphrag_config_defaults.cluster_graph.seed,
     )
+    backend: ClusterGraphBackendType = Field(
+        description="The hierarchical Leiden backend to use for clustering.",
+        default=graphrag_config_defaults.cluster_graph.backend,
+    )
+    incremental_update: bool = Field(
+        description="Whether update runs re-cluster only the communities touched by new relationships.",
+        default=graphrag_config_defaults.cluster_graph.incremental_update,
+    )
@@ -38,6 +38,10 @@ class CommunityReportsConfig(BaseModel):
         description="The override strategy to use.",
         default=graphrag_config_defaults.community_reports.strategy,
     )
+    reuse_unchanged_reports: bool = Field(
+        description="Whether to reuse the cached report of a community whose content fingerprint did not change.",
+        default=graphrag_config_defaults.community_reports.reuse_unchanged_reports,
+    )
 
     def resolved_strategy(
         self, root_dir: str, model_config: LanguageModelConfig
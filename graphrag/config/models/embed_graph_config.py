@@ -6,6 +6,7 @@
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import EmbedGraphBackendType
 
 
 class EmbedGraphConfig(BaseModel):
@@ -43,3 +44,15 @@ class EmbedGraphConfig(BaseModel):
         description="Whether to use the largest connected component.",
         default=graphrag_config_defaults.embed_graph.use_lcc,
     )
+    backend: EmbedGraphBackendType = Field(
+        description="The node2vec backend to use.",
+        default=graphrag_config_defaults.embed_graph.backend,
+    )
+    workers: int | None = Field(
+        description="The number of workers of the parallel node2vec backend. Defaults to the number of CPUs.",
+        default=graphrag_config_defaults.embed_graph.workers,
+    )
+    node_sample_rate: float = Field(
+        description="The fraction of nodes that start walks in every round of the parallel node2vec backend.",
+        default=graphrag_config_defaults.embed_graph.node_sample_rate,
+    )
@@ -38,6 +38,14 @@ class ClaimExtractionConfig(BaseModel):
         description="The override strategy to use.",
         default=graphrag_config_defaults.extract_claims.strategy,
     )
+    joint_extraction: bool = Field(
+        description="Whether to extract claims in the same prompt as entities and relationships, instead of a separate pass over the text units.",
+        default=graphrag_config_defaults.extract_claims.joint_extraction,
+    )
+    joint_prompt: str | None = Field(
+        description="The joint entity, relationship and claim extraction prompt to use.",
+        default=graphrag_config_defaults.extract_claims.joint_prompt,
+    )
 
     def resolved_strategy(
         self, root_dir: str, model_config: LanguageModelConfig
@@ -53,3 +61,14 @@ class ClaimExtractionConfig(BaseModel):
             "claim_description": self.description,
             "max_gleanings": self.max_gleanings,
         }
+
+    def resolved_joint_strategy(self, root_dir: str) -> dict:
+        """Get the entity extraction strategy settings that also extract claims."""
+        return {
+            "extraction_prompt": (Path(root_dir) / self.joint_prompt).read_text(
+                encoding="utf-8"
+            )
+            if self.joint_prompt
+            else None,
+            "claim_description": self.description,
+        }
@@ -30,6 +30,18 @@ class ExtractGraphConfig(BaseModel):
         description="The maximum number of entity gleanings to use.",
         default=graphrag_config_defaults.extract_graph.max_gleanings,
     )
+    adaptive_gleaning: bool = Field(
+        description="Whether to skip the gleaning loop check and stop gleaning once a round adds too few new entities.",
+        default=graphrag_config_defaults.extract_graph.adaptive_gleaning,
+    )
+    min_gleaning_yield: int = Field(
+        description="The minimum number of new entities a gleaning round must add for adaptive gleaning to continue.",
+        default=graphrag_config_defaults.extract_graph.min_gleaning_yield,
+    )
+    gleaning_min_density: float | None = Field(
+        description="The minimum number of initially extracted entities per 1,000 characters for a chunk to be gleaned in adaptive mode.",
+        default=graphrag_config_defaults.extract_graph.gleaning_min_density,
+    )
     strategy: dict | None = Field(
         description="Override the default entity extraction strategy",
         default=graphrag_config_defaults.extract_graph.strategy,
@@ -52,4 +64,7 @@ class ExtractGraphConfig(BaseModel):
             if self.prompt
             else None,
             "max_gleanings": self.max_gleanings,
+            "adaptive_gleaning": self.adaptive_gleaning,
+            "min_gleaning_yield": self.min_gleaning_yield,
+            "gleaning_min_density": self.gleaning_min_density,
         }
@@ -65,6 +65,14 @@ class ExtractGraphNLPConfig(BaseModel):
         description="The text analyzer configuration.", default=TextAnalyzerConfig()
     )
     concurrent_requests: int = Field(
-        description="The number of threads to use for the extraction process.",
+        description="The number of concurrent noun phrase cache reads and writes.",
         default=graphrag_config_defaults.extract_graph_nlp.concurrent_requests,
     )
+    batch_size: int = Field(
+        description="The number of text units the SpaCy-based analyzers parse per batch.",
+        default=graphrag_config_defaults.extract_graph_nlp.batch_size,
+    )
+    num_processes: int = Field(
+        description="The number of processes the SpaCy-based analyzers parse with. Use -1 for one process per CPU.",
+        default=graphrag_config_defaults.extract_graph_nlp.num_processes,
+    )
@@ -15,6 +15,7 @@ from graphrag.config.enums import VectorStoreType
 from graphrag.config.errors import LanguageModelConfigMissingError
 from graphrag.config.models.basic_search_config import BasicSearchConfig
 from graphrag.config.models.cache_config import CacheConfig
+from graphrag.config.models.checkpoints_config import CheckpointsConfig
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
 from graphrag.config.models.community_reports_config import CommunityReportsConfig
@@ -271,6 +272,12 @@ class GraphRagConfig(BaseModel):
     )
     """The snapshots configuration to use."""
 
+    checkpoints: CheckpointsConfig = Field(
+        description="The row checkpoints configuration to use.",
+        default=CheckpointsConfig(),
+    )
+    """The row checkpoints configuration to use."""
+
     local_search: LocalSearchConfig = Field(
         description="The local search configuration.", default=LocalSearchConfig()
     )
@@ -294,9 +301,9 @@ class GraphRagConfig(BaseModel):
     def _validate_vector_store_db_uri(self) -> None:
         """Validate the vector store configuration."""
         for store in self.vector_store.values():
-            if store.type == VectorStoreType.LanceDB:
+            if store.type in (VectorStoreType.LanceDB, VectorStoreType.Flat):
                 if not store.db_uri or store.db_uri.strip == "":
-                    msg = "Vector store URI is required for LanceDB. Please rerun `graphrag init` and set the vector store configuration."
+                    msg = f"Vector store URI is required for {store.type}. Please rerun `graphrag init` and set the vector store configuration."
                     raise ValueError(msg)
                 store.db_uri = str((Path(self.root_dir) / store.db_uri).resolve())
 
@@ -19,6 +19,10 @@ class SnapshotsConfig(BaseModel):
         description="A flag indicating whether to take snapshots of GraphML.",
         default=graphrag_config_defaults.snapshots.graphml,
     )
+    graph_arrow: bool = Field(
+        description="A flag indicating whether to take snapshots of the graph as memory-mappable Arrow IPC node and edge tables.",
+        default=graphrag_config_defaults.snapshots.graph_arrow,
+    )
     raw_graph: bool = Field(
         description="A flag indicating whether to take snapshots of the raw extracted graph (entities and relationships) before merging.",
         default=graphrag_config_defaults.snapshots.raw_graph,
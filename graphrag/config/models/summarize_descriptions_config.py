@@ -30,6 +30,14 @@ class SummarizeDescriptionsConfig(BaseModel):
         description="Maximum tokens to submit from the input entity descriptions.",
         default=graphrag_config_defaults.summarize_descriptions.max_input_tokens,
     )
+    batch_max_input_tokens: int = Field(
+        description="Maximum tokens of descriptions to pack into one batched summarization call. Set to 0 to summarize each entity and relationship separately.",
+        default=graphrag_config_defaults.summarize_descriptions.batch_max_input_tokens,
+    )
+    batch_max_item_tokens: int = Field(
+        description="Maximum tokens of descriptions for an entity or relationship to be summarized in a batch.",
+        default=graphrag_config_defaults.summarize_descriptions.batch_max_item_tokens,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.",
         default=graphrag_config_defaults.summarize_descriptions.strategy,
@@ -53,4 +61,6 @@ class SummarizeDescriptionsConfig(BaseModel):
             else None,
             "max_summary_length": self.max_length,
             "max_input_tokens": self.max_input_tokens,
+            "batch_max_input_tokens": self.batch_max_input_tokens,
+            "batch_max_item_tokens": self.batch_max_item_tokens,
         }
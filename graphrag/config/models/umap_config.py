@@ -15,3 +15,15 @@ class UmapConfig(BaseModel):
         description="A flag indicating whether to enable UMAP.",
         default=graphrag_config_defaults.umap.enabled,
     )
+    sample_size: int | None = Field(
+        description="The number of nodes to fit UMAP on, transforming the others in batches. Fits on every node if not set.",
+        default=graphrag_config_defaults.umap.sample_size,
+    )
+    out_of_core: bool = Field(
+        description="Whether to keep the embeddings UMAP reads in a memory-mapped file.",
+        default=graphrag_config_defaults.umap.out_of_core,
+    )
+    incremental_update: bool = Field(
+        description="Whether update runs keep the positions of known nodes and map new nodes into the previous layout.",
+        default=graphrag_config_defaults.umap.incremental_update,
+    )
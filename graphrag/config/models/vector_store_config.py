@@ -3,9 +3,11 @@
 
 """Parameterization settings for the default configuration."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field, model_validator
 
-from graphrag.config.defaults import vector_store_defaults
+from graphrag.config.defaults import DEFAULT_OUTPUT_BASE_DIR, vector_store_defaults
 from graphrag.config.enums import VectorStoreType
 
 
@@ -29,10 +31,17 @@ class VectorStoreConfig(BaseModel):
         ):
             self.db_uri = vector_store_defaults.db_uri
 
-        if self.type != VectorStoreType.LanceDB.value and (
-            self.db_uri is not None and self.db_uri.strip() != ""
+        # flat vector stores are written next to the index outputs by default
+        if self.type == VectorStoreType.Flat.value and (
+            self.db_uri is None or self.db_uri.strip() == ""
         ):
-            msg = "vector_store.db_uri is only used when vector_store.type == lancedb. Please rerun `graphrag init` and select the correct vector store type."
+            self.db_uri = DEFAULT_OUTPUT_BASE_DIR
+
+        if self.type not in (
+            VectorStoreType.LanceDB.value,
+            VectorStoreType.Flat.value,
+        ) and (self.db_uri is not None and self.db_uri.strip() != ""):
+            msg = "vector_store.db_uri is only used when vector_store.type == lancedb or vector_store.type == flat. Please rerun `graphrag init` and select the correct vector store type."
             raise ValueError(msg)
 
     url: str | None = Field(
@@ -54,7 +63,7 @@ class VectorStoreConfig(BaseModel):
             msg = "vector_store.url is required when vector_store.type == cosmos_db. Please rerun `graphrag init` and select the correct vector store type."
             raise ValueError(msg)
 
-        if self.type == VectorStoreType.LanceDB and (
+        if self.type in (VectorStoreType.LanceDB, VectorStoreType.Flat) and (
             self.url is not None and self.url.strip() != ""
         ):
             msg = "vector_store.url is only used when vector_store.type == azure_ai_search or vector_store.type == cosmos_db. Please rerun `graphrag init` and select the correct vector store type."
@@ -85,6 +94,26 @@ class VectorStoreConfig(BaseModel):
         default=vector_store_defaults.overwrite,
     )
 
+    index_type: str | None = Field(
+        description="The ANN index to build after loading documents when type == lancedb: ivf_pq, ivf_hnsw_pq or ivf_hnsw_sq.",
+        default=vector_store_defaults.index_type,
+    )
+
+    index_params: dict[str, Any] | None = Field(
+        description="Additional parameters of the ANN index when type == lancedb, e.g. num_partitions or num_sub_vectors.",
+        default=vector_store_defaults.index_params,
+    )
+
+    index_min_rows: int = Field(
+        description="The minimum number of documents for the ANN index to be built when type == lancedb.",
+        default=vector_store_defaults.index_min_rows,
+    )
+
+    quantization: str | None = Field(
+        description="The quantization of stored vectors when type == flat: int8, or None to store float32 vectors.",
+        default=vector_store_defaults.quantization,
+    )
+
     @model_validator(mode="after")
     def _validate_model(self):
         """Validate the model."""
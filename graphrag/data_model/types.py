@@ -6,3 +6,4 @@
 from collections.abc import Callable
 
 TextEmbedder = Callable[[str], list[float]]
+TextBatchEmbedder = Callable[[list[str]], list[list[float]]]
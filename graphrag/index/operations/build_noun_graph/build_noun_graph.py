@@ -3,20 +3,21 @@
 
 """Graph extraction using NLP."""
 
-from itertools import combinations
+import asyncio
+from typing import Any
 
 import numpy as np
 import pandas as pd
 
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
 from graphrag.cache.pipeline_cache import PipelineCache
-from graphrag.config.enums import AsyncType
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.index.operations.build_noun_graph.np_extractors.base import (
     BaseNounPhraseExtractor,
 )
-from graphrag.index.utils.derive_from_rows import derive_from_rows
 from graphrag.index.utils.graphs import calculate_pmi_edge_weights
 from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.logger.progress import progress_ticker
 
 
 async def build_noun_graph(
@@ -25,11 +26,18 @@ async def build_noun_graph(
     normalize_edge_weights: bool,
     num_threads: int = 4,
     cache: PipelineCache | None = None,
+    batch_size: int = 100,
+    num_processes: int = 1,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Build a noun graph from text units."""
     text_units = text_unit_df.loc[:, ["id", "text"]]
     nodes_df = await _extract_nodes(
-        text_units, text_analyzer, num_threads=num_threads, cache=cache
+        text_units,
+        text_analyzer,
+        num_threads=num_threads,
+        cache=cache,
+        batch_size=batch_size,
+        num_processes=num_processes,
     )
     edges_df = _extract_edges(nodes_df, normalize_edge_weights=normalize_edge_weights)
     return (nodes_df, edges_df)
@@ -40,33 +48,69 @@ async def _extract_nodes(
     text_analyzer: BaseNounPhraseExtractor,
     num_threads: int = 4,
     cache: PipelineCache | None = None,
+    batch_size: int = 100,
+    num_processes: int = 1,
 ) -> pd.DataFrame:
     """
     Extract initial nodes and edges from text units.
 
+    Cached noun phrases are read first, and the texts missing from the cache are extracted together in one batch call,
+    so that SpaCy-based analyzers parse them with `nlp.pipe`. `num_threads` bounds the concurrent cache reads and writes.
+
     Input: text unit df with schema [id, text, document_id]
     Returns a dataframe with schema [id, title, frequency, text_unit_ids].
     """
     cache = cache or NoopPipelineCache()
     cache = cache.child("extract_noun_phrases")
+    semaphore = asyncio.Semaphore(num_threads)
+    analyzer = str(text_analyzer)
 
-    async def extract(row):
-        text = row["text"]
-        attrs = {"text": text, "analyzer": str(text_analyzer)}
-        key = gen_sha512_hash(attrs, attrs.keys())
-        result = await cache.get(key)
-        if not result:
-            result = text_analyzer.extract(text)
-            await cache.set(key, result)
-        return result
-
-    text_unit_df["noun_phrases"] = await derive_from_rows(
-        text_unit_df,
-        extract,
-        num_threads=num_threads,
-        async_type=AsyncType.Threaded,
-        progress_msg="extract noun phrases progress: ",
+    texts = text_unit_df["text"].tolist()
+    keys = [
+        gen_sha512_hash(attrs, attrs.keys())
+        for attrs in ({"text": text, "analyzer": analyzer} for text in texts)
+    ]
+
+    async def read(key: str) -> Any:
+        async with semaphore:
+            return await cache.get(key)
+
+    async def write(key: str, value: list[str]) -> None:
+        async with semaphore:
+            await cache.set(key, value)
+
+    results = dict(
+        zip(keys, await asyncio.gather(*[read(key) for key in keys]), strict=True)
     )
+    # texts are extracted once per key, in order of first appearance
+    missing = {
+        key: text for key, text in zip(keys, texts, strict=True) if not results[key]
+    }
+
+    if missing:
+        tick = progress_ticker(
+            NoopWorkflowCallbacks().progress,
+            len(missing),
+            description="extract noun phrases progress: ",
+        )
+
+        def extract_missing() -> list[list[str]]:
+            extracted = []
+            for noun_phrases in text_analyzer.extract_batch(
+                missing.values(), batch_size=batch_size, n_process=num_processes
+            ):
+                extracted.append(noun_phrases)
+                tick()
+            return extracted
+
+        extracted = await asyncio.to_thread(extract_missing)
+        results.update(zip(missing.keys(), extracted, strict=True))
+        await asyncio.gather(*[
+            write(key, noun_phrases)
+            for key, noun_phrases in zip(missing.keys(), extracted, strict=True)
+        ])
+
+    text_unit_df["noun_phrases"] = [results[key] for key in keys]
 
     noun_node_df = text_unit_df.explode("noun_phrases")
     noun_node_df = noun_node_df.rename(
@@ -94,39 +138,51 @@ def _extract_edges(
     Input: nodes_df with schema [id, title, frequency, text_unit_ids]
     Returns: edges_df with schema [source, target, weight, text_unit_ids]
     """
-    text_units_df = nodes_df.explode("text_unit_ids")
-    text_units_df = text_units_df.rename(columns={"text_unit_ids": "text_unit_id"})
+    text_units_df = nodes_df.loc[:, ["title", "text_unit_ids"]].explode("text_unit_ids")
+    text_units_df = text_units_df[
+        text_units_df["title"].notna() & text_units_df["text_unit_ids"].notna()
+    ]
+    # node and text unit codes follow the sorted titles and ids, so that code order is string order
+    title_codes, titles = pd.factorize(text_units_df["title"], sort=True)
+    text_unit_codes, text_unit_ids = pd.factorize(
+        text_units_df["text_unit_ids"], sort=True
+    )
 
-    text_units_df = (
-        text_units_df.groupby("text_unit_id")
-        .agg({"title": lambda x: list(x) if len(x) > 1 else np.nan})
-        .reset_index()
+    # the text unit x noun phrase incidence matrix in CSR form, keeping the node order within every text unit
+    order = np.argsort(text_unit_codes, kind="stable")
+    indices = title_codes[order]
+    counts = np.bincount(text_unit_codes, minlength=len(text_unit_ids))
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+
+    # every pair of positions within a text unit, in the order of combinations(titles, 2)
+    position = np.arange(len(indices))
+    following = np.repeat(indptr[1:], counts) - position - 1
+    first = np.repeat(position, following)
+    pair_starts = np.cumsum(following) - following
+    second = first + np.arange(len(first)) - np.repeat(pair_starts, following) + 1
+    pair_text_units = np.repeat(np.arange(len(text_unit_ids)), counts)[first]
+
+    sources = np.minimum(indices[first], indices[second]).astype(np.int64)
+    targets = np.maximum(indices[first], indices[second]).astype(np.int64)
+    # group the pairs by edge, keeping the text unit order within every edge
+    keys = sources * len(titles) + targets
+    pair_order = np.argsort(keys, kind="stable")
+    edge_keys, edge_starts, weights = np.unique(
+        keys[pair_order], return_index=True, return_counts=True
     )
-    text_units_df = text_units_df.dropna()
-    titles = text_units_df["title"].tolist()
-    all_edges: list[list[tuple[str, str]]] = [list(combinations(t, 2)) for t in titles]
-
-    text_units_df = text_units_df.assign(edges=all_edges)  # type: ignore
-    edge_df = text_units_df.explode("edges")[["edges", "text_unit_id"]]
-
-    edge_df[["source", "target"]] = edge_df.loc[:, "edges"].to_list()
-    edge_df["min_source"] = edge_df[["source", "target"]].min(axis=1)
-    edge_df["max_target"] = edge_df[["source", "target"]].max(axis=1)
-    edge_df = edge_df.drop(columns=["source", "target"]).rename(
-        columns={"min_source": "source", "max_target": "target"}  # type: ignore
+    edge_text_unit_ids = np.split(
+        np.asarray(text_unit_ids, dtype=object)[pair_text_units[pair_order]],
+        edge_starts[1:],
     )
 
-    edge_df = edge_df[(edge_df.source.notna()) & (edge_df.target.notna())]
-    edge_df = edge_df.drop(columns=["edges"])
-    # group by source and target, count the number of text units
-    grouped_edge_df = (
-        edge_df.groupby(["source", "target"]).agg({"text_unit_id": list}).reset_index()
-    )
-    grouped_edge_df = grouped_edge_df.rename(columns={"text_unit_id": "text_unit_ids"})
-    grouped_edge_df["weight"] = grouped_edge_df["text_unit_ids"].apply(len)
-    grouped_edge_df = grouped_edge_df.loc[
-        :, ["source", "target", "weight", "text_unit_ids"]
-    ]
+    grouped_edge_df = pd.DataFrame({
+        "source": np.asarray(titles, dtype=object)[edge_keys // max(len(titles), 1)],
+        "target": np.asarray(titles, dtype=object)[edge_keys % max(len(titles), 1)],
+        "weight": weights,
+        "text_unit_ids": [ids.tolist() for ids in edge_text_unit_ids]
+        if len(edge_keys) > 0
+        else [],
+    })
     if normalize_edge_weights:
         # use PMI weight instead of raw weight
         grouped_edge_df = calculate_pmi_edge_weights(nodes_df, grouped_edge_df)
@@ -5,6 +5,7 @@
 
 import logging
 from abc import ABCMeta, abstractmethod
+from collections.abc import Iterable, Iterator
 
 import spacy
 
@@ -39,6 +40,24 @@ class BaseNounPhraseExtractor(metaclass=ABCMeta):
         Returns: List of noun phrases.
         """
 
+    def extract_batch(
+        self, texts: Iterable[str], batch_size: int = 100, n_process: int = 1
+    ) -> Iterator[list[str]]:
+        """
+        Extract noun phrases from several texts, yielding the noun phrases of every text in order.
+
+        Extractors that can process texts in bulk override this; by default every text is extracted in turn.
+
+        Args:
+            texts: Texts.
+            batch_size: Number of texts to process per batch.
+            n_process: Number of processes to use, for extractors that support multiprocessing.
+
+        Returns: Iterator over the list of noun phrases of every text.
+        """
+        for text in texts:
+            yield self.extract(text)
+
     @abstractmethod
     def __str__(self) -> str:
         """Return string representation of the extractor, used for cache key generation."""
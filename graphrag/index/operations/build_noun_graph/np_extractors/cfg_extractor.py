@@ -3,6 +3,7 @@
 
 """CFG-based noun phrase extractor."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from spacy.tokens.doc import Doc
@@ -80,8 +81,26 @@ class CFGNounPhraseExtractor(BaseNounPhraseExtractor):
 
         Returns: List of noun phrases.
         """
-        doc = self.nlp(text)
+        return self._extract_from_doc(self.nlp(text))
 
+    def extract_batch(
+        self, texts: Iterable[str], batch_size: int = 100, n_process: int = 1
+    ) -> Iterator[list[str]]:
+        """
+        Extract noun phrases from several texts, parsing them in batches with SpaCy's `nlp.pipe`.
+
+        Args:
+            texts: Texts.
+            batch_size: Number of texts to parse per batch.
+            n_process: Number of processes to parse with.
+
+        Returns: Iterator over the list of noun phrases of every text.
+        """
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._extract_from_doc(doc)
+
+    def _extract_from_doc(self, doc: Doc) -> list[str]:
+        """Extract the noun phrases of a parsed document."""
         filtered_noun_phrases = set()
         if self.include_named_entities:
             # extract noun chunks + entities then filter overlapping spans
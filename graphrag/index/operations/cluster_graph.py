@@ -4,34 +4,48 @@
 """A module containing cluster_graph, apply_clustering and run_layout methods definition."""
 
 import logging
+from collections.abc import Callable
 
+import graspologic_native as gn
 import networkx as nx
+import numpy as np
 from graspologic.partition import hierarchical_leiden
 
-from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.config.enums import ClusterGraphBackendType
+from graphrag.index.utils.compact_graph import CompactGraph
+from graphrag.index.utils.stable_lcc import (
+    stable_compact_largest_connected_component,
+    stable_largest_connected_component,
+)
 
 Communities = list[tuple[int, int, int, list[str]]]
 
+ClusteringBackend = Callable[
+    [nx.Graph | CompactGraph, int, bool, int | None],
+    tuple[dict[int, dict[str, int]], dict[int, int]],
+]
+"""A hierarchical clustering function returning the community of every node by level, and the parent of every community."""
+
 
 logger = logging.getLogger(__name__)
 
 
 def cluster_graph(
-    graph: nx.Graph,
+    graph: nx.Graph | CompactGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    backend: ClusterGraphBackendType = ClusterGraphBackendType.Graspologic,
 ) -> Communities:
     """Apply a hierarchical clustering algorithm to a graph."""
-    if len(graph.nodes) == 0:
+    num_nodes = graph.num_nodes if isinstance(graph, CompactGraph) else len(graph.nodes)
+    if num_nodes == 0:
         logger.warning("Graph has no nodes")
         return []
 
-    node_id_to_community_map, parent_mapping = _compute_leiden_communities(
-        graph=graph,
-        max_cluster_size=max_cluster_size,
-        use_lcc=use_lcc,
-        seed=seed,
+    compute_communities = load_backend(backend)
+    node_id_to_community_map, parent_mapping = compute_communities(
+        graph, max_cluster_size, use_lcc, seed
     )
 
     levels = sorted(node_id_to_community_map.keys())
@@ -53,14 +67,34 @@ def cluster_graph(
     return results
 
 
+def load_backend(backend: ClusterGraphBackendType) -> ClusteringBackend:
+    """Load the clustering function for the given backend."""
+    match backend:
+        case ClusterGraphBackendType.Graspologic:
+            return _compute_leiden_communities
+        case ClusterGraphBackendType.EdgeList:
+            return _compute_edge_list_leiden_communities
+        case _:
+            msg = f"Unknown clustering backend: {backend}"
+            raise ValueError(msg)
+
+
 # Taken from graph_intelligence & adapted
 def _compute_leiden_communities(
-    graph: nx.Graph | nx.DiGraph,
+    graph: nx.Graph | CompactGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
 ) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
-    """Return Leiden root communities and their hierarchy mapping."""
+    """Return Leiden root communities and their hierarchy mapping.
+
+    A compact graph is reduced to its largest connected component before it is converted to networkx.
+    """
+    if isinstance(graph, CompactGraph):
+        if use_lcc:
+            graph = graph.largest_connected_component()
+        graph = graph.to_networkx()
+
     if use_lcc:
         graph = stable_largest_connected_component(graph)
 
@@ -78,3 +112,68 @@ def _compute_leiden_communities(
         )
 
     return results, hierarchy
+
+
+def _compute_edge_list_leiden_communities(
+    graph: nx.Graph | CompactGraph,
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
+    """Return Leiden root communities and their hierarchy mapping, running the native Leiden on an integer edge list.
+
+    The edges are passed in the order the graspologic backend reads them from networkx, so both backends find the same communities.
+    """
+    if isinstance(graph, nx.Graph):
+        graph = CompactGraph.from_networkx(graph)
+    if use_lcc:
+        graph = stable_compact_largest_connected_component(graph)
+    graph = _networkx_edge_order(graph)
+
+    node_ids = np.arange(graph.num_nodes).astype(str)
+    edges = list(
+        zip(
+            node_ids[graph.sources].tolist(),
+            node_ids[graph.targets].tolist(),
+            graph.weights.astype(float).tolist(),
+            strict=True,
+        )
+    )
+    community_mapping = gn.hierarchical_leiden(
+        edges=edges,
+        starting_communities=None,
+        resolution=1.0,
+        randomness=0.001,
+        iterations=1,
+        use_modularity=True,
+        max_cluster_size=max_cluster_size,
+        seed=seed,
+    )
+    labels = graph.nodes
+    results: dict[int, dict[str, int]] = {}
+    hierarchy: dict[int, int] = {}
+    for partition in community_mapping:
+        results.setdefault(partition.level, {})[labels[int(partition.node)]] = (
+            partition.cluster
+        )
+        hierarchy[partition.cluster] = (
+            partition.parent_cluster if partition.parent_cluster is not None else -1
+        )
+
+    return results, hierarchy
+
+
+def _networkx_edge_order(graph: CompactGraph) -> CompactGraph:
+    """Return the graph with its edges in the order and orientation a networkx graph built from it iterates them.
+
+    Networkx walks the nodes in order and yields the edges to every neighbor not walked yet, in the order they were added.
+    """
+    sources = np.minimum(graph.sources, graph.targets)
+    targets = np.maximum(graph.sources, graph.targets)
+    order = np.argsort(sources, kind="stable")
+    return CompactGraph(
+        nodes=graph.nodes,
+        sources=sources[order],
+        targets=targets[order],
+        weights=graph.weights[order],
+    )
@@ -6,9 +6,13 @@
 import networkx as nx
 import pandas as pd
 
+from graphrag.index.utils.compact_graph import CompactGraph
 
-def compute_degree(graph: nx.Graph) -> pd.DataFrame:
+
+def compute_degree(graph: nx.Graph | CompactGraph) -> pd.DataFrame:
     """Create a new DataFrame with the degree of each node in the graph."""
+    if isinstance(graph, CompactGraph):
+        return pd.DataFrame({"title": graph.nodes, "degree": graph.degree()})
     return pd.DataFrame([
         {"title": node, "degree": int(degree)}
         for node, degree in graph.degree  # type: ignore
@@ -5,20 +5,28 @@
 
 import networkx as nx
 
+from graphrag.config.enums import EmbedGraphBackendType
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
-from graphrag.index.operations.embed_graph.embed_node2vec import embed_node2vec
+from graphrag.index.operations.embed_graph.embed_node2vec import (
+    embed_node2vec,
+    embed_node2vec_parallel,
+)
 from graphrag.index.operations.embed_graph.typing import (
     NodeEmbeddings,
 )
-from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.index.utils.compact_graph import CompactGraph
+from graphrag.index.utils.stable_lcc import (
+    stable_compact_largest_connected_component,
+    stable_largest_connected_component,
+)
 
 
 def embed_graph(
-    graph: nx.Graph,
+    graph: nx.Graph | CompactGraph,
     config: EmbedGraphConfig,
 ) -> NodeEmbeddings:
     """
-    Embed a graph into a vector space using node2vec. The graph is expected to be in nx.Graph format. The operation outputs a mapping between node name and vector.
+    Embed a graph into a vector space using node2vec. The graph is expected to be in nx.Graph or CompactGraph format. The operation outputs a mapping between node name and vector.
 
     ## Usage
     ```yaml
@@ -28,21 +36,50 @@ def embed_graph(
     window_size: 2 # Optional, The window size to use for the embedding, default: 2
     iterations: 3 # Optional, The number of iterations to use for the embedding, default: 3
     random_seed: 86 # Optional, The random seed to use for the embedding, default: 86
+    backend: graspologic # Optional, The node2vec backend, graspologic or parallel, default: graspologic
+    workers: 8 # Optional, The number of workers of the parallel backend, default: the number of CPUs
+    node_sample_rate: 1.0 # Optional, The fraction of nodes starting walks in the parallel backend, default: 1.0
     ```
     """
-    if config.use_lcc:
-        graph = stable_largest_connected_component(graph)
-
-    # create graph embedding using node2vec
-    embeddings = embed_node2vec(
-        graph=graph,
-        dimensions=config.dimensions,
-        num_walks=config.num_walks,
-        walk_length=config.walk_length,
-        window_size=config.window_size,
-        iterations=config.iterations,
-        random_seed=config.random_seed,
-    )
+    match config.backend:
+        case EmbedGraphBackendType.Graspologic:
+            if isinstance(graph, CompactGraph):
+                if config.use_lcc:
+                    graph = graph.largest_connected_component()
+                graph = graph.to_networkx()
+            if config.use_lcc:
+                graph = stable_largest_connected_component(graph)
+
+            # create graph embedding using node2vec
+            embeddings = embed_node2vec(
+                graph=graph,
+                dimensions=config.dimensions,
+                num_walks=config.num_walks,
+                walk_length=config.walk_length,
+                window_size=config.window_size,
+                iterations=config.iterations,
+                random_seed=config.random_seed,
+            )
+        case EmbedGraphBackendType.Parallel:
+            if isinstance(graph, nx.Graph):
+                graph = CompactGraph.from_networkx(graph)
+            if config.use_lcc:
+                graph = stable_compact_largest_connected_component(graph)
+
+            embeddings = embed_node2vec_parallel(
+                graph=graph,
+                dimensions=config.dimensions,
+                num_walks=config.num_walks,
+                walk_length=config.walk_length,
+                window_size=config.window_size,
+                iterations=config.iterations,
+                random_seed=config.random_seed,
+                workers=config.workers,
+                node_sample_rate=config.node_sample_rate,
+            )
+        case _:
+            msg = f"Unknown graph embedding backend: {config.backend}"
+            raise ValueError(msg)
 
     pairs = zip(embeddings.nodes, embeddings.embeddings.tolist(), strict=True)
     sorted_pairs = sorted(pairs, key=lambda x: x[0])
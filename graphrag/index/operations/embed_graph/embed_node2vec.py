@@ -3,10 +3,20 @@
 
 """Utilities to generate graph embeddings."""
 
+import math
+import os
+import tempfile
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 
 import networkx as nx
 import numpy as np
+from gensim.models import Word2Vec
+
+from graphrag.index.utils.compact_graph import CompactGraph
 
 
 @dataclass
@@ -41,3 +51,163 @@ def embed_node2vec(
         random_seed=random_seed,
     )
     return NodeEmbeddings(embeddings=lcc_tensors[0], nodes=lcc_tensors[1])
+
+
+def embed_node2vec_parallel(
+    graph: CompactGraph,
+    dimensions: int = 1536,
+    num_walks: int = 10,
+    walk_length: int = 40,
+    window_size: int = 2,
+    iterations: int = 3,
+    random_seed: int = 86,
+    workers: int | None = None,
+    node_sample_rate: float = 1.0,
+    walk_batch_size: int = 10_000,
+) -> NodeEmbeddings:
+    """Generate node embeddings using Node2Vec, simulating walks in worker processes on the adjacency arrays.
+
+    The walks are weighted first-order random walks, which is what node2vec walks are with return and in-out hyperparameters
+    of 1, and their lengths are interpolated by node degree like graspologic does. Batches of walks are streamed to a
+    temporary corpus file, so memory is bounded by the batches in flight, and skip-gram is trained on that file with
+    `workers` threads. Nodes that no walk visits, such as isolated nodes, get no embedding.
+    """
+    if not 0 < node_sample_rate <= 1:
+        msg = f"node_sample_rate must be in (0, 1], got {node_sample_rate}"
+        raise ValueError(msg)
+    workers = workers or os.cpu_count() or 1
+
+    csr = graph.to_csr()
+    weights = np.asarray(csr.data, dtype=float)
+    walk_graph = _WalkGraph(
+        indptr=np.asarray(csr.indptr, dtype=np.int64),
+        indices=np.asarray(csr.indices, dtype=np.int64),
+        cumulative_weights=np.concatenate([[0.0], np.cumsum(weights)]),
+        walk_lengths=_walk_lengths(graph.degree(), walk_length),
+    )
+
+    rng = np.random.default_rng(random_seed)
+    batches: list[tuple[np.ndarray, int]] = []
+    num_starts = math.ceil(graph.num_nodes * node_sample_rate)
+    for _ in range(num_walks):
+        starts = rng.permutation(graph.num_nodes)[:num_starts]
+        batches.extend(
+            (starts[offset : offset + walk_batch_size], int(rng.integers(2**63)))
+            for offset in range(0, num_starts, walk_batch_size)
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus_file = Path(directory) / "walks.txt"
+        with corpus_file.open("w", encoding="utf-8") as file:
+            for walks in _simulate_walks(walk_graph, batches, workers):
+                file.write(walks)
+
+        model = Word2Vec(
+            corpus_file=str(corpus_file),
+            vector_size=dimensions,
+            window=window_size,
+            min_count=0,
+            sg=1,
+            workers=workers,
+            epochs=iterations,
+            seed=random_seed,
+        )
+
+    nodes = [
+        node for node in range(graph.num_nodes) if str(node) in model.wv.key_to_index
+    ]
+    return NodeEmbeddings(
+        embeddings=model.wv[[str(node) for node in nodes]],
+        nodes=graph.nodes[nodes].tolist(),
+    )
+
+
+@dataclass
+class _WalkGraph:
+    """The adjacency arrays random walks are simulated on."""
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    cumulative_weights: np.ndarray
+    """Cumulative sum of the edge weights in CSR order, starting with 0."""
+    walk_lengths: np.ndarray
+    """Length of the walks starting from every node."""
+
+
+def _walk_lengths(degrees: np.ndarray, walk_length: int) -> np.ndarray:
+    """Return the length of the walks from every node, interpolated by node degree like graspologic does.
+
+    Nodes under the 20th degree percentile get walks of length 1, nodes above the 80th get the full walk length, and the
+    rest get 20% to 80% of it by degree decile.
+    """
+    percentiles = np.percentile(degrees, list(range(20, 90, 10)))
+    bucket = np.searchsorted(percentiles, degrees, side="left")
+    fractions = np.append(np.arange(len(percentiles)) * 0.1 + 0.2, 1.0)
+    lengths = np.maximum(np.floor(walk_length * fractions[bucket]), 1)
+    lengths[(degrees < percentiles[0]) | (degrees == 0)] = 1
+    return lengths.astype(np.int64)
+
+
+def _simulate_walks(
+    graph: _WalkGraph, batches: list[tuple[np.ndarray, int]], workers: int
+) -> Iterator[str]:
+    """Simulate the batches of walks, yielding the lines of every batch in order."""
+    if workers == 1:
+        for starts, seed in batches:
+            yield _walk_batch(graph, starts, seed)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(graph,)
+    ) as executor:
+        # keep a bounded number of batches in flight so the walks never all sit in memory
+        pending: deque[Future[str]] = deque()
+        for starts, seed in batches:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(executor.submit(_walk_batch_in_worker, starts, seed))
+        while pending:
+            yield pending.popleft().result()
+
+
+_worker_graph: _WalkGraph | None = None
+
+
+def _init_worker(graph: _WalkGraph) -> None:
+    """Keep the walk graph in a worker process, so it is sent once rather than with every batch."""
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _walk_batch_in_worker(starts: np.ndarray, seed: int) -> str:
+    """Simulate a batch of walks on the walk graph of the worker process."""
+    if _worker_graph is None:
+        msg = "The walk graph of the worker process is not initialized"
+        raise RuntimeError(msg)
+    return _walk_batch(_worker_graph, starts, seed)
+
+
+def _walk_batch(graph: _WalkGraph, starts: np.ndarray, seed: int) -> str:
+    """Simulate one walk from every start node, and return them as lines of space-separated node ids.
+
+    All walks advance together, each step drawing the next node of every walk in proportion to its edge weights.
+    """
+    rng = np.random.default_rng(seed)
+    lengths = graph.walk_lengths[starts]
+    walks = np.zeros((len(starts), int(lengths.max(initial=1))), dtype=np.int64)
+    walks[:, 0] = starts
+    for step in range(1, walks.shape[1]):
+        active = np.flatnonzero(lengths > step)
+        current = walks[active, step - 1]
+        first, last = graph.indptr[current], graph.indptr[current + 1]
+        low = graph.cumulative_weights[first]
+        high = graph.cumulative_weights[last]
+        draws = low + rng.random(len(active)) * (high - low)
+        positions = np.searchsorted(graph.cumulative_weights, draws, side="right") - 1
+        walks[active, step] = graph.indices[np.clip(positions, first, last - 1)]
+
+    tokens = walks.astype(str)
+    return "".join(
+        " ".join(row[:length]) + "\n"
+        for row, length in zip(tokens.tolist(), lengths.tolist(), strict=True)
+    )
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the EmbeddingBatcher class definition."""
+
+import asyncio
+from dataclasses import dataclass
+
+import numpy as np
+
+from graphrag.language_model.protocol.base import EmbeddingModel
+from graphrag.logger.progress import ProgressTicker
+
+
+@dataclass
+class _Snippet:
+    model: EmbeddingModel
+    text: str
+    num_tokens: int
+    result: asyncio.Future
+    tick: ProgressTicker
+
+
+class EmbeddingBatcher:
+    """Embed the snippets of concurrent embedding calls in shared batches, under one concurrency budget.
+
+    Snippets submitted in the same event loop iteration are packed together, so the partial batches of several calls are
+    sent as one request. Every call gets the embeddings of its own snippets back, in order.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 16,
+        batch_max_tokens: int = 8191,
+        num_threads: int = 4,
+    ):
+        self._batch_size = batch_size
+        self._batch_max_tokens = batch_max_tokens
+        self._semaphore = asyncio.Semaphore(num_threads)
+        self._pending: list[_Snippet] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def embed(
+        self,
+        model: EmbeddingModel,
+        snippets: list[str],
+        num_tokens: list[int],
+        tick: ProgressTicker,
+    ) -> list[list[float]]:
+        """Embed snippets with the model, ticking once per embedded snippet."""
+        if not snippets:
+            return []
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+        submitted = [
+            _Snippet(model, text, tokens, loop.create_future(), tick)
+            for text, tokens in zip(snippets, num_tokens, strict=True)
+        ]
+        self._pending.extend(submitted)
+        return list(await asyncio.gather(*(snippet.result for snippet in submitted)))
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, []
+        for batch in self._create_batches(pending):
+            task = asyncio.create_task(self._embed_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _create_batches(self, snippets: list[_Snippet]) -> list[list[_Snippet]]:
+        """Split snippets into batches of at most `batch_size` snippets and `batch_max_tokens` tokens, one model each."""
+        # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
+        # According to this embeddings reference, Azure limits us to 16 concurrent embeddings and 8191 tokens per request
+        result = []
+        current_batch: list[_Snippet] = []
+        current_batch_tokens = 0
+
+        for snippet in snippets:
+            if current_batch and (
+                len(current_batch) >= self._batch_size
+                or current_batch_tokens + snippet.num_tokens > self._batch_max_tokens
+                or snippet.model is not current_batch[0].model
+            ):
+                result.append(current_batch)
+                current_batch = []
+                current_batch_tokens = 0
+
+            current_batch.append(snippet)
+            current_batch_tokens += snippet.num_tokens
+
+        if len(current_batch) > 0:
+            result.append(current_batch)
+
+        return result
+
+    async def _embed_batch(self, batch: list[_Snippet]) -> None:
+        async with self._semaphore:
+            try:
+                embeddings = await batch[0].model.aembed_batch([
+                    snippet.text for snippet in batch
+                ])
+            except Exception as e:  # noqa: BLE001
+                for snippet in batch:
+                    if not snippet.result.done():
+                        snippet.result.set_exception(e)
+                return
+
+        for snippet, embedding in zip(batch, embeddings, strict=True):
+            if not snippet.result.done():
+                snippet.result.set_result(np.array(embedding))
+            snippet.tick(1)
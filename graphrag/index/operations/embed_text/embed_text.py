@@ -3,6 +3,8 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
+import contextlib
 import logging
 from enum import Enum
 from typing import Any
@@ -23,6 +25,9 @@ logger = logging.getLogger(__name__)
 # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
 DEFAULT_EMBEDDING_BATCH_SIZE = 500
 
+# Number of embedded batches that may wait for the vector store before embedding pauses
+UPLOAD_QUEUE_SIZE = 2
+
 
 class TextEmbedStrategyType(str, Enum):
     """TextEmbedStrategyType class definition."""
@@ -129,55 +134,72 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {input.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in input[embed_column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
-
-    i = 0
-    starting_index = 0
-
     all_results = []
-
     num_total_batches = (input.shape[0] + insert_batch_size - 1) // insert_batch_size
-    while insert_batch_size * i < input.shape[0]:
-        logger.info(
-            "uploading text embeddings batch %d/%d of size %d to vector store",
-            i + 1,
-            num_total_batches,
-            insert_batch_size,
-        )
-        batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
-        texts: list[str] = batch[embed_column].to_numpy().tolist()
-        titles: list[str] = batch[title].to_numpy().tolist()
-        ids: list[str] = batch[id_column].to_numpy().tolist()
-        result = await strategy_exec(texts, callbacks, cache, strategy_config)
-        if result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
-
-        vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for doc_id, doc_text, doc_title, doc_vector in zip(
-            ids, texts, titles, vectors, strict=True
-        ):
-            if type(doc_vector) is np.ndarray:
-                doc_vector = doc_vector.tolist()
-            document = VectorStoreDocument(
-                id=doc_id,
-                text=doc_text,
-                vector=doc_vector,
-                attributes={"title": doc_title},
-            )
-            documents.append(document)
+    # embedded batches waiting to be written, so that embedding runs ahead of the vector store by a bounded amount
+    uploads: asyncio.Queue[tuple[int, list[VectorStoreDocument]] | None] = (
+        asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+    )
 
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+    async def embed_batches() -> None:
+        try:
+            for i in range(num_total_batches):
+                batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
+                texts: list[str] = batch[embed_column].to_numpy().tolist()
+                titles: list[str] = batch[title].to_numpy().tolist()
+                ids: list[str] = batch[id_column].to_numpy().tolist()
+                result = await strategy_exec(texts, callbacks, cache, strategy_config)
+                if result.embeddings:
+                    embeddings = [
+                        embedding
+                        for embedding in result.embeddings
+                        if embedding is not None
+                    ]
+                    all_results.extend(embeddings)
+
+                vectors = result.embeddings or []
+                documents: list[VectorStoreDocument] = []
+                for doc_id, doc_text, doc_title, doc_vector in zip(
+                    ids, texts, titles, vectors, strict=True
+                ):
+                    if type(doc_vector) is np.ndarray:
+                        doc_vector = doc_vector.tolist()
+                    document = VectorStoreDocument(
+                        id=doc_id,
+                        text=doc_text,
+                        vector=doc_vector,
+                        attributes={"title": doc_title},
+                    )
+                    documents.append(document)
+
+                await uploads.put((i, documents))
+        except Exception:
+            await uploads.put(None)
+            raise
+        await uploads.put(None)
+
+    # batches are embedded while the previous ones are written to the vector store off the event loop
+    embedding = asyncio.create_task(embed_batches())
+    try:
+        while (upload := await uploads.get()) is not None:
+            i, documents = upload
+            logger.info(
+                "uploading text embeddings batch %d/%d of size %d to vector store",
+                i + 1,
+                num_total_batches,
+                len(documents),
+            )
+            await asyncio.to_thread(
+                vector_store.load_documents, documents, overwrite and i == 0
+            )
+    except BaseException:
+        # stop embedding the remaining batches, and wait for the producer so it is not left pending
+        embedding.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await embedding
+        raise
+    await embedding
+    await asyncio.to_thread(vector_store.create_index)
 
     return all_results
 
@@ -3,7 +3,6 @@
 
 """A module containing run method definition."""
 
-import asyncio
 import logging
 from typing import Any
 
@@ -12,12 +11,12 @@ import numpy as np
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.operations.embed_text.batcher import EmbeddingBatcher
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
 from graphrag.index.text_splitting.text_splitting import TokenTextSplitter
 from graphrag.index.utils.is_null import is_null
 from graphrag.language_model.manager import ModelManager
-from graphrag.language_model.protocol.base import EmbeddingModel
-from graphrag.logger.progress import ProgressTicker, progress_ticker
+from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
 
@@ -44,32 +43,32 @@ async def run(
         callbacks=callbacks,
         cache=cache,
     )
-    semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
+    # calls given a shared batcher pack their snippets into the same batches and share its concurrency budget
+    batcher: EmbeddingBatcher = args.get("batcher") or EmbeddingBatcher(
+        batch_size=batch_size,
+        batch_max_tokens=batch_max_tokens,
+        num_threads=args.get("num_threads", 4),
+    )
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
-    text_batches = _create_text_batches(
-        texts,
-        batch_size,
-        batch_max_tokens,
-        splitter,
-    )
     logger.info(
-        "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, batch_max_tokens=%d",
+        "embedding %d inputs via %d snippets. max_batch_size=%d, batch_max_tokens=%d",
         len(input),
         len(texts),
-        len(text_batches),
         batch_size,
         batch_max_tokens,
     )
     ticker = progress_ticker(
         callbacks.progress,
-        len(text_batches),
+        len(texts),
         description="generate embeddings progress: ",
     )
 
-    # Embed each chunk of snippets
-    embeddings = await _execute(model, text_batches, ticker, semaphore)
+    # Embed the snippets in batches
+    embeddings = await batcher.embed(
+        model, texts, [splitter.num_tokens(text) for text in texts], ticker
+    )
     embeddings = _reconstitute_embeddings(embeddings, input_sizes)
 
     return TextEmbeddingResult(embeddings=embeddings)
@@ -84,57 +83,6 @@ def _get_splitter(
     )
 
 
-async def _execute(
-    model: EmbeddingModel,
-    chunks: list[list[str]],
-    tick: ProgressTicker,
-    semaphore: asyncio.Semaphore,
-) -> list[list[float]]:
-    async def embed(chunk: list[str]):
-        async with semaphore:
-            chunk_embeddings = await model.aembed_batch(chunk)
-            result = np.array(chunk_embeddings)
-            tick(1)
-        return result
-
-    futures = [embed(chunk) for chunk in chunks]
-    results = await asyncio.gather(*futures)
-    # merge results in a single list of lists (reduce the collect dimension)
-    return [item for sublist in results for item in sublist]
-
-
-def _create_text_batches(
-    texts: list[str],
-    max_batch_size: int,
-    max_batch_tokens: int,
-    splitter: TokenTextSplitter,
-) -> list[list[str]]:
-    """Create batches of texts to embed."""
-    # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
-    # According to this embeddings reference, Azure limits us to 16 concurrent embeddings and 8191 tokens per request
-    result = []
-    current_batch = []
-    current_batch_tokens = 0
-
-    for text in texts:
-        token_count = splitter.num_tokens(text)
-        if (
-            len(current_batch) >= max_batch_size
-            or current_batch_tokens + token_count > max_batch_tokens
-        ):
-            result.append(current_batch)
-            current_batch = []
-            current_batch_tokens = 0
-
-        current_batch.append(text)
-        current_batch_tokens += token_count
-
-    if len(current_batch) > 0:
-        result.append(current_batch)
-
-    return result
-
-
 def _prepare_embed_texts(
     input: list[str], splitter: TokenTextSplitter
 ) -> tuple[list[str], list[int]]:
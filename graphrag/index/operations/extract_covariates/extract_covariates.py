@@ -21,6 +21,7 @@ from graphrag.index.operations.extract_covariates.typing import (
     CovariateExtractionResult,
 )
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.language_model.manager import ModelManager
 
 logger = logging.getLogger(__name__)
@@ -39,8 +40,13 @@ async def extract_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    checkpoint: RowCheckpoint | None = None,
+    checkpoint_key: str = "id",
 ):
-    """Extract claims from a piece of text."""
+    """Extract claims from a piece of text.
+
+    If a checkpoint is provided, the claims of completed rows are checkpointed by `checkpoint_key` and skipped when resuming.
+    """
     logger.debug("extract_covariates strategy=%s", strategy)
     if entity_types is None:
         entity_types = DEFAULT_ENTITY_TYPES
@@ -60,10 +66,10 @@ async def extract_covariates(
             cache=cache,
             strategy_config=strategy_config,
         )
-        return [
-            create_row_from_claim_data(row, item, covariate_type)
-            for item in result.covariate_data
-        ]
+        if result.failed_documents:
+            # a failed row is left out of the checkpoint, so it is extracted again on resume
+            return None
+        return [asdict(item) for item in result.covariate_data]
 
     results = await derive_from_rows(
         input,
@@ -72,8 +78,14 @@ async def extract_covariates(
         async_type=async_mode,
         num_threads=num_threads,
         progress_msg="extract covariates progress: ",
+        checkpoint=checkpoint,
+        checkpoint_key=checkpoint_key,
     )
-    return pd.DataFrame([item for row in results for item in row or []])
+    return pd.DataFrame([
+        create_row_from_claim_data(row, Covariate(**item), covariate_type)
+        for (_, row), items in zip(input.iterrows(), results, strict=True)
+        for item in items or []
+    ])
 
 
 def create_row_from_claim_data(row, covariate_data: Covariate, covariate_type: str):
@@ -121,7 +133,7 @@ async def run_extract_claims(
         msg = "claim_description is required for claim extraction"
         raise ValueError(msg)
 
-    input = [input] if isinstance(input, str) else input
+    input = [input] if isinstance(input, str) else list(input)
 
     results = await extractor({
         "input_text": input,
@@ -134,7 +146,14 @@ async def run_extract_claims(
     })
 
     claim_data = results.output
-    return CovariateExtractionResult([create_covariate(item) for item in claim_data])
+    return CovariateExtractionResult(
+        [create_covariate(item) for item in claim_data],
+        failed_documents=[
+            doc_index
+            for doc_index in range(len(input))
+            if f"d{doc_index}" not in results.source_docs
+        ],
+    )
 
 
 def create_covariate(item: dict[str, Any]) -> Covariate:
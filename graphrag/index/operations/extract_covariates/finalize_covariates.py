@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""All the steps to transform final covariates."""
+
+from typing import Any
+from uuid import uuid4
+
+import pandas as pd
+
+from graphrag.data_model.schemas import COVARIATES_FINAL_COLUMNS
+
+
+def finalize_covariates(covariates: pd.DataFrame) -> pd.DataFrame:
+    """All the steps to transform final covariates."""
+    covariates["id"] = covariates["covariate_type"].apply(lambda _x: str(uuid4()))
+    covariates["human_readable_id"] = covariates.index
+
+    return covariates.loc[:, COVARIATES_FINAL_COLUMNS]
+
+
+def create_claim_covariates(
+    claims: list[dict[str, Any]], covariate_type: str = "claim"
+) -> pd.DataFrame:
+    """Create the covariates table from claims extracted alongside the graph, which carry their text unit id as source_id."""
+    covariates = pd.DataFrame.from_records(
+        claims,
+        columns=[
+            "subject_id",
+            "object_id",
+            "type",
+            "status",
+            "start_date",
+            "end_date",
+            "description",
+            "source_text",
+            "source_id",
+        ],
+    ).rename(columns={"source_id": "text_unit_id"})
+    covariates["covariate_type"] = covariate_type
+    return finalize_covariates(covariates)
@@ -4,7 +4,7 @@
 """A module containing 'Covariate' and 'CovariateExtractionResult' models."""
 
 from collections.abc import Awaitable, Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from graphrag.cache.pipeline_cache import PipelineCache
@@ -34,6 +34,8 @@ class CovariateExtractionResult:
     """Covariate extraction result class definition."""
 
     covariate_data: list[Covariate]
+    failed_documents: list[int] = field(default_factory=list)
+    """Indexes of the input texts whose extraction failed, which are not checkpointed so that they are retried on resume."""
 
 
 CovariateExtractStrategy = Callable[
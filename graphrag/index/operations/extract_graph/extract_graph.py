@@ -17,6 +17,7 @@ from graphrag.index.operations.extract_graph.typing import (
     ExtractEntityStrategyType,
 )
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +35,16 @@ async def extract_graph(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types=DEFAULT_ENTITY_TYPES,
     num_threads: int = 4,
+    stats: dict[str, float] | None = None,
+    checkpoint: RowCheckpoint | None = None,
+    claims: list[dict[str, Any]] | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Extract a graph from a piece of text using a language model."""
+    """Extract a graph from a piece of text using a language model.
+
+    If a stats dict is provided, per-round extraction yield statistics are recorded into it.
+    If a claims list is provided, claims extracted alongside the graph are appended to it, with source_id set to the text unit id.
+    If a checkpoint is provided, completed text units are checkpointed by id and skipped when resuming.
+    """
     logger.debug("entity_extract strategy=%s", strategy)
     if entity_types is None:
         entity_types = DEFAULT_ENTITY_TYPES
@@ -58,7 +67,15 @@ async def extract_graph(
             strategy_config,
         )
         num_started += 1
-        return [result.entities, result.relationships, result.graph]
+        if result.failed_documents:
+            # a failed text unit is left out of the checkpoint, so it is extracted again on resume
+            return None
+        return {
+            "entities": result.entities,
+            "relationships": result.relationships,
+            "round_yields": result.round_yields,
+            "claims": result.claims,
+        }
 
     results = await derive_from_rows(
         text_units,
@@ -67,17 +84,29 @@ async def extract_graph(
         async_type=async_mode,
         num_threads=num_threads,
         progress_msg="extract graph progress: ",
+        checkpoint=checkpoint,
+        checkpoint_key=id_column,
     )
 
-    entity_dfs = []
-    relationship_dfs = []
+    # collect the records of every text unit first, so we only build one frame per table
+    entity_records = []
+    relationship_records = []
+    round_yields = []
     for result in results:
         if result:
-            entity_dfs.append(pd.DataFrame(result[0]))
-            relationship_dfs.append(pd.DataFrame(result[1]))
+            entity_records.extend(_to_records(result["entities"]))
+            relationship_records.extend(_to_records(result["relationships"]))
+            round_yields.extend(result["round_yields"].values())
+            if claims is not None:
+                claims.extend(result["claims"])
+
+    entities = _merge_entities(entity_records)
+    relationships = _merge_relationships(relationship_records)
 
-    entities = _merge_entities(entity_dfs)
-    relationships = _merge_relationships(relationship_dfs)
+    round_stats = _summarize_round_yields(round_yields)
+    logger.info("extract graph round yields: %s", round_stats)
+    if stats is not None:
+        stats.update(round_stats)
 
     return (entities, relationships)
 
@@ -97,8 +126,36 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
-def _merge_entities(entity_dfs) -> pd.DataFrame:
-    all_entities = pd.concat(entity_dfs, ignore_index=True)
+def _summarize_round_yields(round_yields: list[list[int]]) -> dict[str, float]:
+    """Aggregate per-document extraction round yields into per-round totals."""
+    stats: dict[str, float] = {}
+    for yields in round_yields:
+        for round_index, new_entities in enumerate(yields):
+            prefix = (
+                "initial_extraction"
+                if round_index == 0
+                else f"gleaning_round_{round_index}"
+            )
+            stats[f"{prefix}_chunks"] = stats.get(f"{prefix}_chunks", 0) + 1
+            stats[f"{prefix}_new_entities"] = (
+                stats.get(f"{prefix}_new_entities", 0) + new_entities
+            )
+    return stats
+
+
+def _to_records(
+    records: pd.DataFrame | list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Accept the entities or relationships of a strategy as records, or as a frame as custom strategies may return."""
+    if isinstance(records, pd.DataFrame):
+        return records.to_dict("records")  # type: ignore
+    return records
+
+
+def _merge_entities(entity_records: list[dict[str, Any]]) -> pd.DataFrame:
+    all_entities = pd.DataFrame.from_records(
+        entity_records, columns=["title", "type", "description", "source_id"]
+    )
     return (
         all_entities.groupby(["title", "type"], sort=False)
         .agg(
@@ -110,8 +167,11 @@ def _merge_entities(entity_dfs) -> pd.DataFrame:
     )
 
 
-def _merge_relationships(relationship_dfs) -> pd.DataFrame:
-    all_relationships = pd.concat(relationship_dfs, ignore_index=False)
+def _merge_relationships(relationship_records: list[dict[str, Any]]) -> pd.DataFrame:
+    all_relationships = pd.DataFrame.from_records(
+        relationship_records,
+        columns=["source", "target", "weight", "description", "source_id"],
+    )
     return (
         all_relationships.groupby(["source", "target"], sort=False)
         .agg(
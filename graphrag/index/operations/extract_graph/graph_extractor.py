@@ -6,12 +6,9 @@
 import logging
 import re
 import traceback
-from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
-import networkx as nx
-
 from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.index.typing.error_handler import ErrorHandlerFn
 from graphrag.index.utils.string import clean_str
@@ -21,6 +18,7 @@ from graphrag.prompts.index.extract_graph import (
     GRAPH_EXTRACTION_PROMPT,
     LOOP_PROMPT,
 )
+from graphrag.prompts.index.extract_graph_claims import GRAPH_CLAIM_EXTRACTION_PROMPT
 
 DEFAULT_TUPLE_DELIMITER = "<|>"
 DEFAULT_RECORD_DELIMITER = "##"
@@ -34,8 +32,12 @@ logger = logging.getLogger(__name__)
 class GraphExtractionResult:
     """Unipartite graph extraction result class definition."""
 
-    output: nx.Graph
+    entities: list[dict[str, Any]]
+    relationships: list[dict[str, Any]]
     source_docs: dict[Any, Any]
+    round_yields: dict[int, list[int]] = field(default_factory=dict)
+    """Number of new entities found by each extraction round, keyed by document index. Index 0 is the initial extraction."""
+    claims: list[dict[str, Any]] = field(default_factory=list)
 
 
 class GraphExtractor:
@@ -53,6 +55,10 @@ class GraphExtractor:
     _extraction_prompt: str
     _summarization_prompt: str
     _max_gleanings: int
+    _adaptive_gleaning: bool
+    _min_gleaning_yield: int
+    _gleaning_min_density: float | None
+    _extract_claims: bool
     _on_error: ErrorHandlerFn
 
     def __init__(
@@ -66,6 +72,10 @@ class GraphExtractor:
         prompt: str | None = None,
         join_descriptions=True,
         max_gleanings: int | None = None,
+        adaptive_gleaning: bool | None = None,
+        min_gleaning_yield: int | None = None,
+        gleaning_min_density: float | None = None,
+        extract_claims: bool = False,
         on_error: ErrorHandlerFn | None = None,
     ):
         """Init method definition."""
@@ -79,12 +89,26 @@ class GraphExtractor:
             completion_delimiter_key or "completion_delimiter"
         )
         self._entity_types_key = entity_types_key or "entity_types"
-        self._extraction_prompt = prompt or GRAPH_EXTRACTION_PROMPT
+        self._extract_claims = extract_claims
+        self._extraction_prompt = prompt or (
+            GRAPH_CLAIM_EXTRACTION_PROMPT if extract_claims else GRAPH_EXTRACTION_PROMPT
+        )
         self._max_gleanings = (
             max_gleanings
             if max_gleanings is not None
             else graphrag_config_defaults.extract_graph.max_gleanings
         )
+        self._adaptive_gleaning = (
+            adaptive_gleaning
+            if adaptive_gleaning is not None
+            else graphrag_config_defaults.extract_graph.adaptive_gleaning
+        )
+        self._min_gleaning_yield = (
+            min_gleaning_yield
+            if min_gleaning_yield is not None
+            else graphrag_config_defaults.extract_graph.min_gleaning_yield
+        )
+        self._gleaning_min_density = gleaning_min_density
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
     async def __call__(
@@ -95,6 +119,7 @@ class GraphExtractor:
             prompt_variables = {}
         all_records: dict[int, str] = {}
         source_doc_map: dict[int, str] = {}
+        round_yields: dict[int, list[int]] = {}
 
         # Wire defaults into the prompt variables
         prompt_variables = {
@@ -115,9 +140,10 @@ class GraphExtractor:
         for doc_index, text in enumerate(texts):
             try:
                 # Invoke the entity extraction
-                result = await self._process_document(text, prompt_variables)
+                result, yields = await self._process_document(text, prompt_variables)
                 source_doc_map[doc_index] = text
                 all_records[doc_index] = result
+                round_yields[doc_index] = yields
             except Exception as e:
                 logger.exception("error extracting graph")
                 self._on_error(
@@ -129,20 +155,29 @@ class GraphExtractor:
                     },
                 )
 
-        output = await self._process_results(
+        entities, relationships, claims = await self._process_results(
             all_records,
             prompt_variables.get(self._tuple_delimiter_key, DEFAULT_TUPLE_DELIMITER),
             prompt_variables.get(self._record_delimiter_key, DEFAULT_RECORD_DELIMITER),
+            prompt_variables.get(
+                self._completion_delimiter_key, DEFAULT_COMPLETION_DELIMITER
+            ),
         )
 
         return GraphExtractionResult(
-            output=output,
+            entities=entities,
+            relationships=relationships,
             source_docs=source_doc_map,
+            round_yields=round_yields,
+            claims=claims,
         )
 
     async def _process_document(
         self, text: str, prompt_variables: dict[str, str]
-    ) -> str:
+    ) -> tuple[str, list[int]]:
+        tuple_delimiter = prompt_variables[self._tuple_delimiter_key]
+        record_delimiter = prompt_variables[self._record_delimiter_key]
+
         response = await self._model.achat(
             self._extraction_prompt.format(**{
                 **prompt_variables,
@@ -150,48 +185,92 @@ class GraphExtractor:
             }),
         )
         results = response.output.content or ""
+        known_entities = _extract_entity_names(
+            results, tuple_delimiter, record_delimiter
+        )
+        yields = [len(known_entities)]
+
+        if self._max_gleanings <= 0 or not self._should_glean(
+            text, len(known_entities)
+        ):
+            return results, yields
 
         # if gleanings are specified, enter a loop to extract more entities
-        # there are two exit criteria: (a) we hit the configured max, (b) the model says there are no more entities
-        if self._max_gleanings > 0:
-            for i in range(self._max_gleanings):
-                response = await self._model.achat(
-                    CONTINUE_PROMPT,
-                    name=f"extract-continuation-{i}",
-                    history=response.history,
-                )
-                results += response.output.content or ""
+        # in standard mode there are two exit criteria: (a) we hit the configured max, (b) the model says there are no more entities
+        # in adaptive mode the loop check is skipped, and we stop as soon as a round yields too few new entities
+        for i in range(self._max_gleanings):
+            response = await self._model.achat(
+                CONTINUE_PROMPT,
+                name=f"extract-continuation-{i}",
+                history=response.history,
+            )
+            gleaning = response.output.content or ""
+            results += gleaning
 
-                # if this is the final glean, don't bother updating the continuation flag
-                if i >= self._max_gleanings - 1:
-                    break
+            entities = _extract_entity_names(
+                gleaning, tuple_delimiter, record_delimiter
+            )
+            new_entities = entities - known_entities
+            known_entities |= new_entities
+            yields.append(len(new_entities))
 
-                response = await self._model.achat(
-                    LOOP_PROMPT,
-                    name=f"extract-loopcheck-{i}",
-                    history=response.history,
-                )
-                if response.output.content != "Y":
+            # if this is the final glean, don't bother updating the continuation flag
+            if i >= self._max_gleanings - 1:
+                break
+
+            if self._adaptive_gleaning:
+                if len(new_entities) < self._min_gleaning_yield:
                     break
+                continue
+
+            response = await self._model.achat(
+                LOOP_PROMPT,
+                name=f"extract-loopcheck-{i}",
+                history=response.history,
+            )
+            if response.output.content != "Y":
+                break
+
+        return results, yields
 
-        return results
+    def _should_glean(self, text: str, num_entities: int) -> bool:
+        """Decide whether a chunk is dense enough in entities to be worth gleaning."""
+        if not self._adaptive_gleaning or self._gleaning_min_density is None:
+            return True
+        density = num_entities * 1000 / max(len(text), 1)
+        return density >= self._gleaning_min_density
 
     async def _process_results(
         self,
         results: dict[int, str],
         tuple_delimiter: str,
         record_delimiter: str,
-    ) -> nx.Graph:
-        """Parse the result string to create an undirected unipartite graph.
+        completion_delimiter: str = DEFAULT_COMPLETION_DELIMITER,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+        """Parse the result strings into merged entity and relationship records, and claim records.
+
+        Entities are keyed by name and relationships by their (undirected) pair of endpoints.
+        Records are emitted in the same order, and relationships with the same orientation, as an undirected networkx graph built from the results would produce.
 
         Args:
             - results - dict of results from the extraction chain
             - tuple_delimiter - delimiter between tuples in an output record, default is '<|>'
             - record_delimiter - delimiter between records, default is '##'
+            - completion_delimiter - delimiter ending the output, stripped from the final claim record, default is '<|COMPLETE|>'
         Returns:
-            - output - unipartite graph in graphML format
+            - entities - list of records with title, type, description and source_id
+            - relationships - list of records with source, target, weight, description and source_id
+            - claims - list of claim records with subject_id, object_id, type, status, start_date, end_date, description, source_text and source_id, only parsed when extracting claims
         """
-        graph = nx.Graph()
+        nodes: dict[str, _EntityRecord] = {}
+        edges: dict[tuple[str, str], _RelationshipRecord] = {}
+        claims: list[dict[str, Any]] = []
+
+        def add_node(name: str, source_id: str) -> _EntityRecord:
+            node = nodes[name] = _EntityRecord(index=len(nodes))
+            node.source_ids[source_id] = None
+            return node
+
         for source_doc_id, extracted_data in results.items():
             records = [r.strip() for r in extracted_data.split(record_delimiter)]
 
@@ -200,45 +279,23 @@ class GraphExtractor:
                 record_attributes = record.split(tuple_delimiter)
 
                 if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
-                    # add this record as a node in the G
                     entity_name = clean_str(record_attributes[1].upper())
                     entity_type = clean_str(record_attributes[2].upper())
                     entity_description = clean_str(record_attributes[3])
 
-                    if entity_name in graph.nodes():
-                        node = graph.nodes[entity_name]
-                        if self._join_descriptions:
-                            node["description"] = "\n".join(
-                                list({
-                                    *_unpack_descriptions(node),
-                                    entity_description,
-                                })
-                            )
-                        else:
-                            if len(entity_description) > len(node["description"]):
-                                node["description"] = entity_description
-                        node["source_id"] = ", ".join(
-                            list({
-                                *_unpack_source_ids(node),
-                                str(source_doc_id),
-                            })
-                        )
-                        node["type"] = (
-                            entity_type if entity_type != "" else node["type"]
-                        )
+                    node = nodes.get(entity_name)
+                    if node is None:
+                        node = add_node(entity_name, str(source_doc_id))
                     else:
-                        graph.add_node(
-                            entity_name,
-                            type=entity_type,
-                            description=entity_description,
-                            source_id=str(source_doc_id),
-                        )
+                        node.source_ids[str(source_doc_id)] = None
+                    if entity_type != "":
+                        node.type = entity_type
+                    node.add_description(entity_description, self._join_descriptions)
 
                 if (
                     record_attributes[0] == '"relationship"'
                     and len(record_attributes) >= 5
                 ):
-                    # add this record as edge
                     source = clean_str(record_attributes[1].upper())
                     target = clean_str(record_attributes[2].upper())
                     edge_description = clean_str(record_attributes[3])
@@ -248,53 +305,138 @@ class GraphExtractor:
                     except ValueError:
                         weight = 1.0
 
-                    if source not in graph.nodes():
-                        graph.add_node(
-                            source,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
+                    if source not in nodes:
+                        add_node(source, edge_source_id)
+                    if target not in nodes:
+                        add_node(target, edge_source_id)
+
+                    edge = edges.get((source, target)) or edges.get((target, source))
+                    if edge is None:
+                        edge = edges[source, target] = _RelationshipRecord(
+                            source_position=nodes[source].claim_neighbor(),
+                            target_position=nodes[target].claim_neighbor()
+                            if source != target
+                            else 0,
                         )
-                    if target not in graph.nodes():
-                        graph.add_node(
-                            target,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
+                    edge.weight += weight
+                    edge.source_ids[edge_source_id] = None
+                    if self._join_descriptions:
+                        edge.descriptions[edge_description] = None
+                    else:
+                        edge.descriptions = {edge_description: None}
+
+                if (
+                    self._extract_claims
+                    and record_attributes[0] == '"claim"'
+                    and len(record_attributes) >= 8
+                ):
+                    claim = re.sub(
+                        r"^\(|\)$",
+                        "",
+                        record.removesuffix(completion_delimiter).strip(),
+                    )
+                    claims.append(
+                        _parse_claim(
+                            claim.split(tuple_delimiter)[1:], str(source_doc_id)
                         )
-                    if graph.has_edge(source, target):
-                        edge_data = graph.get_edge_data(source, target)
-                        if edge_data is not None:
-                            weight += edge_data["weight"]
-                            if self._join_descriptions:
-                                edge_description = "\n".join(
-                                    list({
-                                        *_unpack_descriptions(edge_data),
-                                        edge_description,
-                                    })
-                                )
-                            edge_source_id = ", ".join(
-                                list({
-                                    *_unpack_source_ids(edge_data),
-                                    str(source_doc_id),
-                                })
-                            )
-                    graph.add_edge(
-                        source,
-                        target,
-                        weight=weight,
-                        description=edge_description,
-                        source_id=edge_source_id,
                     )
 
-        return graph
+        entities = [
+            {
+                "title": name,
+                "type": node.type,
+                "description": "\n".join(node.descriptions),
+                "source_id": ", ".join(node.source_ids),
+            }
+            for name, node in nodes.items()
+        ]
+
+        # networkx reports each undirected edge once, from the endpoint that was added first,
+        # in the order that edges were attached to that endpoint
+        relationships = []
+        for (source, target), edge in edges.items():
+            position = edge.source_position
+            if nodes[target].index < nodes[source].index:
+                source, target = target, source
+                position = edge.target_position
+            relationships.append((
+                (nodes[source].index, position),
+                {
+                    "source": source,
+                    "target": target,
+                    "weight": edge.weight,
+                    "description": "\n".join(edge.descriptions),
+                    "source_id": ", ".join(edge.source_ids),
+                },
+            ))
+        relationships.sort(key=lambda item: item[0])
+
+        return entities, [relationship for _, relationship in relationships], claims
 
 
-def _unpack_descriptions(data: Mapping) -> list[str]:
-    value = data.get("description", None)
-    return [] if value is None else value.split("\n")
+@dataclass
+class _EntityRecord:
+    """Accumulated attributes of an entity while parsing extraction results."""
+
+    index: int
+    type: str = ""
+    descriptions: dict[str, None] = field(default_factory=dict)
+    source_ids: dict[str, None] = field(default_factory=dict)
+    num_neighbors: int = 0
+
+    def add_description(self, description: str, join: bool) -> None:
+        """Merge a newly extracted description into the entity."""
+        if not description:
+            return
+        if join:
+            self.descriptions[description] = None
+        elif len(description) > sum(len(d) for d in self.descriptions):
+            self.descriptions = {description: None}
+
+    def claim_neighbor(self) -> int:
+        """Return the adjacency position for a new relationship attached to this entity."""
+        self.num_neighbors += 1
+        return self.num_neighbors - 1
 
 
-def _unpack_source_ids(data: Mapping) -> list[str]:
-    value = data.get("source_id", None)
-    return [] if value is None else value.split(", ")
+@dataclass
+class _RelationshipRecord:
+    """Accumulated attributes of a relationship while parsing extraction results."""
+
+    source_position: int
+    target_position: int
+    weight: float = 0.0
+    descriptions: dict[str, None] = field(default_factory=dict)
+    source_ids: dict[str, None] = field(default_factory=dict)
+
+
+def _parse_claim(claim_fields: list[str], source_id: str) -> dict[str, Any]:
+    """Create a claim record from the fields of a claim tuple, normalizing entity names like entity records."""
+
+    def pull_field(index: int) -> str | None:
+        return claim_fields[index].strip() if len(claim_fields) > index else None
+
+    return {
+        "subject_id": clean_str(claim_fields[0].upper()),
+        "object_id": clean_str(claim_fields[1].upper()),
+        "type": pull_field(2),
+        "status": pull_field(3),
+        "start_date": pull_field(4),
+        "end_date": pull_field(5),
+        "description": pull_field(6),
+        "source_text": pull_field(7),
+        "source_id": source_id,
+    }
+
+
+def _extract_entity_names(
+    output: str, tuple_delimiter: str, record_delimiter: str
+) -> set[str]:
+    """Collect the normalized entity names emitted in a raw extraction response."""
+    names = set()
+    for record in output.split(record_delimiter):
+        record = re.sub(r"^\(|\)$", "", record.strip())
+        record_attributes = record.split(tuple_delimiter)
+        if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
+            names.add(clean_str(record_attributes[1].upper()))
+    return names
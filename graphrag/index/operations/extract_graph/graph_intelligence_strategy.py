@@ -5,8 +5,6 @@
 
 import logging
 
-import networkx as nx
-
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.config.models.language_model_config import LanguageModelConfig
@@ -56,11 +54,28 @@ async def run_extract_graph(
     max_gleanings = args.get(
         "max_gleanings", graphrag_config_defaults.extract_graph.max_gleanings
     )
+    adaptive_gleaning = args.get(
+        "adaptive_gleaning", graphrag_config_defaults.extract_graph.adaptive_gleaning
+    )
+    min_gleaning_yield = args.get(
+        "min_gleaning_yield",
+        graphrag_config_defaults.extract_graph.min_gleaning_yield,
+    )
+    gleaning_min_density = args.get(
+        "gleaning_min_density",
+        graphrag_config_defaults.extract_graph.gleaning_min_density,
+    )
+    # claims are extracted in the same prompt when a claim description is configured
+    claim_description = args.get("claim_description", None)
 
     extractor = GraphExtractor(
         model_invoker=model,
         prompt=extraction_prompt,
         max_gleanings=max_gleanings,
+        adaptive_gleaning=adaptive_gleaning,
+        min_gleaning_yield=min_gleaning_yield,
+        gleaning_min_density=gleaning_min_density,
+        extract_claims=claim_description is not None,
         on_error=lambda e, s, d: logger.error(
             "Entity Extraction Error", exc_info=e, extra={"stack": s, "details": d}
         ),
@@ -74,29 +89,28 @@ async def run_extract_graph(
             "tuple_delimiter": tuple_delimiter,
             "record_delimiter": record_delimiter,
             "completion_delimiter": completion_delimiter,
+            "claim_description": claim_description,
         },
     )
 
-    graph = results.output
     # Map the "source_id" back to the "id" field
-    for _, node in graph.nodes(data=True):  # type: ignore
-        if node is not None:
-            node["source_id"] = ",".join(
-                docs[int(id)].id for id in node["source_id"].split(",")
-            )
-
-    for _, _, edge in graph.edges(data=True):  # type: ignore
-        if edge is not None:
-            edge["source_id"] = ",".join(
-                docs[int(id)].id for id in edge["source_id"].split(",")
-            )
-
-    entities = [
-        ({"title": item[0], **(item[1] or {})})
-        for item in graph.nodes(data=True)
-        if item is not None
-    ]
-
-    relationships = nx.to_pandas_edgelist(graph)
-
-    return EntityExtractionResult(entities, relationships, graph)
+    for record in [*results.entities, *results.relationships, *results.claims]:
+        record["source_id"] = ",".join(
+            docs[int(id)].id for id in record["source_id"].split(",")
+        )
+
+    round_yields = {
+        docs[doc_index].id: yields for doc_index, yields in results.round_yields.items()
+    }
+
+    return EntityExtractionResult(
+        results.entities,
+        results.relationships,
+        round_yields=round_yields,
+        claims=results.claims,
+        failed_documents=[
+            doc.id
+            for doc_index, doc in enumerate(docs)
+            if doc_index not in results.source_docs
+        ],
+    )
@@ -4,7 +4,7 @@
 """A module containing 'Document' and 'EntityExtractionResult' models."""
 
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -14,6 +14,7 @@ from graphrag.cache.pipeline_cache import PipelineCache
 
 ExtractedEntity = dict[str, Any]
 ExtractedRelationship = dict[str, Any]
+ExtractedClaim = dict[str, Any]
 StrategyConfig = dict[str, Any]
 EntityTypes = list[str]
 
@@ -32,7 +33,13 @@ class EntityExtractionResult:
 
     entities: list[ExtractedEntity]
     relationships: list[ExtractedRelationship]
-    graph: nx.Graph | None
+    graph: nx.Graph | None = None
+    round_yields: dict[str, list[int]] = field(default_factory=dict)
+    """New entities found by each extraction round, keyed by document id. Index 0 is the initial extraction."""
+    claims: list[ExtractedClaim] = field(default_factory=list)
+    """Claims extracted alongside the graph, when the strategy is configured to extract them."""
+    failed_documents: list[str] = field(default_factory=list)
+    """Ids of the documents whose extraction failed, which are not checkpointed so that they are retried on resume."""
 
 
 EntityExtractStrategy = Callable[
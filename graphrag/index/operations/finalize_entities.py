@@ -5,14 +5,17 @@
 
 from uuid import uuid4
 
+import networkx as nx
 import pandas as pd
 
+from graphrag.config.enums import EmbedGraphBackendType
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
+from graphrag.config.models.umap_config import UmapConfig
 from graphrag.data_model.schemas import ENTITIES_FINAL_COLUMNS
 from graphrag.index.operations.compute_degree import compute_degree
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.embed_graph.embed_graph import embed_graph
 from graphrag.index.operations.layout_graph.layout_graph import layout_graph
+from graphrag.index.utils.compact_graph import CompactGraph
 
 
 def finalize_entities(
@@ -20,19 +23,34 @@ def finalize_entities(
     relationships: pd.DataFrame,
     embed_config: EmbedGraphConfig | None = None,
     layout_enabled: bool = False,
+    layout_config: UmapConfig | None = None,
+    previous_positions: dict[str, tuple[float, float]] | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform final entities."""
-    graph = create_graph(relationships, edge_attr=["weight"])
+    graph = CompactGraph.from_dataframe(relationships)
+    embed_enabled = embed_config is not None and embed_config.enabled
+    networkx_embed = (
+        embed_config is not None
+        and embed_config.backend == EmbedGraphBackendType.Graspologic
+    )
+    # graspologic node2vec and umap need a networkx graph, but the parallel node2vec and the zero layout do not
+    if (embed_enabled and networkx_embed) or layout_enabled:
+        nx_graph = graph.to_networkx()
+    else:
+        nx_graph = nx.Graph()
+        nx_graph.add_nodes_from(graph.nodes.tolist())
     graph_embeddings = None
-    if embed_config is not None and embed_config.enabled:
+    if embed_config is not None and embed_enabled:
         graph_embeddings = embed_graph(
-            graph,
+            nx_graph if networkx_embed else graph,
             embed_config,
         )
     layout = layout_graph(
-        graph,
+        nx_graph,
         layout_enabled,
         embeddings=graph_embeddings,
+        config=layout_config,
+        previous_positions=previous_positions,
     )
     degrees = compute_degree(graph)
     final_entities = (
@@ -12,15 +12,14 @@ from graphrag.index.operations.compute_degree import compute_degree
 from graphrag.index.operations.compute_edge_combined_degree import (
     compute_edge_combined_degree,
 )
-from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.compact_graph import CompactGraph
 
 
 def finalize_relationships(
     relationships: pd.DataFrame,
 ) -> pd.DataFrame:
     """All the steps to transform final relationships."""
-    graph = create_graph(relationships, edge_attr=["weight"])
-    degrees = compute_degree(graph)
+    degrees = compute_degree(CompactGraph.from_dataframe(relationships))
 
     final_relationships = relationships.drop_duplicates(subset=["source", "target"])
     final_relationships["combined_degree"] = compute_edge_combined_degree(
@@ -8,6 +8,7 @@ import logging
 import networkx as nx
 import pandas as pd
 
+from graphrag.config.models.umap_config import UmapConfig
 from graphrag.index.operations.embed_graph.typing import NodeEmbeddings
 from graphrag.index.operations.layout_graph.typing import GraphLayout
 
@@ -18,6 +19,8 @@ def layout_graph(
     graph: nx.Graph,
     enabled: bool,
     embeddings: NodeEmbeddings | None,
+    config: UmapConfig | None = None,
+    previous_positions: dict[str, tuple[float, float]] | None = None,
 ):
     """
     Apply a layout algorithm to a nx.Graph. The method returns a dataframe containing the node positions.
@@ -41,11 +44,15 @@ def layout_graph(
         n_neighbors: 5 # Optional, The number of neighbors to use for the umap algorithm, default: 5
         min_dist: 0.75 # Optional, The min distance to use for the umap algorithm, default: 0.75
     ```
+    The umap config can fit on a sample of the nodes and transform the rest, and keep the memory-mapped embeddings on disk.
+    Nodes with previous positions keep them, and the others are mapped into the previous layout.
     """
     layout = _run_layout(
         graph,
         enabled,
         embeddings if embeddings is not None else {},
+        config if config is not None else UmapConfig(),
+        previous_positions,
     )
 
     layout_df = pd.DataFrame(layout)
@@ -59,6 +66,8 @@ def _run_layout(
     graph: nx.Graph,
     enabled: bool,
     embeddings: NodeEmbeddings,
+    config: UmapConfig,
+    previous_positions: dict[str, tuple[float, float]] | None,
 ) -> GraphLayout:
     if enabled:
         from graphrag.index.operations.layout_graph.umap import (
@@ -71,6 +80,9 @@ def _run_layout(
             lambda e, stack, d: logger.error(
                 "Error in Umap", exc_info=e, extra={"stack": stack, "details": d}
             ),
+            sample_size=config.sample_size,
+            out_of_core=config.out_of_core,
+            previous_positions=previous_positions,
         )
     from graphrag.index.operations.layout_graph.zero import (
         run as run_zero,
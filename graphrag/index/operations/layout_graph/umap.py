@@ -4,7 +4,10 @@
 """A module containing run and _create_node_position methods definitions."""
 
 import logging
+import tempfile
 import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import networkx as nx
 import numpy as np
@@ -16,6 +19,9 @@ from graphrag.index.operations.layout_graph.typing import (
 )
 from graphrag.index.typing.error_handler import ErrorHandlerFn
 
+if TYPE_CHECKING:
+    import umap
+
 # TODO: This could be handled more elegantly, like what columns to use
 # for "size" or "cluster"
 # We could also have a boolean to indicate to use node sizes or clusters
@@ -27,6 +33,9 @@ def run(
     graph: nx.Graph,
     embeddings: NodeEmbeddings,
     on_error: ErrorHandlerFn,
+    sample_size: int | None = None,
+    out_of_core: bool = False,
+    previous_positions: dict[str, tuple[float, float]] | None = None,
 ) -> GraphLayout:
     """Run method definition."""
     node_clusters = []
@@ -34,7 +43,6 @@ def run(
 
     embeddings = _filter_raw_embeddings(embeddings)
     nodes = list(embeddings.keys())
-    embedding_vectors = [embeddings[node_id] for node_id in nodes]
 
     for node_id in nodes:
         node = graph.nodes[node_id]
@@ -50,11 +58,17 @@ def run(
         additional_args["node_sizes"] = node_sizes
 
     try:
-        return compute_umap_positions(
-            embedding_vectors=np.array(embedding_vectors),
-            node_labels=nodes,
-            **additional_args,
-        )
+        with tempfile.TemporaryDirectory() as directory:
+            embedding_vectors = _embedding_matrix(
+                embeddings, nodes, Path(directory) if out_of_core else None
+            )
+            return compute_umap_positions(
+                embedding_vectors=embedding_vectors,
+                node_labels=nodes,
+                sample_size=sample_size,
+                previous_positions=previous_positions,
+                **additional_args,
+            )
     except Exception as e:
         logger.exception("Error running UMAP")
         on_error(e, traceback.format_exc(), None)
@@ -77,6 +91,23 @@ def _filter_raw_embeddings(embeddings: NodeEmbeddings) -> NodeEmbeddings:
     }
 
 
+def _embedding_matrix(
+    embeddings: NodeEmbeddings, nodes: list[str], directory: Path | None
+) -> np.ndarray:
+    """Stack the embeddings into a float32 matrix, backed by a memory-mapped file in the directory if one is given."""
+    dimensions = len(embeddings[nodes[0]]) if len(nodes) > 0 else 0
+    shape = (len(nodes), dimensions)
+    if directory is None:
+        matrix = np.empty(shape, dtype=np.float32)
+    else:
+        matrix = np.lib.format.open_memmap(
+            directory / "embeddings.npy", mode="w+", dtype=np.float32, shape=shape
+        )
+    for row, node_id in enumerate(nodes):
+        matrix[row] = embeddings[node_id]
+    return matrix
+
+
 def compute_umap_positions(
     embedding_vectors: np.ndarray,
     node_labels: list[str],
@@ -88,23 +119,40 @@ def compute_umap_positions(
     metric: str = "euclidean",
     n_components: int = 2,
     random_state: int = 86,
+    sample_size: int | None = None,
+    previous_positions: dict[str, tuple[float, float]] | None = None,
 ) -> list[NodePosition]:
-    """Project embedding vectors down to 2D/3D using UMAP."""
+    """Project embedding vectors down to 2D/3D using UMAP.
+
+    When there are more vectors than `sample_size`, UMAP is fit on a random sample of them and the others are transformed
+    in batches of that size. When previous positions are given, nodes that have one keep it, and the other 2D positions are
+    mapped into the previous layout with the affine transform that best fits the nodes found in both.
+    """
     # NOTE: This import is done here to reduce the initial import time of the graphrag package
     import umap
 
-    embedding_positions = umap.UMAP(
+    reducer = umap.UMAP(
         min_dist=min_dist,
         n_neighbors=n_neighbors,
         spread=spread,
         n_components=n_components,
         metric=metric,
         random_state=random_state,
-    ).fit_transform(embedding_vectors)
+    )
+    if sample_size is None or len(embedding_vectors) <= sample_size:
+        embedding_positions = np.asarray(reducer.fit_transform(embedding_vectors))
+    else:
+        embedding_positions = _fit_sample_transform_rest(
+            reducer, embedding_vectors, sample_size, random_state
+        )
+    if previous_positions and n_components == 2:
+        embedding_positions = _align_to_previous_positions(
+            embedding_positions, node_labels, previous_positions
+        )
 
     embedding_position_data: list[NodePosition] = []
     for index, node_name in enumerate(node_labels):
-        node_points = embedding_positions[index]  # type: ignore
+        node_points = embedding_positions[index]
         node_category = 1 if node_categories is None else node_categories[index]
         node_size = 1 if node_sizes is None else node_sizes[index]
 
@@ -130,3 +178,51 @@ def compute_umap_positions(
                 )
             )
     return embedding_position_data
+
+
+def _fit_sample_transform_rest(
+    reducer: "umap.UMAP",
+    embedding_vectors: np.ndarray,
+    sample_size: int,
+    random_state: int,
+) -> np.ndarray:
+    """Fit UMAP on a random sample of the vectors, and transform the rest in batches of the sample size."""
+    rng = np.random.default_rng(random_state)
+    sample = np.sort(rng.choice(len(embedding_vectors), sample_size, replace=False))
+    reducer.fit(embedding_vectors[sample])
+
+    positions = np.empty(
+        (len(embedding_vectors), reducer.embedding_.shape[1]), dtype=np.float32
+    )
+    positions[sample] = reducer.embedding_
+    rest = np.setdiff1d(np.arange(len(embedding_vectors)), sample)
+    for offset in range(0, len(rest), sample_size):
+        batch = rest[offset : offset + sample_size]
+        positions[batch] = reducer.transform(embedding_vectors[batch])
+    return positions
+
+
+def _align_to_previous_positions(
+    positions: np.ndarray,
+    node_labels: list[str],
+    previous_positions: dict[str, tuple[float, float]],
+) -> np.ndarray:
+    """Keep the previous positions of known nodes, and map the others into the previous layout.
+
+    The affine transform is fit by least squares on the known nodes, and is only applied when there are at least three of
+    them; otherwise the new positions are kept as they are.
+    """
+    known = np.asarray([label in previous_positions for label in node_labels])
+    if known.sum() == 0:
+        return positions
+    targets = np.asarray(
+        [previous_positions[label] for label in np.asarray(node_labels)[known]],
+        dtype=float,
+    )
+    aligned = positions.astype(float)
+    if known.sum() >= 3:
+        design = np.column_stack([positions, np.ones(len(positions))])
+        transform, *_ = np.linalg.lstsq(design[known], targets, rcond=None)
+        aligned = design @ transform
+    aligned[known] = targets
+    return aligned
@@ -3,20 +3,16 @@
 
 """Graph pruning."""
 
-from typing import TYPE_CHECKING, cast
-
-import graspologic as glc
-import networkx as nx
 import numpy as np
+import pandas as pd
 
 import graphrag.data_model.schemas as schemas
-
-if TYPE_CHECKING:
-    from networkx.classes.reportviews import DegreeView
+from graphrag.index.utils.compact_graph import CompactGraph
 
 
 def prune_graph(
-    graph: nx.Graph,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
     min_node_freq: int = 1,
     max_node_freq_std: float | None = None,
     min_node_degree: int = 1,
@@ -24,68 +20,74 @@ def prune_graph(
     min_edge_weight_pct: float = 40,
     remove_ego_nodes: bool = False,
     lcc_only: bool = False,
-) -> nx.Graph:
-    """Prune graph by removing nodes that are out of frequency/degree ranges and edges with low weights."""
-    # remove ego nodes if needed
-    degree = cast("DegreeView", graph.degree)
-    degrees = list(degree())  # type: ignore
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Prune graph by removing nodes that are out of frequency/degree ranges and edges with low weights.
+
+    The graph is pruned with masks over the relationships table, and the pruned node titles and edges are returned in the
+    order networkx reports them for the same graph. Edges are returned with source and target in lexicographic order.
+    """
+    graph = CompactGraph.from_dataframe(
+        relationships,
+        weight=schemas.EDGE_WEIGHT,
+        nodes=entities[schemas.TITLE],
+    )
+    # later entity rows overwrite earlier ones for the same title, as when adding them as node attributes
+    frequencies = (
+        entities.drop_duplicates(schemas.TITLE, keep="last")
+        .set_index(schemas.TITLE)[schemas.NODE_FREQUENCY]
+        .reindex(graph.nodes)
+        .to_numpy()
+    )
+
+    # degrees are taken once on the full graph, and every degree filter uses them
+    degrees = graph.degree()
+    node_mask = np.ones(graph.num_nodes, dtype=bool)
     if remove_ego_nodes:
         # ego node is one with highest degree
-        ego_node = max(degrees, key=lambda x: x[1])
-        graph.remove_nodes_from([ego_node[0]])
+        node_mask[np.argmax(degrees)] = False
 
     # remove nodes that are not within the predefined degree range
-    graph.remove_nodes_from([
-        node for node, degree in degrees if degree < min_node_degree
-    ])
+    node_mask &= ~(degrees < min_node_degree)
     if max_node_degree_std is not None:
-        upper_threshold = _get_upper_threshold_by_std(
-            [degree for _, degree in degrees], max_node_degree_std
-        )
-        graph.remove_nodes_from([
-            node for node, degree in degrees if degree > upper_threshold
-        ])
+        upper_threshold = _get_upper_threshold_by_std(degrees, max_node_degree_std)
+        node_mask &= ~(degrees > upper_threshold)
 
     # remove nodes that are not within the predefined frequency range
-    graph.remove_nodes_from([
-        node
-        for node, data in graph.nodes(data=True)
-        if data[schemas.NODE_FREQUENCY] < min_node_freq
-    ])
+    node_mask &= ~(frequencies < min_node_freq)
     if max_node_freq_std is not None:
         upper_threshold = _get_upper_threshold_by_std(
-            [data[schemas.NODE_FREQUENCY] for _, data in graph.nodes(data=True)],
-            max_node_freq_std,
+            frequencies[node_mask], max_node_freq_std
         )
-        graph.remove_nodes_from([
-            node
-            for node, data in graph.nodes(data=True)
-            if data[schemas.NODE_FREQUENCY] > upper_threshold
-        ])
+        node_mask &= ~(frequencies > upper_threshold)
 
     # remove edges by min weight
+    edge_mask = node_mask[graph.sources] & node_mask[graph.targets]
     if min_edge_weight_pct > 0:
-        min_edge_weight = np.percentile(
-            [data[schemas.EDGE_WEIGHT] for _, _, data in graph.edges(data=True)],
-            min_edge_weight_pct,
-        )
-        graph.remove_edges_from([
-            (source, target)
-            for source, target, data in graph.edges(data=True)
-            if source in graph.nodes()
-            and target in graph.nodes()
-            and data[schemas.EDGE_WEIGHT] < min_edge_weight
-        ])
+        min_edge_weight = np.percentile(graph.weights[edge_mask], min_edge_weight_pct)
+        edge_mask &= ~(graph.weights < min_edge_weight)
 
     if lcc_only:
-        return glc.utils.largest_connected_component(graph)  # type: ignore
+        pruned = graph.edge_subgraph(edge_mask).subgraph(node_mask)
+        node_mask[node_mask] = pruned.largest_connected_component_mask()
+        edge_mask &= node_mask[graph.sources] & node_mask[graph.targets]
 
-    return graph
+    # networkx reports every edge from its earlier node, grouped by that node
+    sources = np.minimum(graph.sources, graph.targets)[edge_mask]
+    targets = np.maximum(graph.sources, graph.targets)[edge_mask]
+    order = np.argsort(sources, kind="stable")
+    nodes = pd.DataFrame({schemas.TITLE: graph.nodes[node_mask]})
+    edges = pd.DataFrame({
+        "source": graph.nodes[sources[order]].tolist(),
+        "target": graph.nodes[targets[order]].tolist(),
+    })
+    edges = pd.DataFrame({
+        "source": edges[["source", "target"]].min(axis=1),
+        "target": edges[["source", "target"]].max(axis=1),
+    })
+    return nodes, edges
 
 
-def _get_upper_threshold_by_std(
-    data: list[float] | list[int], std_trim: float
-) -> float:
+def _get_upper_threshold_by_std(data: np.ndarray, std_trim: float) -> float:
     """Get upper threshold by standard deviation."""
     mean = np.mean(data)
     std = np.std(data)
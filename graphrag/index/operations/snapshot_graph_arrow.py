@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing snapshot_graph_arrow, load_graph_snapshot and load_graph_snapshot_from_bytes methods definition."""
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+from graphrag.index.utils.compact_graph import CompactGraph
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+# Number of rows written per record batch
+SNAPSHOT_BATCH_ROWS = 1_000_000
+
+
+async def snapshot_graph_arrow(
+    graph: CompactGraph,
+    name: str,
+    storage: PipelineStorage,
+) -> None:
+    """Take an entire snapshot of a graph as Arrow IPC node and edge tables.
+
+    `{name}_nodes.arrow` holds the title of every node, and `{name}_edges.arrow` the source and target node ids and the weight
+    of every edge. The edge columns are written straight from the graph arrays, and both files can be memory-mapped with
+    `load_graph_snapshot`. With file storage, the tables are streamed to the files in record batches; other storages take
+    each file as one bytes value, so it is built in memory first.
+    """
+    nodes = pa.table({"title": pa.array(graph.nodes, type=pa.string())})
+    edges = pa.table({
+        "source": pa.array(graph.sources, type=pa.int64()),
+        "target": pa.array(graph.targets, type=pa.int64()),
+        "weight": pa.array(graph.weights, type=pa.float64()),
+    })
+    for key, table in [(f"{name}_nodes.arrow", nodes), (f"{name}_edges.arrow", edges)]:
+        path = storage.path(key) if isinstance(storage, FilePipelineStorage) else None
+        if path is not None:
+            await asyncio.to_thread(_write_ipc_file, table, str(path))
+        else:
+            await storage.set(key, _to_ipc_file(table))
+
+
+def load_graph_snapshot(directory: str | Path, name: str = "graph") -> CompactGraph:
+    """Load a graph snapshot taken with `snapshot_graph_arrow` from a local directory.
+
+    The files are memory-mapped, and the edge arrays are read-only views of the mapped files rather than copies.
+    """
+    nodes = _read_ipc_file(Path(directory) / f"{name}_nodes.arrow")
+    edges = _read_ipc_file(Path(directory) / f"{name}_edges.arrow")
+    return _to_compact_graph(nodes, edges)
+
+
+def load_graph_snapshot_from_bytes(nodes: bytes, edges: bytes) -> CompactGraph:
+    """Load a graph snapshot taken with `snapshot_graph_arrow` from the contents of its node and edge files, e.g. downloaded from blob storage."""
+    return _to_compact_graph(
+        pa.ipc.open_file(pa.py_buffer(nodes)).read_all(),
+        pa.ipc.open_file(pa.py_buffer(edges)).read_all(),
+    )
+
+
+def _to_compact_graph(nodes: pa.Table, edges: pa.Table) -> CompactGraph:
+    return CompactGraph(
+        nodes=np.asarray(
+            nodes.column("title").to_numpy(zero_copy_only=False), dtype=object
+        ),
+        sources=_numeric_column(edges, "source"),
+        targets=_numeric_column(edges, "target"),
+        weights=_numeric_column(edges, "weight"),
+    )
+
+
+def _write_ipc_file(table: pa.Table, sink: str | pa.NativeFile) -> None:
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=SNAPSHOT_BATCH_ROWS):
+            writer.write_batch(batch)
+
+
+def _to_ipc_file(table: pa.Table) -> bytes:
+    # PipelineStorage.set only takes str or bytes values, so the buffer is copied once into bytes
+    sink = pa.BufferOutputStream()
+    _write_ipc_file(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+def _read_ipc_file(path: Path) -> pa.Table:
+    # the mapped file stays open for as long as the arrays read from it are alive
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def _numeric_column(table: pa.Table, name: str) -> np.ndarray:
+    column = table.column(name)
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy()
+    return column.to_numpy()
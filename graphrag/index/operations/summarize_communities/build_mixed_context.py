@@ -2,6 +2,8 @@
 # Licensed under the MIT License
 """A module containing the build_mixed_context method definition."""
 
+from collections.abc import Callable
+
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
@@ -11,11 +13,16 @@ from graphrag.index.operations.summarize_communities.graph_context.sort_context
 from graphrag.query.llm.text_utils import num_tokens
 
 
-def build_mixed_context(context: list[dict], max_context_tokens: int) -> str:
+def build_mixed_context(
+    context: list[dict],
+    max_context_tokens: int,
+    sort_local_context: Callable[..., str] = sort_context,
+) -> str:
     """
     Build parent context by concatenating all sub-communities' contexts.
 
-    If the context exceeds the limit, we use sub-community reports instead.
+    If the context exceeds the limit, we use sub-community reports instead. `sort_local_context` renders the local context
+    records together with the substituted reports, and defaults to the graph context sorter.
     """
     sorted_context = sorted(
         context, key=lambda x: x[schemas.CONTEXT_SIZE], reverse=True
@@ -43,7 +50,7 @@ def build_mixed_context(context: list[dict], max_context_tokens: int) -> str:
             remaining_local_context = []
             for rid in range(idx + 1, len(sorted_context)):
                 remaining_local_context.extend(sorted_context[rid][schemas.ALL_CONTEXT])
-            new_context_string = sort_context(
+            new_context_string = sort_local_context(
                 local_context=remaining_local_context + final_local_contexts,
                 sub_community_reports=substitute_reports,
             )
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Content fingerprints of communities, used to reuse the reports of communities that did not change."""
+
+from hashlib import sha256
+
+import pandas as pd
+
+import graphrag.data_model.schemas as schemas
+
+
+def graph_community_fingerprints(
+    communities: pd.DataFrame,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    claims: pd.DataFrame | None = None,
+) -> dict[int, str]:
+    """Fingerprint every community from the titles and descriptions of its entities, relationships and claims.
+
+    Relationships are identified by their endpoints rather than their ids, which are regenerated on every run.
+    """
+    entity_hashes = _hash_by_id(entities, [schemas.TITLE, schemas.DESCRIPTION])
+    relationship_hashes = _hash_by_id(
+        relationships, [schemas.EDGE_SOURCE, schemas.EDGE_TARGET, schemas.DESCRIPTION]
+    )
+    parts = [
+        _member_hashes(communities, "entity_ids", entity_hashes),
+        _member_hashes(communities, "relationship_ids", relationship_hashes),
+    ]
+    if claims is not None:
+        # claims are reported for the entities whose title is their subject
+        claim_hashes: dict[str, list[str]] = {}
+        for subject, claim_hash in zip(
+            claims[schemas.CLAIM_SUBJECT].tolist(),
+            _hash_rows(
+                claims,
+                [
+                    schemas.CLAIM_SUBJECT,
+                    schemas.TYPE,
+                    schemas.CLAIM_STATUS,
+                    schemas.DESCRIPTION,
+                ],
+            ),
+            strict=True,
+        ):
+            claim_hashes.setdefault(subject, []).append(claim_hash)
+        entity_claim_hashes = {
+            entity_id: ",".join(sorted(claim_hashes.get(title, [])))
+            for entity_id, title in zip(
+                entities[schemas.ID].tolist(),
+                entities[schemas.TITLE].tolist(),
+                strict=True,
+            )
+        }
+        parts.append(_member_hashes(communities, "entity_ids", entity_claim_hashes))
+    return _combine(communities, parts)
+
+
+def text_community_fingerprints(
+    communities: pd.DataFrame,
+    entities: pd.DataFrame,
+    text_units: pd.DataFrame,
+) -> dict[int, str]:
+    """Fingerprint every community from the titles of its entities and the text of its text units."""
+    parts = [
+        _member_hashes(
+            communities, "entity_ids", _hash_by_id(entities, [schemas.TITLE])
+        ),
+        _member_hashes(
+            communities, "text_unit_ids", _hash_by_id(text_units, [schemas.TEXT])
+        ),
+    ]
+    return _combine(communities, parts)
+
+
+def _hash(value: str) -> str:
+    return sha256(value.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _hash_rows(df: pd.DataFrame, columns: list[str]) -> list[str]:
+    """Hash the values of the given columns in every row."""
+    values = zip(*(df[column].astype(str).tolist() for column in columns), strict=True)
+    return [_hash("\x1f".join(row)) for row in values]
+
+
+def _hash_by_id(df: pd.DataFrame, columns: list[str]) -> dict[str, str]:
+    """Hash the values of the given columns in every row, keyed by the row id."""
+    return dict(zip(df[schemas.ID].tolist(), _hash_rows(df, columns), strict=True))
+
+
+def _member_hashes(
+    communities: pd.DataFrame, member_column: str, hashes: dict[str, str]
+) -> list[str]:
+    """Return the sorted, comma-joined hashes of the members of every community."""
+    return [
+        ",".join(sorted(hashes.get(member, "") for member in members))
+        if members is not None
+        else ""
+        for members in communities[member_column].tolist()
+    ]
+
+
+def _combine(communities: pd.DataFrame, parts: list[list[str]]) -> dict[int, str]:
+    """Combine the hashes of every part into one fingerprint per community."""
+    return {
+        int(community): _hash("\n".join(hashes))
+        for community, *hashes in zip(
+            communities[schemas.COMMUNITY_ID].tolist(), *parts, strict=True
+        )
+    }
@@ -6,6 +6,7 @@
 import logging
 from typing import cast
 
+import numpy as np
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
@@ -14,11 +15,11 @@ from graphrag.index.operations.summarize_communities.build_mixed_context import
     build_mixed_context,
 )
 from graphrag.index.operations.summarize_communities.graph_context.sort_context import (
-    parallel_sort_context_batch,
     sort_context,
 )
 from graphrag.index.operations.summarize_communities.utils import (
-    get_levels,
+    LocalContextRecords,
+    community_ranges,
 )
 from graphrag.index.utils.dataframes import (
     antijoin,
@@ -42,147 +43,137 @@ def build_local_context(
     callbacks: WorkflowCallbacks,
     max_context_tokens: int = 16_000,
 ):
-    """Prep communities for report generation."""
-    levels = get_levels(nodes, schemas.COMMUNITY_LEVEL)
+    """Prep communities for report generation.
 
-    dfs = []
+    The node, edge and claim details of all levels are joined in one pass, keeping the positions of the details rather
+    than copies of them. The context records of a community are only materialized when its context is rendered.
+    """
+    node_rows = _prepare_node_rows(nodes, edges, claims)
+    level_counts = node_rows[schemas.COMMUNITY_LEVEL].value_counts(sort=False)
+    for level, count in level_counts.sort_index(ascending=False).items():
+        logger.info("Number of nodes at level=%s => %s", level, count)
+
+    edge_details = edges[schemas.EDGE_DETAILS].tolist()
+    columns = {
+        schemas.TITLE: node_rows[schemas.TITLE].tolist(),
+        schemas.NODE_DEGREE: node_rows[schemas.NODE_DEGREE].tolist(),
+        schemas.NODE_DETAILS: node_rows[schemas.NODE_DETAILS].tolist(),
+        schemas.EDGE_DETAILS: [
+            [edge_details[edge]] if edge >= 0 else []
+            for edge in node_rows["edge"].tolist()
+        ],
+    }
+    if claims is not None:
+        claim_details = claims[schemas.CLAIM_DETAILS].tolist()
+        columns[schemas.CLAIM_DETAILS] = [
+            claim_details[claim] if claim >= 0 else None
+            for claim in node_rows["claim"].tolist()
+        ]
 
-    for level in progress_iterable(levels, callbacks.progress, len(levels)):
-        communities_at_level_df = _prepare_reports_at_level(
-            nodes, edges, claims, level, max_context_tokens
+    community_ids = node_rows[schemas.COMMUNITY_ID].to_numpy()
+    ranges = community_ranges(community_ids)
+    starts = [start for start, _ in ranges]
+    all_context = np.empty(len(ranges), dtype=object)
+    for index, (start, stop) in enumerate(ranges):
+        all_context[index] = LocalContextRecords(columns, start, stop)
+
+    community_df = pd.DataFrame({
+        schemas.COMMUNITY_ID: community_ids[starts],
+        schemas.ALL_CONTEXT: all_context,
+    })
+    community_df[schemas.CONTEXT_STRING] = [
+        sort_context(records, max_context_tokens=max_context_tokens)
+        for records in progress_iterable(
+            all_context, callbacks.progress, len(all_context)
         )
-
-        communities_at_level_df.loc[:, schemas.COMMUNITY_LEVEL] = level
-        dfs.append(communities_at_level_df)
-
-    # build initial local context for all communities
-    return pd.concat(dfs)
+    ]
+    community_df[schemas.CONTEXT_SIZE] = community_df[schemas.CONTEXT_STRING].map(
+        num_tokens
+    )
+    community_df[schemas.CONTEXT_EXCEED_FLAG] = (
+        community_df[schemas.CONTEXT_SIZE] > max_context_tokens
+    )
+    community_df[schemas.COMMUNITY_LEVEL] = node_rows[
+        schemas.COMMUNITY_LEVEL
+    ].to_numpy()[starts]
+    return community_df
 
 
-def _prepare_reports_at_level(
+def _prepare_node_rows(
     node_df: pd.DataFrame,
     edge_df: pd.DataFrame,
     claim_df: pd.DataFrame | None,
-    level: int,
-    max_context_tokens: int = 16_000,
 ) -> pd.DataFrame:
-    """Prepare reports at a given level."""
-    # Filter and prepare node details
-    level_node_df = node_df[node_df[schemas.COMMUNITY_LEVEL] == level]
-    logger.info("Number of nodes at level=%s => %s", level, len(level_node_df))
-    nodes_set = set(level_node_df[schemas.TITLE])
-
-    # Filter and prepare edge details
-    level_edge_df = edge_df[
-        edge_df.loc[:, schemas.EDGE_SOURCE].isin(nodes_set)
-        & edge_df.loc[:, schemas.EDGE_TARGET].isin(nodes_set)
-    ]
-    level_edge_df.loc[:, schemas.EDGE_DETAILS] = level_edge_df.loc[
-        :,
-        [
-            schemas.SHORT_ID,
-            schemas.EDGE_SOURCE,
-            schemas.EDGE_TARGET,
-            schemas.DESCRIPTION,
-            schemas.EDGE_DEGREE,
-        ],
-    ].to_dict(orient="records")
-
-    level_claim_df = pd.DataFrame()
-    if claim_df is not None:
-        level_claim_df = claim_df[
-            claim_df.loc[:, schemas.CLAIM_SUBJECT].isin(nodes_set)
-        ]
+    """Return a row for every node of every community, with the position of its edge and claim, ordered by community.
 
-    # Merge node and edge details
-    # Group edge details by node and aggregate into lists
-    source_edges = (
-        level_edge_df.groupby(schemas.EDGE_SOURCE)
-        .agg({schemas.EDGE_DETAILS: "first"})
-        .reset_index()
-        .rename(columns={schemas.EDGE_SOURCE: schemas.TITLE})
+    A node gets the first edge it is the source of, or else the first edge it is the target of, among the edges between
+    nodes of its level. A node with several claims gets a row per claim.
+    """
+    keys = [
+        schemas.TITLE,
+        schemas.COMMUNITY_ID,
+        schemas.COMMUNITY_LEVEL,
+        schemas.NODE_DEGREE,
+    ]
+    node_rows = (
+        node_df.loc[:, [*keys, schemas.NODE_DETAILS]]
+        .dropna(subset=keys)
+        .drop_duplicates(subset=keys)
     )
-
-    target_edges = (
-        level_edge_df.groupby(schemas.EDGE_TARGET)
-        .agg({schemas.EDGE_DETAILS: "first"})
-        .reset_index()
-        .rename(columns={schemas.EDGE_TARGET: schemas.TITLE})
+    node_rows = node_rows.loc[node_rows[schemas.COMMUNITY_LEVEL] != -1]
+
+    # the edges between nodes of the same level, once per level, in edge order
+    node_levels = node_rows.loc[
+        :, [schemas.TITLE, schemas.COMMUNITY_LEVEL]
+    ].drop_duplicates()
+    level_edges = (
+        pd.DataFrame({
+            "edge": np.arange(len(edge_df)),
+            schemas.EDGE_SOURCE: edge_df[schemas.EDGE_SOURCE].to_numpy(),
+            schemas.EDGE_TARGET: edge_df[schemas.EDGE_TARGET].to_numpy(),
+        })
+        .merge(
+            node_levels.rename(columns={schemas.TITLE: schemas.EDGE_SOURCE}),
+            on=schemas.EDGE_SOURCE,
+        )
+        .merge(
+            node_levels.rename(columns={schemas.TITLE: schemas.EDGE_TARGET}),
+            on=[schemas.EDGE_TARGET, schemas.COMMUNITY_LEVEL],
+        )
+        .sort_values("edge", kind="stable")
     )
 
-    # Merge aggregated edges into the node DataFrame
-    merged_node_df = level_node_df.merge(
-        source_edges, on=schemas.TITLE, how="left"
-    ).merge(target_edges, on=schemas.TITLE, how="left")
-
-    # Combine source and target edge details into a single column
-    merged_node_df.loc[:, schemas.EDGE_DETAILS] = merged_node_df.loc[
-        :, f"{schemas.EDGE_DETAILS}_x"
-    ].combine_first(merged_node_df.loc[:, f"{schemas.EDGE_DETAILS}_y"])
-
-    # Drop intermediate columns
-    merged_node_df.drop(
-        columns=[f"{schemas.EDGE_DETAILS}_x", f"{schemas.EDGE_DETAILS}_y"], inplace=True
-    )
+    def first_edges(endpoint: str, name: str) -> pd.DataFrame:
+        return (
+            level_edges.drop_duplicates(subset=[schemas.COMMUNITY_LEVEL, endpoint])
+            .loc[:, [schemas.COMMUNITY_LEVEL, endpoint, "edge"]]
+            .rename(columns={endpoint: schemas.TITLE, "edge": name})
+        )
 
-    # Aggregate node and edge details
-    merged_node_df = (
-        merged_node_df.groupby([
-            schemas.TITLE,
-            schemas.COMMUNITY_ID,
-            schemas.COMMUNITY_LEVEL,
-            schemas.NODE_DEGREE,
-        ])
-        .agg({
-            schemas.NODE_DETAILS: "first",
-            schemas.EDGE_DETAILS: lambda x: list(x.dropna()),
-        })
-        .reset_index()
+    key = [schemas.COMMUNITY_LEVEL, schemas.TITLE]
+    node_rows = node_rows.merge(
+        first_edges(schemas.EDGE_SOURCE, "source_edge"), on=key, how="left"
+    ).merge(first_edges(schemas.EDGE_TARGET, "target_edge"), on=key, how="left")
+    node_rows["edge"] = (
+        node_rows["source_edge"].fillna(node_rows["target_edge"]).fillna(-1).astype(int)
     )
 
-    # Add ALL_CONTEXT column
-    # Ensure schemas.CLAIM_DETAILS exists with the correct length
-    # Merge claim details if available
     if claim_df is not None:
-        merged_node_df = merged_node_df.merge(
-            level_claim_df.loc[
-                :, [schemas.CLAIM_SUBJECT, schemas.CLAIM_DETAILS]
-            ].rename(columns={schemas.CLAIM_SUBJECT: schemas.TITLE}),
+        node_rows = node_rows.merge(
+            pd.DataFrame({
+                schemas.TITLE: claim_df[schemas.CLAIM_SUBJECT].to_numpy(),
+                "claim": np.arange(len(claim_df)),
+            }),
             on=schemas.TITLE,
             how="left",
         )
+        node_rows["claim"] = node_rows["claim"].fillna(-1).astype(int)
 
-    # Create the ALL_CONTEXT column
-    merged_node_df[schemas.ALL_CONTEXT] = (
-        merged_node_df.loc[
-            :,
-            [
-                schemas.TITLE,
-                schemas.NODE_DEGREE,
-                schemas.NODE_DETAILS,
-                schemas.EDGE_DETAILS,
-            ],
-        ]
-        .assign(
-            **{schemas.CLAIM_DETAILS: merged_node_df[schemas.CLAIM_DETAILS]}
-            if claim_df is not None
-            else {}
-        )
-        .to_dict(orient="records")
-    )
-
-    # group all node details by community
-    community_df = (
-        merged_node_df.groupby(schemas.COMMUNITY_ID)
-        .agg({schemas.ALL_CONTEXT: list})
-        .reset_index()
-    )
-
-    # Generate community-level context strings using vectorized batch processing
-    return parallel_sort_context_batch(
-        community_df,
-        max_context_tokens=max_context_tokens,
-    )
+    return node_rows.sort_values(
+        [schemas.COMMUNITY_LEVEL, schemas.COMMUNITY_ID, schemas.TITLE],
+        ascending=[False, True, True],
+        kind="stable",
+    ).reset_index(drop=True)
 
 
 def build_level_context(
@@ -2,14 +2,19 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+from collections.abc import Callable, Iterable
+from itertools import accumulate
+
 import pandas as pd
+import tiktoken
 
+import graphrag.config.defaults as defs
 import graphrag.data_model.schemas as schemas
 from graphrag.query.llm.text_utils import num_tokens
 
 
 def sort_context(
-    local_context: list[dict],
+    local_context: Iterable[dict],
     sub_community_reports: list[dict] | None = None,
     max_context_tokens: int | None = None,
     node_name_column: str = schemas.TITLE,
@@ -21,38 +26,15 @@ def sort_context(
     edge_target_column: str = schemas.EDGE_TARGET,
     claim_details_column: str = schemas.CLAIM_DETAILS,
 ) -> str:
-    """Sort context by degree in descending order, optimizing for performance."""
-
-    def _get_context_string(
-        entities: list[dict],
-        edges: list[dict],
-        claims: list[dict],
-        sub_community_reports: list[dict] | None = None,
-    ) -> str:
-        """Concatenate structured data into a context string."""
-        contexts = []
-        if sub_community_reports:
-            report_df = pd.DataFrame(sub_community_reports)
-            if not report_df.empty:
-                contexts.append(
-                    f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
-                )
+    """Sort context by degree in descending order, optimizing for performance.
 
-        for label, data in [
-            ("Entities", entities),
-            ("Claims", claims),
-            ("Relationships", edges),
-        ]:
-            if data:
-                data_df = pd.DataFrame(data)
-                if not data_df.empty:
-                    contexts.append(
-                        f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
-                    )
-
-        return "\n\n".join(contexts)
-
-    # Preprocess local context
+    Edges are added in order together with their nodes and claims, and the context keeps every edge up to the first one that
+    takes it over `max_context_tokens`. Instead of rendering and counting the context after every edge, the cutoff is estimated
+    from per-row token costs and confirmed by rendering the contexts around it, relying on the token count growing as rows are
+    added.
+    """
+    # Preprocess local context, materializing records that are built lazily only once
+    local_context = list(local_context)
     edges = [
         {**e, schemas.SHORT_ID: int(e[schemas.SHORT_ID])}
         for record in local_context
@@ -81,10 +63,10 @@ def sort_context(
     # Sort edges by degree (desc) and ID (asc)
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
-    # Deduplicate and build context incrementally
+    # Deduplicate, recording how many rows of each kind the context holds after every edge
     edge_ids, nodes_ids, claims_ids = set(), set(), set()
     sorted_edges, sorted_nodes, sorted_claims = [], [], []
-    context_string = ""
+    steps: list[tuple[int, int, int]] = []
 
     for edge in edges:
         source, target = edge[edge_source_column], edge[edge_target_column]
@@ -108,18 +90,149 @@ def sort_context(
             edge_ids.add(edge[schemas.SHORT_ID])
             sorted_edges.append(edge)
 
-        # Generate new context string
-        new_context_string = _get_context_string(
+        steps.append((len(sorted_nodes), len(sorted_claims), len(sorted_edges)))
+
+    if not max_context_tokens or not steps:
+        return _get_context_string(
             sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
         )
-        if max_context_tokens and num_tokens(new_context_string) > max_context_tokens:
-            break
-        context_string = new_context_string
 
-    # Return the final context string
-    return context_string or _get_context_string(
-        sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+    context_strings: dict[int, str] = {}
+
+    def context_at(step: int) -> str:
+        if step not in context_strings:
+            num_nodes, num_claims, num_edges = steps[step]
+            context_strings[step] = _get_context_string(
+                sorted_nodes[:num_nodes],
+                sorted_edges[:num_edges],
+                sorted_claims[:num_claims],
+                sub_community_reports,
+            )
+        return context_strings[step]
+
+    def exceeds(step: int) -> bool:
+        return num_tokens(context_at(step)) > max_context_tokens
+
+    estimated = _estimate_step_tokens(
+        steps, sorted_nodes, sorted_claims, sorted_edges, sub_community_reports
+    )
+    first_estimated = next(
+        (step for step, size in enumerate(estimated) if size > max_context_tokens),
+        len(steps) - 1,
+    )
+    cutoff = _first_exceeding_step(exceeds, first_estimated, len(steps))
+
+    # the context before the first edge over the budget, or the context of that edge if it is the first one
+    context_string = context_at(cutoff - 1) if cutoff > 0 else ""
+    return context_string or context_at(min(cutoff, len(steps) - 1))
+
+
+def _get_context_string(
+    entities: list[dict],
+    edges: list[dict],
+    claims: list[dict],
+    sub_community_reports: list[dict] | None = None,
+) -> str:
+    """Concatenate structured data into a context string."""
+    contexts = []
+    if sub_community_reports:
+        report_df = pd.DataFrame(sub_community_reports)
+        if not report_df.empty:
+            contexts.append(
+                f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
+            )
+
+    for label, data in [
+        ("Entities", entities),
+        ("Claims", claims),
+        ("Relationships", edges),
+    ]:
+        if data:
+            data_df = pd.DataFrame(data)
+            if not data_df.empty:
+                contexts.append(
+                    f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
+                )
+
+    return "\n\n".join(contexts)
+
+
+def _estimate_step_tokens(
+    steps: list[tuple[int, int, int]],
+    entities: list[dict],
+    claims: list[dict],
+    edges: list[dict],
+    sub_community_reports: list[dict] | None,
+) -> list[int]:
+    """Estimate the tokens of the context after every step, summing the token cost of every section header and row."""
+    token_encoder = tiktoken.get_encoding(defs.ENCODING_MODEL)
+    section_tokens = []
+    cumulative_row_tokens = []
+    for label, rows in [
+        ("Entities", entities),
+        ("Claims", claims),
+        ("Relationships", edges),
+    ]:
+        header = f"-----{label}-----\n{','.join(map(str, rows[0])) if rows else ''}\n\n"
+        section_tokens.append(len(token_encoder.encode_ordinary(header)))
+        row_tokens = token_encoder.encode_ordinary_batch([
+            ",".join(map(str, row.values())) + "\n" for row in rows
+        ])
+        cumulative_row_tokens.append(
+            list(accumulate((len(tokens) for tokens in row_tokens), initial=0))
+        )
+
+    reports_tokens = (
+        len(
+            token_encoder.encode_ordinary(
+                _get_context_string([], [], [], sub_community_reports)
+            )
+        )
+        if sub_community_reports
+        else 0
     )
+    return [
+        reports_tokens
+        + sum(
+            section + cumulative[count] if count else 0
+            for section, cumulative, count in zip(
+                section_tokens, cumulative_row_tokens, step, strict=True
+            )
+        )
+        for step in steps
+    ]
+
+
+def _first_exceeding_step(
+    exceeds: Callable[[int], bool], start: int, num_steps: int
+) -> int:
+    """Return the first step for which `exceeds` holds, or `num_steps` if none does, searching outward from `start`.
+
+    `exceeds` must turn true at some step and stay true after it; it is called a few times around `start` when the estimate
+    is close, and a logarithmic number of times otherwise.
+    """
+    # gallop from the start to a bracket of one step that does not exceed and one that does
+    if exceeds(start):
+        low, high, stride = start - 1, start, 1
+        while low >= 0 and exceeds(low):
+            high = low
+            stride *= 2
+            low = max(high - stride, -1)
+    else:
+        low, high, stride = start, start + 1, 1
+        while high < num_steps and not exceeds(high):
+            low = high
+            stride *= 2
+            high = min(low + stride, num_steps)
+
+    # bisect the bracket
+    while high - low > 1:
+        middle = (low + high) // 2
+        if exceeds(middle):
+            high = middle
+        else:
+            low = middle
+    return high
 
 
 def parallel_sort_context_batch(community_df, max_context_tokens, parallel=False):
@@ -3,14 +3,18 @@
 
 """A module containing create_community_reports and load_strategy methods definition."""
 
+import asyncio
+import json
 import logging
+import traceback
 from collections.abc import Callable
+from hashlib import sha256
+from typing import cast
 
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
 from graphrag.cache.pipeline_cache import PipelineCache
-from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.index.operations.summarize_communities.typing import (
@@ -21,7 +25,8 @@ from graphrag.index.operations.summarize_communities.typing import (
 from graphrag.index.operations.summarize_communities.utils import (
     get_levels,
 )
-from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.derive_from_rows import ParallelizationError
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
@@ -38,9 +43,24 @@ async def summarize_communities(
     max_input_length: int,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    checkpoint: RowCheckpoint | None = None,
+    fingerprints: dict[int, str] | None = None,
+    stats: dict[str, float] | None = None,
 ):
-    """Generate community summaries."""
-    reports: list[CommunityReport | None] = []
+    """Generate community summaries.
+
+    Every community is scheduled on its own rather than level by level: a community whose local context exceeds
+    `max_input_length` starts once the reports of all its sub-communities are done, and its context is then rebuilt from
+    them. Other communities start right away, with up to `num_threads` reports generated at once. Reports are returned in
+    level order, from the deepest level up. In threaded mode, contexts are rebuilt in worker threads.
+
+    If a checkpoint is provided, completed reports are checkpointed by community and context, and skipped when resuming.
+
+    If content fingerprints are provided, every generated report is cached under the fingerprint of its community, combined
+    with the strategy and, for communities summarized from their sub-communities' reports, the hashes of those reports. A
+    community whose fingerprint is found in the cache reuses the cached report instead of generating one. If a stats dict
+    is also provided, the numbers of reused and regenerated reports are recorded into it.
+    """
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     strategy_exec = load_strategy(strategy["type"])
     strategy_config = {**strategy}
@@ -53,43 +73,185 @@ async def summarize_communities(
 
     levels = get_levels(nodes)
 
-    level_contexts = []
+    # contexts built without sub-community reports, which are final for every community that fits or has no sub-community
+    contexts: dict[int, pd.Series] = {}
     for level in levels:
         level_context = level_context_builder(
-            pd.DataFrame(reports),
+            pd.DataFrame(),
             community_hierarchy_df=community_hierarchy,
             local_context_df=local_contexts,
             level=level,
             max_context_tokens=max_input_length,
         )
-        level_contexts.append(level_context)
-
-    for i, level_context in enumerate(level_contexts):
-
-        async def run_generate(record):
-            result = await _generate_report(
-                strategy_exec,
-                community_id=record[schemas.COMMUNITY_ID],
-                community_level=record[schemas.COMMUNITY_LEVEL],
-                community_context=record[schemas.CONTEXT_STRING],
-                callbacks=callbacks,
-                cache=cache,
-                strategy=strategy_config,
+        for _, record in level_context.iterrows():
+            contexts[int(record[schemas.COMMUNITY_ID])] = record
+
+    exceeding = set(
+        local_contexts.loc[
+            local_contexts[schemas.CONTEXT_EXCEED_FLAG].astype(bool),
+            schemas.COMMUNITY_ID,
+        ]
+        .astype(int)
+        .tolist()
+    )
+    sub_communities: dict[int, list[int]] = {}
+    for community, sub_community in zip(
+        community_hierarchy[schemas.COMMUNITY_ID].tolist(),
+        community_hierarchy[schemas.SUB_COMMUNITY].tolist(),
+        strict=True,
+    ):
+        if int(community) in exceeding and int(sub_community) in contexts:
+            sub_communities.setdefault(int(community), []).append(int(sub_community))
+
+    semaphore = asyncio.Semaphore(num_threads or 4)
+    done = {community: asyncio.Event() for community in contexts}
+    reports: dict[int, CommunityReport] = {}
+    failed: set[int] = set()
+    errors: list[tuple[BaseException, str]] = []
+    completed = await checkpoint.load() if checkpoint is not None else {}
+    fingerprint_cache = cache.child("community_report_fingerprints")
+    strategy_signature = _hash(json.dumps(strategy_config, sort_keys=True, default=str))
+    num_reused = 0
+
+    def fingerprint(community: int) -> str | None:
+        """Return the fingerprint of the content a community is summarized from."""
+        if fingerprints is None or community not in fingerprints:
+            return None
+        sub_report_hashes = sorted(
+            _hash(str(reports[sub_community][schemas.FULL_CONTENT]))
+            if sub_community in reports
+            else ""
+            for sub_community in sub_communities.get(community, [])
+        )
+        return _hash(
+            "\n".join([strategy_signature, fingerprints[community], *sub_report_hashes])
+        )
+
+    def build_context(community: int) -> pd.Series:
+        """Rebuild the context of a community from the reports of its sub-communities."""
+        members = [community, *sub_communities[community]]
+        level_context = level_context_builder(
+            pd.DataFrame([
+                reports[sub_community]
+                for sub_community in sub_communities[community]
+                if sub_community in reports
+            ]),
+            community_hierarchy_df=community_hierarchy.loc[
+                community_hierarchy[schemas.COMMUNITY_ID].astype(int) == community
+            ],
+            local_context_df=local_contexts.loc[
+                local_contexts[schemas.COMMUNITY_ID].astype(int).isin(members)
+            ],
+            level=int(contexts[community][schemas.COMMUNITY_LEVEL]),
+            max_context_tokens=max_input_length,
+        )
+        return level_context.loc[
+            level_context[schemas.COMMUNITY_ID].astype(int) == community
+        ].iloc[0]
+
+    async def run_generate(community: int) -> None:
+        try:
+            for sub_community in sub_communities.get(community, []):
+                await done[sub_community].wait()
+            if any(
+                sub_community in failed
+                for sub_community in sub_communities.get(community, [])
+            ):
+                # the run fails anyway, so the community is not summarized
+                failed.add(community)
+                return
+
+            fingerprint_key = fingerprint(community)
+            reused = (
+                await fingerprint_cache.get(fingerprint_key)
+                if fingerprint_key is not None
+                else None
             )
+            if reused:
+                nonlocal num_reused
+                num_reused += 1
+                reports[community] = cast(
+                    "CommunityReport",
+                    {
+                        **reused,
+                        schemas.COMMUNITY_ID: community,
+                        schemas.COMMUNITY_LEVEL: int(
+                            contexts[community][schemas.COMMUNITY_LEVEL]
+                        ),
+                    },
+                )
+                return
+
+            record = contexts[community]
+            if community in sub_communities:
+                record = (
+                    await asyncio.to_thread(build_context, community)
+                    if async_mode == AsyncType.Threaded
+                    else build_context(community)
+                )
+            key = _report_checkpoint_key(record) if checkpoint is not None else None
+            if key is not None and key in completed:
+                result = completed[key]
+            else:
+                async with semaphore:
+                    result = await _generate_report(
+                        strategy_exec,
+                        community_id=community,
+                        community_level=int(record[schemas.COMMUNITY_LEVEL]),
+                        community_context=str(record[schemas.CONTEXT_STRING]),
+                        callbacks=callbacks,
+                        cache=cache,
+                        strategy=strategy_config,
+                    )
+                if checkpoint is not None and key is not None and result is not None:
+                    await checkpoint.add(key, result)
+            if result is not None:
+                reports[community] = result
+                if fingerprint_key is not None:
+                    await fingerprint_cache.set(fingerprint_key, result)
+        except Exception as e:  # noqa: BLE001
+            failed.add(community)
+            errors.append((e, traceback.format_exc()))
+        finally:
+            done[community].set()
             tick()
-            return result
-
-        local_reports = await derive_from_rows(
-            level_context,
-            run_generate,
-            callbacks=NoopWorkflowCallbacks(),
-            num_threads=num_threads,
-            async_type=async_mode,
-            progress_msg=f"level {levels[i]} summarize communities progress: ",
+
+    # deeper communities are created first, so that they are the first to wait on the semaphore
+    await asyncio.gather(*[run_generate(community) for community in contexts])
+    if checkpoint is not None:
+        await checkpoint.flush()
+    if fingerprints is not None:
+        logger.info(
+            "Community reports: %d reused from unchanged communities, %d regenerated",
+            num_reused,
+            len(reports) - num_reused,
         )
-        reports.extend([lr for lr in local_reports if lr is not None])
+        if stats is not None:
+            stats["reused_reports"] = num_reused
+            stats["regenerated_reports"] = len(reports) - num_reused
+
+    for error, stack in errors:
+        logger.error(
+            "parallel transformation error", exc_info=error, extra={"stack": stack}
+        )
+    if errors:
+        raise ParallelizationError(len(errors), errors[0][1])
+
+    return pd.DataFrame([
+        reports[community] for community in contexts if community in reports
+    ])
+
+
+def _hash(value: str) -> str:
+    return sha256(value.encode("utf-8"), usedforsecurity=False).hexdigest()
+
 
-    return pd.DataFrame(reports)
+def _report_checkpoint_key(record: pd.Series) -> str:
+    """Key a report by its community and context, so reports of changed communities are regenerated."""
+    context_hash = sha256(
+        str(record[schemas.CONTEXT_STRING]).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()
+    return f"{record[schemas.COMMUNITY_ID]}:{context_hash}"
 
 
 async def _generate_report(
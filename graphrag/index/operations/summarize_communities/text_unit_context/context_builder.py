@@ -6,6 +6,7 @@
 import logging
 from typing import cast
 
+import numpy as np
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
@@ -18,6 +19,10 @@ from graphrag.index.operations.summarize_communities.text_unit_context.prep_text
 from graphrag.index.operations.summarize_communities.text_unit_context.sort_context import (
     sort_context,
 )
+from graphrag.index.operations.summarize_communities.utils import (
+    LocalContextRecords,
+    community_ranges,
+)
 from graphrag.query.llm.text_utils import num_tokens
 
 logger = logging.getLogger(__name__)
@@ -33,14 +38,13 @@ def build_local_context(
     Prep context data for community report generation using text unit data.
 
     Community membership has columns [COMMUNITY_ID, COMMUNITY_LEVEL, ENTITY_IDS, RELATIONSHIP_IDS, TEXT_UNIT_IDS]
+
+    The context records of a community are only materialized when its context is rendered.
     """
     # get text unit details, include short_id, text, and entity degree (sum of degrees of the text unit's nodes that belong to a community)
     prepped_text_units_df = prep_text_units(text_units_df, node_df)
     prepped_text_units_df = prepped_text_units_df.rename(
-        columns={
-            schemas.ID: schemas.TEXT_UNIT_IDS,
-            schemas.COMMUNITY_ID: schemas.COMMUNITY_ID,
-        }
+        columns={schemas.ID: schemas.TEXT_UNIT_IDS}
     )
 
     # merge text unit details with community membership
@@ -48,37 +52,42 @@ def build_local_context(
         :, [schemas.COMMUNITY_ID, schemas.COMMUNITY_LEVEL, schemas.TEXT_UNIT_IDS]
     ]
     context_df = context_df.explode(schemas.TEXT_UNIT_IDS)
-    context_df = context_df.merge(
-        prepped_text_units_df,
-        on=[schemas.TEXT_UNIT_IDS, schemas.COMMUNITY_ID],
-        how="left",
-    )
-
-    context_df[schemas.ALL_CONTEXT] = context_df.apply(
-        lambda x: {
-            "id": x[schemas.ALL_DETAILS][schemas.SHORT_ID],
-            "text": x[schemas.ALL_DETAILS][schemas.TEXT],
-            "entity_degree": x[schemas.ALL_DETAILS][schemas.ENTITY_DEGREE],
-        },
-        axis=1,
-    )
-
     context_df = (
-        context_df.groupby([schemas.COMMUNITY_ID, schemas.COMMUNITY_LEVEL])
-        .agg({schemas.ALL_CONTEXT: list})
-        .reset_index()
-    )
-    context_df[schemas.CONTEXT_STRING] = context_df[schemas.ALL_CONTEXT].apply(
-        lambda x: sort_context(x)
-    )
-    context_df[schemas.CONTEXT_SIZE] = context_df[schemas.CONTEXT_STRING].apply(
-        lambda x: num_tokens(x)
-    )
-    context_df[schemas.CONTEXT_EXCEED_FLAG] = context_df[schemas.CONTEXT_SIZE].apply(
-        lambda x: x > max_context_tokens
+        context_df.merge(
+            prepped_text_units_df,
+            on=[schemas.TEXT_UNIT_IDS, schemas.COMMUNITY_ID],
+            how="left",
+        )
+        .dropna(subset=[schemas.COMMUNITY_ID, schemas.COMMUNITY_LEVEL])
+        .sort_values(schemas.COMMUNITY_ID, kind="stable")
+    )
+
+    columns = {
+        "id": context_df[schemas.SHORT_ID].tolist(),
+        "text": context_df[schemas.TEXT].tolist(),
+        "entity_degree": context_df[schemas.ENTITY_DEGREE].tolist(),
+    }
+    community_ids = context_df[schemas.COMMUNITY_ID].to_numpy()
+    ranges = community_ranges(community_ids)
+    starts = [start for start, _ in ranges]
+    all_context = np.empty(len(ranges), dtype=object)
+    for index, (start, stop) in enumerate(ranges):
+        all_context[index] = LocalContextRecords(columns, start, stop)
+
+    result_df = pd.DataFrame({
+        schemas.COMMUNITY_ID: community_ids[starts],
+        schemas.COMMUNITY_LEVEL: context_df[schemas.COMMUNITY_LEVEL].to_numpy()[starts],
+        schemas.ALL_CONTEXT: all_context,
+    })
+    result_df[schemas.CONTEXT_STRING] = [
+        sort_context(records) for records in all_context
+    ]
+    result_df[schemas.CONTEXT_SIZE] = result_df[schemas.CONTEXT_STRING].map(num_tokens)
+    result_df[schemas.CONTEXT_EXCEED_FLAG] = (
+        result_df[schemas.CONTEXT_SIZE] > max_context_tokens
     )
 
-    return context_df
+    return result_df
 
 
 def build_level_context(
@@ -140,11 +149,11 @@ def build_level_context(
     )
     valid_context_df = cast(
         "pd.DataFrame",
-        level_context_df[level_context_df[schemas.CONTEXT_EXCEED_FLAG] is False],
+        level_context_df[~level_context_df[schemas.CONTEXT_EXCEED_FLAG].astype(bool)],
     )
     invalid_context_df = cast(
         "pd.DataFrame",
-        level_context_df[level_context_df[schemas.CONTEXT_EXCEED_FLAG] is True],
+        level_context_df[level_context_df[schemas.CONTEXT_EXCEED_FLAG].astype(bool)],
     )
 
     if invalid_context_df.empty:
@@ -199,7 +208,9 @@ def build_level_context(
         .reset_index()
     )
     community_df[schemas.CONTEXT_STRING] = community_df[schemas.ALL_CONTEXT].apply(
-        lambda x: build_mixed_context(x, max_context_tokens)
+        lambda x: build_mixed_context(
+            x, max_context_tokens, sort_local_context=sort_context
+        )
     )
     community_df[schemas.CONTEXT_SIZE] = community_df[schemas.CONTEXT_STRING].apply(
         lambda x: num_tokens(x)
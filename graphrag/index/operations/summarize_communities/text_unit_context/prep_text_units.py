@@ -17,9 +17,9 @@ def prep_text_units(
     node_df: pd.DataFrame,
 ) -> pd.DataFrame:
     """
-    Calculate text unit degree  and concatenate text unit details.
+    Calculate text unit degree per community.
 
-    Returns : dataframe with columns [COMMUNITY_ID, TEXT_UNIT_ID, ALL_DETAILS]
+    Returns : dataframe with columns [COMMUNITY_ID, ID, SHORT_ID, TEXT, ENTITY_DEGREE]
     """
     node_df.drop(columns=["id"], inplace=True)
     node_to_text_ids = node_df.explode(schemas.TEXT_UNIT_IDS).rename(
@@ -33,13 +33,16 @@ def prep_text_units(
         .agg({schemas.NODE_DEGREE: "sum"})
         .reset_index()
     )
-    result_df = text_unit_df.merge(text_unit_degrees, on=schemas.ID, how="left")
-    result_df[schemas.ALL_DETAILS] = result_df.apply(
-        lambda x: {
-            schemas.SHORT_ID: x[schemas.SHORT_ID],
-            schemas.TEXT: x[schemas.TEXT],
-            schemas.ENTITY_DEGREE: x[schemas.NODE_DEGREE],
-        },
-        axis=1,
+    result_df = text_unit_df.loc[:, [schemas.ID, schemas.SHORT_ID, schemas.TEXT]].merge(
+        text_unit_degrees, on=schemas.ID, how="left"
     )
-    return result_df.loc[:, [schemas.COMMUNITY_ID, schemas.ID, schemas.ALL_DETAILS]]
+    return result_df.rename(columns={schemas.NODE_DEGREE: schemas.ENTITY_DEGREE}).loc[
+        :,
+        [
+            schemas.COMMUNITY_ID,
+            schemas.ID,
+            schemas.SHORT_ID,
+            schemas.TEXT,
+            schemas.ENTITY_DEGREE,
+        ],
+    ]
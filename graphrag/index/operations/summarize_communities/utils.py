@@ -3,6 +3,9 @@
 
 """A module containing community report generation utilities."""
 
+from collections.abc import Iterator
+
+import numpy as np
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
@@ -15,3 +18,34 @@ def get_levels(
     levels = df[level_column].dropna().unique()
     levels = [int(lvl) for lvl in levels if lvl != -1]
     return sorted(levels, reverse=True)
+
+
+class LocalContextRecords:
+    """The local context records of a community, materialized from shared columns every time they are iterated.
+
+    Only the position range of the community in the columns is kept, so the records of a community are built when its
+    context is rendered rather than held for every community at once.
+    """
+
+    def __init__(self, columns: dict[str, list], start: int, stop: int):
+        self._columns = columns
+        self._start = start
+        self._stop = stop
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yield a record for every row of the community."""
+        for row in range(self._start, self._stop):
+            yield {key: values[row] for key, values in self._columns.items()}
+
+    def __len__(self) -> int:
+        """Return the number of records of the community."""
+        return self._stop - self._start
+
+
+def community_ranges(community_ids: np.ndarray) -> list[tuple[int, int]]:
+    """Return the start and stop positions of every run of equal community ids."""
+    if len(community_ids) == 0:
+        return []
+    starts = np.flatnonzero(np.r_[True, community_ids[1:] != community_ids[:-1]])
+    stops = np.r_[starts[1:], len(community_ids)]
+    return list(zip(starts.tolist(), stops.tolist(), strict=True))
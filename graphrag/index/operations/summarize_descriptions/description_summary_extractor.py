@@ -4,17 +4,42 @@
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
 import json
+import logging
+import traceback
 from dataclasses import dataclass
 
+from pydantic import BaseModel, Field
+
 from graphrag.index.typing.error_handler import ErrorHandlerFn
 from graphrag.index.utils.tokens import num_tokens_from_string
 from graphrag.language_model.protocol.base import ChatModel
-from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
+from graphrag.prompts.index.summarize_descriptions import (
+    BATCH_SUMMARIZE_PROMPT,
+    SUMMARIZE_PROMPT,
+)
+
+logger = logging.getLogger(__name__)
 
 # these tokens are used in the prompt
 ENTITY_NAME_KEY = "entity_name"
 DESCRIPTION_LIST_KEY = "description_list"
 MAX_LENGTH_KEY = "max_length"
+DESCRIPTION_BATCH_KEY = "description_batch"
+
+
+class DescriptionSummaryModel(BaseModel):
+    """A model for a single summary in the expected batched LLM response shape."""
+
+    id: int = Field(description="The id of the summarized item.")
+    description: str = Field(description="The summary of the item descriptions.")
+
+
+class BatchSummaryResponse(BaseModel):
+    """A model for the expected batched LLM response shape."""
+
+    summaries: list[DescriptionSummaryModel] = Field(
+        description="The summaries of the items in the batch."
+    )
 
 
 @dataclass
@@ -33,6 +58,7 @@ class SummarizeExtractor:
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
+    _batch_summarization_prompt: str
 
     def __init__(
         self,
@@ -41,12 +67,16 @@ class SummarizeExtractor:
         max_input_tokens: int,
         summarization_prompt: str | None = None,
         on_error: ErrorHandlerFn | None = None,
+        batch_summarization_prompt: str | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
         self._model = model_invoker
 
         self._summarization_prompt = summarization_prompt or SUMMARIZE_PROMPT
+        self._batch_summarization_prompt = (
+            batch_summarization_prompt or BATCH_SUMMARIZE_PROMPT
+        )
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length
         self._max_input_tokens = max_input_tokens
@@ -70,6 +100,51 @@ class SummarizeExtractor:
             description=result or "",
         )
 
+    async def summarize_batch(
+        self, items: list[tuple[str | tuple[str, str], list[str]]]
+    ) -> list[SummarizationResult]:
+        """Summarize the descriptions of several entities or relationships with a single structured-output call.
+
+        Items the response does not summarize fall back to the single-item path.
+        """
+        summaries: dict[int, str] = {}
+        try:
+            response = await self._model.achat(
+                self._batch_summarization_prompt.format(**{
+                    DESCRIPTION_BATCH_KEY: json.dumps(
+                        [
+                            {
+                                "id": index,
+                                "entities": id,
+                                "descriptions": sorted(descriptions),
+                            }
+                            for index, (id, descriptions) in enumerate(items)
+                        ],
+                        ensure_ascii=False,
+                    ),
+                    MAX_LENGTH_KEY: self._max_summary_length,
+                }),
+                json=True,
+                name="summarize_batch",
+                json_model=BatchSummaryResponse,
+            )
+            parsed = response.parsed_response
+            if parsed is not None:
+                summaries = {
+                    summary.id: summary.description for summary in parsed.summaries
+                }
+        except Exception as e:
+            logger.exception("error summarizing description batch")
+            self._on_error(e, traceback.format_exc(), {"batch_size": len(items)})
+
+        results = []
+        for index, (id, descriptions) in enumerate(items):
+            if summaries.get(index):
+                results.append(SummarizationResult(id=id, description=summaries[index]))
+            else:
+                results.append(await self(id, descriptions))
+        return results
+
     async def _summarize_descriptions(
         self, id: str | tuple[str, str], descriptions: list[str]
     ) -> str:
@@ -27,17 +27,25 @@ async def run_graph_intelligence(
     args: StrategyConfig,
 ) -> SummarizedDescriptionResult:
     """Run the graph intelligence entity extraction strategy."""
-    llm_config = LanguageModelConfig(**args["llm"])
-    llm = ModelManager().get_or_create_chat_model(
-        name="summarize_descriptions",
-        model_type=llm_config.type,
-        config=llm_config,
-        cache=cache,
-    )
-
+    llm = _get_model(cache, args)
     return await run_summarize_descriptions(llm, id, descriptions, args)
 
 
+async def run_graph_intelligence_batch(
+    items: list[tuple[str | tuple[str, str], list[str]]],
+    cache: PipelineCache,
+    args: StrategyConfig,
+) -> list[SummarizedDescriptionResult]:
+    """Run the graph intelligence description summarization strategy on a batch of small items."""
+    llm = _get_model(cache, args)
+    extractor = _create_extractor(llm, args)
+    results = await extractor.summarize_batch(items)
+    return [
+        SummarizedDescriptionResult(id=result.id, description=result.description)
+        for result in results
+    ]
+
+
 async def run_summarize_descriptions(
     model: ChatModel,
     id: str | tuple[str, str],
@@ -45,13 +53,31 @@ async def run_summarize_descriptions(
     args: StrategyConfig,
 ) -> SummarizedDescriptionResult:
     """Run the entity extraction chain."""
+    extractor = _create_extractor(model, args)
+    result = await extractor(id=id, descriptions=descriptions)
+    return SummarizedDescriptionResult(id=result.id, description=result.description)
+
+
+def _get_model(cache: PipelineCache, args: StrategyConfig) -> ChatModel:
+    llm_config = LanguageModelConfig(**args["llm"])
+    return ModelManager().get_or_create_chat_model(
+        name="summarize_descriptions",
+        model_type=llm_config.type,
+        config=llm_config,
+        cache=cache,
+    )
+
+
+def _create_extractor(model: ChatModel, args: StrategyConfig) -> SummarizeExtractor:
     # Extraction Arguments
     summarize_prompt = args.get("summarize_prompt", None)
+    batch_summarize_prompt = args.get("batch_summarize_prompt", None)
     max_input_tokens = args["max_input_tokens"]
     max_summary_length = args["max_summary_length"]
-    extractor = SummarizeExtractor(
+    return SummarizeExtractor(
         model_invoker=model,
         summarization_prompt=summarize_prompt,
+        batch_summarization_prompt=batch_summarize_prompt,
         on_error=lambda e, stack, details: logger.error(
             "Entity Extraction Error",
             exc_info=e,
@@ -60,6 +86,3 @@ async def run_summarize_descriptions(
         max_summary_length=max_summary_length,
         max_input_tokens=max_input_tokens,
     )
-
-    result = await extractor(id=id, descriptions=descriptions)
-    return SummarizedDescriptionResult(id=result.id, description=result.description)
@@ -11,10 +11,14 @@ import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.index.operations.summarize_descriptions.typing import (
+    BatchSummarizationStrategy,
     SummarizationStrategy,
+    SummarizedDescriptionResult,
     SummarizeStrategyType,
 )
+from graphrag.index.utils.tokens import num_tokens_from_string
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
 logger = logging.getLogger(__name__)
@@ -28,13 +32,26 @@ async def summarize_descriptions(
     strategy: dict[str, Any] | None = None,
     num_threads: int = 4,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Summarize entity and relationship descriptions from an entity graph, using a language model."""
+    """Summarize entity and relationship descriptions from an entity graph, using a language model.
+
+    Entities and relationships with a single unique description keep it as is, without calling the model.
+    If batching is configured, items whose descriptions fit in `batch_max_item_tokens` are packed into batches of up to
+    `batch_max_input_tokens` and summarized with one call per batch. Larger items are summarized one at a time.
+    """
     logger.debug("summarize_descriptions strategy=%s", strategy)
     strategy = strategy or {}
-    strategy_exec = load_strategy(
-        strategy.get("type", SummarizeStrategyType.graph_intelligence)
-    )
+    strategy_type = strategy.get("type", SummarizeStrategyType.graph_intelligence)
+    strategy_exec = load_strategy(strategy_type)
     strategy_config = {**strategy}
+    batch_max_input_tokens = strategy_config.get(
+        "batch_max_input_tokens",
+        graphrag_config_defaults.summarize_descriptions.batch_max_input_tokens,
+    )
+    batch_max_item_tokens = strategy_config.get(
+        "batch_max_item_tokens",
+        graphrag_config_defaults.summarize_descriptions.batch_max_item_tokens,
+    )
+    batch_strategy_exec = load_batch_strategy(strategy_type)
 
     async def get_summarized(
         nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
@@ -47,45 +64,71 @@ async def summarize_descriptions(
             description="Summarize entity/relationship description progress: ",
         )
 
-        node_futures = [
-            do_summarize_descriptions(
+        items: list[tuple[str | tuple[str, str], list[str]]] = [
+            (
                 str(row.title),  # type: ignore
                 sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
             )
             for row in nodes.itertuples(index=False)
         ]
+        items.extend(
+            (
+                (str(row.source), str(row.target)),  # type: ignore
+                sorted(set(row.description)),  # type: ignore
+            )
+            for row in edges.itertuples(index=False)
+        )
 
-        node_results = await asyncio.gather(*node_futures)
+        results: list[SummarizedDescriptionResult | None] = [None] * len(items)
+        futures = []
+        batch: list[int] = []
+        batch_tokens = 0
+        for index, (id, descriptions) in enumerate(items):
+            if len(descriptions) <= 1:
+                # there is nothing to summarize, so don't spend a model call on it
+                results[index] = SummarizedDescriptionResult(
+                    id=id, description=descriptions[0] if descriptions else ""
+                )
+                ticker(1)
+                continue
+
+            if batch_max_input_tokens > 0:
+                tokens = sum(num_tokens_from_string(d) for d in descriptions)
+                if tokens <= batch_max_item_tokens:
+                    if batch and batch_tokens + tokens > batch_max_input_tokens:
+                        futures.append(
+                            do_summarize_batch(batch, items, results, ticker, semaphore)
+                        )
+                        batch, batch_tokens = [], 0
+                    batch.append(index)
+                    batch_tokens += tokens
+                    continue
+
+            futures.append(
+                do_summarize_descriptions(index, items, results, ticker, semaphore)
+            )
+        if batch:
+            futures.append(do_summarize_batch(batch, items, results, ticker, semaphore))
+
+        await asyncio.gather(*futures)
 
         node_descriptions = [
             {
                 "title": result.id,
                 "description": result.description,
             }
-            for result in node_results
+            for result in results[: len(nodes)]
+            if result is not None
         ]
 
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row.source), str(row.target)),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in edges.itertuples(index=False)
-        ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
         edge_descriptions = [
             {
                 "source": result.id[0],
                 "target": result.id[1],
                 "description": result.description,
             }
-            for result in edge_results
+            for result in results[len(nodes) :]
+            if result is not None
         ]
 
         entity_descriptions = pd.DataFrame(node_descriptions)
@@ -93,15 +136,33 @@ async def summarize_descriptions(
         return entity_descriptions, relationship_descriptions
 
     async def do_summarize_descriptions(
-        id: str | tuple[str, str],
-        descriptions: list[str],
+        index: int,
+        items: list[tuple[str | tuple[str, str], list[str]]],
+        results: list[SummarizedDescriptionResult | None],
         ticker: ProgressTicker,
         semaphore: asyncio.Semaphore,
     ):
+        id, descriptions = items[index]
         async with semaphore:
-            results = await strategy_exec(id, descriptions, cache, strategy_config)
+            results[index] = await strategy_exec(
+                id, descriptions, cache, strategy_config
+            )
             ticker(1)
-        return results
+
+    async def do_summarize_batch(
+        batch: list[int],
+        items: list[tuple[str | tuple[str, str], list[str]]],
+        results: list[SummarizedDescriptionResult | None],
+        ticker: ProgressTicker,
+        semaphore: asyncio.Semaphore,
+    ):
+        async with semaphore:
+            batch_results = await batch_strategy_exec(
+                [items[index] for index in batch], cache, strategy_config
+            )
+            for index, result in zip(batch, batch_results, strict=True):
+                results[index] = result
+            ticker(len(batch))
 
     semaphore = asyncio.Semaphore(num_threads)
 
@@ -120,3 +181,19 @@ def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy
         case _:
             msg = f"Unknown strategy: {strategy_type}"
             raise ValueError(msg)
+
+
+def load_batch_strategy(
+    strategy_type: SummarizeStrategyType,
+) -> BatchSummarizationStrategy:
+    """Load batch strategy method definition."""
+    match strategy_type:
+        case SummarizeStrategyType.graph_intelligence:
+            from graphrag.index.operations.summarize_descriptions.graph_intelligence_strategy import (
+                run_graph_intelligence_batch,
+            )
+
+            return run_graph_intelligence_batch
+        case _:
+            msg = f"Unknown strategy: {strategy_type}"
+            raise ValueError(msg)
@@ -31,6 +31,15 @@ SummarizationStrategy = Callable[
     Awaitable[SummarizedDescriptionResult],
 ]
 
+BatchSummarizationStrategy = Callable[
+    [
+        list[tuple[str | tuple[str, str], list[str]]],
+        PipelineCache,
+        StrategyConfig,
+    ],
+    Awaitable[list[SummarizedDescriptionResult]],
+]
+
 
 class DescriptionSummarizeRow(NamedTuple):
     """DescriptionSummarizeRow class definition."""
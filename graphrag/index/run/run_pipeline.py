@@ -110,7 +110,9 @@ async def _run_pipeline(
             yield PipelineRunResult(
                 workflow=name, result=result.result, state=context.state, errors=None
             )
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
+            context.stats.workflows.setdefault(name, {})["overall"] = (
+                time.time() - work_time
+            )
             if result.stop:
                 logger.info("Halting pipeline at workflow request")
                 break
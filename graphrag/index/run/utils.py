@@ -3,6 +3,8 @@
 
 """Utility functions for the GraphRAG run module."""
 
+from typing import Any
+
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
@@ -12,6 +14,7 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.state import PipelineState
 from graphrag.index.typing.stats import PipelineRunStats
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.api import create_storage_from_config
@@ -59,3 +62,21 @@ def get_update_storages(
     previous_storage = timestamped_storage.child("previous")
 
     return output_storage, previous_storage, delta_storage
+
+
+def create_row_checkpoint(
+    config: GraphRagConfig,
+    storage: PipelineStorage,
+    name: str,
+    signature: Any = None,
+) -> RowCheckpoint | None:
+    """Create a row checkpoint for a workflow operation, if checkpoints are enabled."""
+    if not config.checkpoints.enabled:
+        return None
+    return RowCheckpoint(
+        storage,
+        name,
+        signature=signature,
+        flush_rows=config.checkpoints.flush_rows,
+        flush_interval=config.checkpoints.flush_interval,
+    )
@@ -3,12 +3,18 @@
 
 """Dataframe operations and utils for Incremental Indexing."""
 
+import logging
+
+import numpy as np
 import pandas as pd
 
 from graphrag.data_model.schemas import (
     COMMUNITIES_FINAL_COLUMNS,
     COMMUNITY_REPORTS_FINAL_COLUMNS,
 )
+from graphrag.index.utils.compact_graph import CompactGraph
+
+logger = logging.getLogger(__name__)
 
 
 def _update_and_merge_communities(
@@ -149,3 +155,201 @@ def _update_and_merge_community_reports(
     ]
 
     return merged_community_reports.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
+
+
+def _select_communities_to_recluster(
+    old_communities: pd.DataFrame,
+    merged_entities: pd.DataFrame,
+    merged_relationships: pd.DataFrame,
+    delta_relationships: pd.DataFrame,
+    delta_entities: pd.DataFrame,
+    use_lcc: bool,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Select the part of the merged graph touched by the delta entities and relationships.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The old communities.
+    merged_entities : pd.DataFrame
+        The merged entities.
+    merged_relationships : pd.DataFrame
+        The merged relationships.
+    delta_relationships : pd.DataFrame
+        The delta relationships.
+    delta_entities : pd.DataFrame
+        The delta entities, which touch their community even without a delta relationship.
+    use_lcc : bool
+        Whether communities only cover the largest connected component.
+
+    Returns
+    -------
+    pd.DataFrame
+        The old communities whose root community has no touched node, kept as they are.
+    pd.DataFrame
+        The relationships between the nodes to re-cluster: the nodes of the touched root communities, and the nodes that
+        belong to no community yet.
+    """
+    old_communities = old_communities.astype({"community": int, "parent": int})
+
+    # map every community to the root community of its tree
+    ordered = old_communities.sort_values("level")
+    root_of: dict[int, int] = {}
+    for community, parent in zip(
+        ordered["community"].tolist(), ordered["parent"].tolist(), strict=True
+    ):
+        root_of[community] = root_of.get(parent, int(community))
+
+    titles = merged_entities.set_index("id")["title"]
+    roots = old_communities.loc[
+        old_communities["parent"] == -1, ["community", "entity_ids"]
+    ].explode("entity_ids")
+    roots["title"] = roots["entity_ids"].map(titles)
+
+    touched = pd.unique(
+        np.concatenate([
+            delta_relationships.loc[:, ["source", "target"]].to_numpy().ravel(),
+            delta_entities["title"].to_numpy(),
+        ])
+    )
+    affected = roots.loc[roots["title"].isin(touched), "community"].unique()
+    kept = ~np.isin(
+        [root_of[community] for community in old_communities["community"].tolist()],
+        affected,
+    )
+    clustered_titles = roots.loc[~roots["community"].isin(affected), "title"]
+
+    graph = CompactGraph.from_dataframe(merged_relationships)
+    node_mask = (
+        graph.largest_connected_component_mask()
+        if use_lcc
+        else np.ones(graph.num_nodes, dtype=bool)
+    )
+    node_mask &= ~pd.Index(graph.nodes).isin(clustered_titles)
+    titles_to_recluster = graph.nodes[node_mask].tolist()
+
+    logger.info(
+        "Re-clustering %d nodes touched by the update, keeping %d of %d communities",
+        len(titles_to_recluster),
+        kept.sum(),
+        len(old_communities),
+    )
+    relationships = merged_relationships.loc[
+        merged_relationships["source"].isin(titles_to_recluster)
+        & merged_relationships["target"].isin(titles_to_recluster)
+    ]
+    return old_communities.loc[kept], relationships.reset_index(drop=True)
+
+
+def _merge_reclustered_communities(
+    old_communities: pd.DataFrame,
+    kept_communities: pd.DataFrame,
+    reclustered_communities: pd.DataFrame,
+) -> tuple[pd.DataFrame, list[int]]:
+    """Merge the kept old communities with the re-clustered ones.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The old communities.
+    kept_communities : pd.DataFrame
+        The old communities kept as they are.
+    reclustered_communities : pd.DataFrame
+        The communities of the re-clustered part of the graph.
+
+    Returns
+    -------
+    pd.DataFrame
+        The merged communities. Kept communities keep their ids, and re-clustered ones are numbered after every old id.
+    list[int]
+        The ids of the re-clustered communities, whose membership changed.
+    """
+    kept_communities = kept_communities.copy()
+    reclustered_communities = reclustered_communities.copy()
+    for communities in (kept_communities, reclustered_communities):
+        if "size" not in communities.columns:
+            communities["size"] = None
+        if "period" not in communities.columns:
+            communities["period"] = None
+
+    offset = old_communities["community"].astype(int).max() + 1
+    reclustered_communities["community"] = (
+        reclustered_communities["community"].astype(int) + offset
+    )
+    parent = reclustered_communities["parent"].astype(int)
+    reclustered_communities["parent"] = parent.where(parent == -1, parent + offset)
+    reclustered_communities["children"] = reclustered_communities["children"].apply(
+        lambda children: [child + offset for child in children]
+    )
+
+    merged_communities = pd.concat(
+        [kept_communities, reclustered_communities], ignore_index=True, copy=False
+    )
+    merged_communities["title"] = "Community " + merged_communities["community"].astype(
+        str
+    )
+    merged_communities["human_readable_id"] = merged_communities["community"]
+
+    changed_communities = reclustered_communities["community"].tolist()
+    removed = len(old_communities) - len(kept_communities)
+    logger.info(
+        "Replaced %d communities with %d re-clustered communities",
+        removed,
+        len(changed_communities),
+    )
+    return merged_communities.loc[:, COMMUNITIES_FINAL_COLUMNS], changed_communities
+
+
+def _merge_changed_community_reports(
+    old_community_reports: pd.DataFrame,
+    changed_community_reports: pd.DataFrame,
+    merged_communities: pd.DataFrame,
+) -> pd.DataFrame:
+    """Merge the old reports of the kept communities with the reports of the changed communities.
+
+    Parameters
+    ----------
+    old_community_reports : pd.DataFrame
+        The old community reports.
+    changed_community_reports : pd.DataFrame
+        The reports generated for the changed communities.
+    merged_communities : pd.DataFrame
+        The merged communities.
+
+    Returns
+    -------
+    pd.DataFrame
+        The updated community reports.
+    """
+    old_community_reports = old_community_reports.copy()
+    changed_community_reports = changed_community_reports.copy()
+    for reports in (old_community_reports, changed_community_reports):
+        if "size" not in reports.columns:
+            reports["size"] = None
+        if "period" not in reports.columns:
+            reports["period"] = None
+
+    old_community_reports["community"] = old_community_reports["community"].astype(int)
+    kept_community_reports = old_community_reports.loc[
+        old_community_reports["community"].isin(merged_communities["community"])
+        & ~old_community_reports["community"].isin(
+            changed_community_reports["community"]
+        )
+    ]
+
+    merged_community_reports = pd.concat(
+        [kept_community_reports, changed_community_reports],
+        ignore_index=True,
+        copy=False,
+    )
+
+    # Maintain type compat with query
+    merged_community_reports["community"] = merged_community_reports[
+        "community"
+    ].astype(int)
+    # Re-assign the human_readable_id
+    merged_community_reports["human_readable_id"] = merged_community_reports[
+        "community"
+    ]
+
+    return merged_community_reports.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
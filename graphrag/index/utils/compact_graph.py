@@ -0,0 +1,197 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the CompactGraph class, an integer-indexed graph built straight from dataframes."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_array
+
+
+@dataclass
+class CompactGraph:
+    """An undirected graph stored as edge arrays over integer node indices.
+
+    Nodes are indexed in order of first appearance, and each undirected edge is kept once, in the orientation and position of
+    its first appearance with the weight of its last appearance. This matches the node and edge order of a networkx graph built
+    with `nx.from_pandas_edgelist` from the same rows, so results stay identical when converting to networkx.
+    """
+
+    nodes: np.ndarray
+    """Node labels, indexed by node id."""
+    sources: np.ndarray
+    """Node id of the source of each edge."""
+    targets: np.ndarray
+    """Node id of the target of each edge."""
+    weights: np.ndarray
+    """Weight of each edge."""
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        edges: pd.DataFrame,
+        source: str = "source",
+        target: str = "target",
+        weight: str | None = "weight",
+        nodes: Iterable | None = None,
+    ) -> "CompactGraph":
+        """Create a graph from an edge list dataframe, optionally adding the given nodes if they are missing."""
+        endpoints = np.column_stack([
+            edges[source].to_numpy(dtype=object),
+            edges[target].to_numpy(dtype=object),
+        ])
+        labels = endpoints.ravel()
+        if nodes is not None:
+            labels = np.concatenate([labels, np.asarray(list(nodes), dtype=object)])
+        labels = np.asarray(pd.unique(labels), dtype=object)
+        index = pd.Index(labels)
+        source_ids = index.get_indexer(endpoints[:, 0])
+        target_ids = index.get_indexer(endpoints[:, 1])
+        weights = (
+            edges[weight].to_numpy(dtype=float)
+            if weight is not None
+            else np.ones(len(edges))
+        )
+
+        # key every edge by its unordered pair of endpoints to drop repeated undirected edges
+        low = np.minimum(source_ids, target_ids).astype(np.int64)
+        high = np.maximum(source_ids, target_ids).astype(np.int64)
+        keys = low * max(len(labels), 1) + high
+        _, first = np.unique(keys, return_index=True)
+        _, last_reversed = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - last_reversed
+        order = np.argsort(first, kind="stable")
+        first = first[order]
+        last = last[order]
+
+        return cls(
+            nodes=labels,
+            sources=source_ids[first].astype(np.int64),
+            targets=target_ids[first].astype(np.int64),
+            weights=weights[last],
+        )
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph, weight: str = "weight") -> "CompactGraph":
+        """Create a graph from a networkx graph, keeping its node and edge order. Edges without a weight get a weight of 1."""
+        nodes = np.empty(graph.number_of_nodes(), dtype=object)
+        nodes[:] = list(graph.nodes)
+        index = pd.Index(nodes)
+        edges = list(graph.edges(data=weight, default=1.0))
+        return cls(
+            nodes=nodes,
+            sources=index.get_indexer([edge[0] for edge in edges]).astype(np.int64),
+            targets=index.get_indexer([edge[1] for edge in edges]).astype(np.int64),
+            weights=np.asarray([edge[2] for edge in edges], dtype=float),
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """Return the number of nodes."""
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        """Return the number of edges."""
+        return len(self.sources)
+
+    def degree(self) -> np.ndarray:
+        """Return the degree of every node. Self-loops count twice, as in networkx."""
+        return np.bincount(self.sources, minlength=self.num_nodes) + np.bincount(
+            self.targets, minlength=self.num_nodes
+        )
+
+    def edge_combined_degree(self) -> np.ndarray:
+        """Return the sum of the degrees of the endpoints of every edge."""
+        degree = self.degree()
+        return degree[self.sources] + degree[self.targets]
+
+    def to_csr(self) -> "csr_array":
+        """Return the symmetric weighted adjacency matrix in CSR format."""
+        from scipy.sparse import coo_array
+
+        loops = self.sources == self.targets
+        rows = np.concatenate([self.sources, self.targets[~loops]])
+        cols = np.concatenate([self.targets, self.sources[~loops]])
+        data = np.concatenate([self.weights, self.weights[~loops]])
+        return coo_array(
+            (data, (rows, cols)), shape=(self.num_nodes, self.num_nodes)
+        ).tocsr()
+
+    def connected_components(self) -> np.ndarray:
+        """Return the component of every node, numbered in order of the first node of each component."""
+        from scipy.sparse.csgraph import connected_components
+
+        _, labels = connected_components(self.to_csr(), directed=False)
+        # renumber the components by their first node, like networkx reports them
+        _, first_node, inverse = np.unique(
+            labels, return_index=True, return_inverse=True
+        )
+        rank = np.empty(len(first_node), dtype=np.int64)
+        rank[np.argsort(first_node, kind="stable")] = np.arange(len(first_node))
+        return rank[inverse]
+
+    def largest_connected_component_mask(self) -> np.ndarray:
+        """Return a mask of the nodes in the largest connected component, the first one found if several have the same size."""
+        if self.num_nodes == 0:
+            return np.zeros(0, dtype=bool)
+        components = self.connected_components()
+        return components == np.argmax(np.bincount(components))
+
+    def largest_connected_component(self) -> "CompactGraph":
+        """Return the subgraph of the largest connected component, the first one found if several have the same size."""
+        if self.num_nodes == 0:
+            return self
+        return self.subgraph(self.largest_connected_component_mask())
+
+    def subgraph(self, node_mask: np.ndarray) -> "CompactGraph":
+        """Return the subgraph of the selected nodes, keeping node and edge order."""
+        new_ids = np.cumsum(node_mask) - 1
+        edge_mask = node_mask[self.sources] & node_mask[self.targets]
+        return CompactGraph(
+            nodes=self.nodes[node_mask],
+            sources=new_ids[self.sources[edge_mask]],
+            targets=new_ids[self.targets[edge_mask]],
+            weights=self.weights[edge_mask],
+        )
+
+    def edge_subgraph(self, edge_mask: np.ndarray) -> "CompactGraph":
+        """Return the graph with only the selected edges, keeping all nodes."""
+        return CompactGraph(
+            nodes=self.nodes,
+            sources=self.sources[edge_mask],
+            targets=self.targets[edge_mask],
+            weights=self.weights[edge_mask],
+        )
+
+    def to_networkx(self, edge_attr: str = "weight") -> nx.Graph:
+        """Convert to a networkx graph, for algorithms that require one."""
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes.tolist())
+        labels = self.nodes
+        graph.add_edges_from(
+            zip(
+                labels[self.sources].tolist(),
+                labels[self.targets].tolist(),
+                ({edge_attr: weight} for weight in self.weights.tolist()),
+                strict=True,
+            )
+        )
+        return graph
+
+    def to_dataframe(
+        self, source: str = "source", target: str = "target", weight: str = "weight"
+    ) -> pd.DataFrame:
+        """Return the edges as a dataframe."""
+        return pd.DataFrame({
+            source: self.nodes[self.sources],
+            target: self.nodes[self.targets],
+            weight: self.weights,
+        })
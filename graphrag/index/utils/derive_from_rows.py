@@ -15,6 +15,7 @@ import pandas as pd
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
@@ -38,17 +39,36 @@ async def derive_from_rows(
     num_threads: int = 4,
     async_type: AsyncType = AsyncType.AsyncIO,
     progress_msg: str = "",
+    checkpoint: RowCheckpoint | None = None,
+    checkpoint_key: str | Callable[[pd.Series], str] = "id",
 ) -> list[ItemType | None]:
-    """Apply a generic transform function to each row. Any errors will be reported and thrown."""
+    """Apply a generic transform function to each row. Any errors will be reported and thrown.
+
+    If a checkpoint is provided, rows whose key already has a checkpointed result are not transformed again,
+    and new results are added to the checkpoint as they complete. The key is the value of the `checkpoint_key` column,
+    or the result of calling `checkpoint_key` with the row.
+    """
     callbacks = callbacks or NoopWorkflowCallbacks()
     match async_type:
         case AsyncType.AsyncIO:
             return await derive_from_rows_asyncio(
-                input, transform, callbacks, num_threads, progress_msg
+                input,
+                transform,
+                callbacks,
+                num_threads,
+                progress_msg,
+                checkpoint,
+                checkpoint_key,
             )
         case AsyncType.Threaded:
             return await derive_from_rows_asyncio_threads(
-                input, transform, callbacks, num_threads, progress_msg
+                input,
+                transform,
+                callbacks,
+                num_threads,
+                progress_msg,
+                checkpoint,
+                checkpoint_key,
             )
         case _:
             msg = f"Unsupported scheduling type {async_type}"
@@ -64,6 +84,8 @@ async def derive_from_rows_asyncio_threads(
     callbacks: WorkflowCallbacks,
     num_threads: int | None = 4,
     progress_msg: str = "",
+    checkpoint: RowCheckpoint | None = None,
+    checkpoint_key: str | Callable[[pd.Series], str] = "id",
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
@@ -84,7 +106,7 @@ async def derive_from_rows_asyncio_threads(
         return await asyncio.gather(*[execute_task(task) for task in tasks])
 
     return await _derive_from_rows_base(
-        input, transform, callbacks, gather, progress_msg
+        input, transform, callbacks, gather, progress_msg, checkpoint, checkpoint_key
     )
 
 
@@ -97,6 +119,8 @@ async def derive_from_rows_asyncio(
     callbacks: WorkflowCallbacks,
     num_threads: int = 4,
     progress_msg: str = "",
+    checkpoint: RowCheckpoint | None = None,
+    checkpoint_key: str | Callable[[pd.Series], str] = "id",
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
@@ -118,7 +142,7 @@ async def derive_from_rows_asyncio(
         return await asyncio.gather(*tasks)
 
     return await _derive_from_rows_base(
-        input, transform, callbacks, gather, progress_msg
+        input, transform, callbacks, gather, progress_msg, checkpoint, checkpoint_key
     )
 
 
@@ -134,6 +158,8 @@ async def _derive_from_rows_base(
     callbacks: WorkflowCallbacks,
     gather: GatherFn[ItemType],
     progress_msg: str = "",
+    checkpoint: RowCheckpoint | None = None,
+    checkpoint_key: str | Callable[[pd.Series], str] = "id",
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
@@ -144,12 +170,22 @@ async def _derive_from_rows_base(
         callbacks.progress, num_total=len(input), description=progress_msg
     )
     errors: list[tuple[BaseException, str]] = []
+    completed = await checkpoint.load() if checkpoint is not None else {}
 
     async def execute(row: tuple[Any, pd.Series]) -> ItemType | None:
         try:
+            key = (
+                _checkpoint_key(row[1], checkpoint_key)
+                if checkpoint is not None
+                else None
+            )
+            if key is not None and key in completed:
+                return cast("ItemType", completed[key])
             result = transform(row[1])
             if inspect.iscoroutine(result):
                 result = await result
+            if checkpoint is not None and key is not None and result is not None:
+                await checkpoint.add(key, result)
         except Exception as e:  # noqa: BLE001
             errors.append((e, traceback.format_exc()))
             return None
@@ -159,6 +195,8 @@ async def _derive_from_rows_base(
             tick(1)
 
     result = await gather(execute)
+    if checkpoint is not None:
+        await checkpoint.flush()
 
     tick.done()
 
@@ -171,3 +209,11 @@ async def _derive_from_rows_base(
         raise ParallelizationError(len(errors), errors[0][1])
 
     return result
+
+
+def _checkpoint_key(
+    row: pd.Series, checkpoint_key: str | Callable[[pd.Series], str]
+) -> str:
+    if callable(checkpoint_key):
+        return checkpoint_key(row)
+    return str(row[checkpoint_key])
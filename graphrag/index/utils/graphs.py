@@ -170,10 +170,23 @@ def calculate_pmi_edge_weights(
     p(x) = freq_occurrence(x) / total_freq_occurrences.
 
     """
-    copied_nodes_df = nodes_df[[node_name_col, node_freq_col]]
-
     total_edge_weights = edges_df[edge_weight_col].sum()
     total_freq_occurrences = nodes_df[node_freq_col].sum()
+    node_names = pd.Index(nodes_df[node_name_col])
+    if node_names.is_unique:
+        # look the node occurrences up by position rather than merging the node table in twice
+        prop_occurrence = np.append(
+            nodes_df[node_freq_col].to_numpy() / total_freq_occurrences, np.nan
+        )
+        prop_weight = edges_df[edge_weight_col].to_numpy() / total_edge_weights
+        source_prop = prop_occurrence[node_names.get_indexer(edges_df[edge_source_col])]
+        target_prop = prop_occurrence[node_names.get_indexer(edges_df[edge_target_col])]
+        return edges_df.reset_index(drop=True).assign(**{
+            edge_weight_col: prop_weight
+            * np.log2(prop_weight / (source_prop * target_prop))
+        })
+
+    copied_nodes_df = nodes_df[[node_name_col, node_freq_col]]
     copied_nodes_df["prop_occurrence"] = (
         copied_nodes_df[node_freq_col] / total_freq_occurrences
     )
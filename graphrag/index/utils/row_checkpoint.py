@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the RowCheckpoint class, used to resume long-running row operations."""
+
+import asyncio
+import json
+import logging
+import time
+from hashlib import sha256
+from typing import Any
+
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+logger = logging.getLogger(__name__)
+
+
+class RowCheckpoint:
+    """Periodically persists completed row results to storage in shards.
+
+    Row results must be JSON serializable. A restarted operation loads the shards and only replays the rows that are missing.
+    Shards are tagged with a signature of the operation settings, and are discarded if the settings change.
+    """
+
+    def __init__(
+        self,
+        storage: PipelineStorage,
+        name: str,
+        signature: Any = None,
+        flush_rows: int = 100,
+        flush_interval: float = 60.0,
+    ):
+        """Create a checkpoint that writes shards named '<name>.checkpoint.<n>.json' to storage."""
+        self._storage = storage
+        self._name = name
+        self._signature = sha256(
+            json.dumps(signature, sort_keys=True, default=str).encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._completed: dict[str, Any] | None = None
+        self._pending: dict[str, Any] = {}
+        self._num_shards = 0
+        self._last_flush = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def load(self) -> dict[str, Any]:
+        """Load the results of all previously completed rows, keyed by row key."""
+        if self._completed is not None:
+            return self._completed
+
+        self._completed = {}
+        while await self._storage.has(self._shard_key(self._num_shards)):
+            shard = json.loads(
+                await self._storage.get(self._shard_key(self._num_shards))
+            )
+            if shard["signature"] != self._signature:
+                logger.warning(
+                    "Discarding %s checkpoint created with different settings",
+                    self._name,
+                )
+                await self.clear()
+                self._completed = {}
+                return self._completed
+            self._completed.update(shard["results"])
+            self._num_shards += 1
+
+        if self._completed:
+            logger.info(
+                "Resuming %s from checkpoint with %d completed rows",
+                self._name,
+                len(self._completed),
+            )
+        return self._completed
+
+    async def add(self, key: str, result: Any) -> None:
+        """Record the result of a completed row, flushing a shard if due."""
+        self._pending[key] = result
+        if (
+            len(self._pending) >= self._flush_rows
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending row results to a new shard."""
+        async with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            shard_key = self._shard_key(self._num_shards)
+            self._num_shards += 1
+            self._last_flush = time.monotonic()
+            await self._storage.set(
+                shard_key,
+                json.dumps(
+                    {"signature": self._signature, "results": pending},
+                    ensure_ascii=False,
+                    default=_to_builtin,
+                ),
+            )
+
+    async def clear(self) -> None:
+        """Delete all shards, typically once the operation output has been written."""
+        async with self._lock:
+            index = 0
+            while await self._storage.has(self._shard_key(index)):
+                await self._storage.delete(self._shard_key(index))
+                index += 1
+            self._num_shards = 0
+            self._pending = {}
+            self._completed = None
+
+    def _shard_key(self, index: int) -> str:
+        return f"{self._name}.checkpoint.{index}.json"
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert numpy scalars and arrays found in row results to builtin types."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
@@ -4,13 +4,147 @@
 """A module for producing a stable largest connected component, i.e. same input graph == same output lcc."""
 
 import html
+from itertools import pairwise
 from typing import Any, cast
 
 import networkx as nx
+import numpy as np
+import pandas as pd
+
+from graphrag.index.utils.compact_graph import CompactGraph
 
 
 def stable_largest_connected_component(graph: nx.Graph) -> nx.Graph:
-    """Return the largest connected component of the graph, with nodes and edges sorted in a stable way."""
+    """Return the largest connected component of the graph, with nodes and edges sorted in a stable way.
+
+    The component is found and sorted on integer node ids, and names are normalized in one pass over the nodes. Multigraphs,
+    and graphs where different nodes share a name once normalized, go through networkx so that they are merged the same way.
+    """
+    if graph.is_multigraph():
+        return _stable_largest_connected_component_networkx(graph)
+
+    nodes = np.empty(graph.number_of_nodes(), dtype=object)
+    nodes[:] = list(graph.nodes)
+    edges = list(graph.edges(data=True))
+    index = pd.Index(nodes)
+    sources = index.get_indexer([edge[0] for edge in edges]).astype(np.int64)
+    targets = index.get_indexer([edge[1] for edge in edges]).astype(np.int64)
+
+    node_mask = CompactGraph(
+        nodes=nodes, sources=sources, targets=targets, weights=np.ones(len(edges))
+    ).largest_connected_component_mask()
+    names = _normalize_names(nodes[node_mask])
+    if len(pd.unique(names)) < len(names):
+        return _stable_largest_connected_component_networkx(graph)
+
+    edge_mask = node_mask[sources] & node_mask[targets]
+    new_ids = np.cumsum(node_mask) - 1
+    node_order, edge_sources, edge_targets, edge_order = _stable_order(
+        names,
+        new_ids[sources[edge_mask]],
+        new_ids[targets[edge_mask]],
+        directed=graph.is_directed(),
+    )
+
+    node_data = [graph.nodes[node] for node in nodes[node_mask].tolist()]
+    edge_data = [edge[2] for edge, keep in zip(edges, edge_mask, strict=True) if keep]
+    fixed_graph = nx.DiGraph() if graph.is_directed() else nx.Graph()
+    fixed_graph.add_nodes_from(
+        (names[node], node_data[node]) for node in node_order.tolist()
+    )
+    fixed_graph.add_edges_from(
+        (names[source], names[target], edge_data[edge])
+        for source, target, edge in zip(
+            edge_sources.tolist(),
+            edge_targets.tolist(),
+            edge_order.tolist(),
+            strict=True,
+        )
+    )
+    return fixed_graph
+
+
+def stable_compact_largest_connected_component(graph: CompactGraph) -> CompactGraph:
+    """Return the largest connected component of a compact graph with normalized names, in the order of `stable_largest_connected_component`."""
+    graph = graph.largest_connected_component()
+    names = _normalize_names(graph.nodes)
+    if len(pd.unique(names)) < len(names):
+        # merge the nodes whose names collide after normalization, as relabeling a networkx graph does
+        graph = CompactGraph.from_dataframe(
+            pd.DataFrame({
+                "source": names[graph.sources],
+                "target": names[graph.targets],
+                "weight": graph.weights,
+            })
+        )
+        names = graph.nodes
+
+    node_order, sources, targets, edge_order = _stable_order(
+        names, graph.sources, graph.targets, directed=False
+    )
+    rank = np.empty(len(node_order), dtype=np.int64)
+    rank[node_order] = np.arange(len(node_order))
+    return CompactGraph(
+        nodes=names[node_order],
+        sources=rank[sources],
+        targets=rank[targets],
+        weights=graph.weights[edge_order],
+    )
+
+
+def _normalize_names(names: np.ndarray) -> np.ndarray:
+    """Normalize node names like `normalize_node_names`, unescaping only the names that contain an entity."""
+    normalized = pd.Series(names, dtype=object).str.upper().str.strip()
+    escaped = normalized.str.contains("&", regex=False).to_numpy(dtype=bool)
+    normalized[escaped] = normalized[escaped].map(html.unescape)
+    return normalized.to_numpy(dtype=object)
+
+
+def _stable_order(
+    names: np.ndarray, sources: np.ndarray, targets: np.ndarray, directed: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the sorted node order and the sorted edges, as `_stabilize_graph` orders them.
+
+    Returns the node ids in sorted order, the source and target ids of every edge in sorted order, and the original position
+    of every sorted edge. Edges of an undirected graph point from their smaller to their larger node name.
+    """
+    node_order = np.argsort(names, kind="stable")
+    rank = np.empty(len(names), dtype=np.int64)
+    rank[node_order] = np.arange(len(names))
+    if not directed:
+        swap = rank[sources] > rank[targets]
+        sources, targets = (
+            np.where(swap, targets, sources),
+            np.where(swap, sources, targets),
+        )
+
+    # edges are sorted on "{source} -> {target}": when no node's "{name} -> " prefix starts another, the key order is the order
+    # of the source prefixes, then of the target names
+    prefixes = np.asarray([f"{name} -> " for name in names.tolist()], dtype=object)
+    prefix_order = np.argsort(prefixes, kind="stable")
+    sorted_prefixes = prefixes[prefix_order].tolist()
+    if any(
+        following.startswith(prefix) for prefix, following in pairwise(sorted_prefixes)
+    ):
+        keys = np.asarray(
+            [
+                f"{names[source]} -> {names[target]}"
+                for source, target in zip(
+                    sources.tolist(), targets.tolist(), strict=True
+                )
+            ],
+            dtype=object,
+        )
+        edge_order = np.argsort(keys, kind="stable")
+    else:
+        prefix_rank = np.empty(len(names), dtype=np.int64)
+        prefix_rank[prefix_order] = np.arange(len(names))
+        edge_order = np.lexsort((rank[targets], prefix_rank[sources]))
+    return node_order, sources[edge_order], targets[edge_order], edge_order
+
+
+def _stable_largest_connected_component_networkx(graph: nx.Graph) -> nx.Graph:
+    """Return the stable largest connected component, computed on the networkx graph."""
     # NOTE: The import is done here to reduce the initial import time of the module
     from graspologic.utils import largest_connected_component
 
@@ -57,6 +57,9 @@ from .update_communities import (
 from .update_community_reports import (
     run_workflow as run_update_community_reports,
 )
+from .update_community_reports_text import (
+    run_workflow as run_update_community_reports_text,
+)
 from .update_covariates import (
     run_workflow as run_update_covariates,
 )
@@ -92,6 +95,7 @@ PipelineFactory.register_all({
     "update_final_documents": run_update_final_documents,
     "update_text_embeddings": run_update_text_embeddings,
     "update_community_reports": run_update_community_reports,
+    "update_community_reports_text": run_update_community_reports_text,
     "update_entities_relationships": run_update_entities_relationships,
     "update_communities": run_update_communities,
     "update_covariates": run_update_covariates,
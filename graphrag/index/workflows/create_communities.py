@@ -11,12 +11,13 @@ from uuid import uuid4
 import numpy as np
 import pandas as pd
 
+from graphrag.config.enums import ClusterGraphBackendType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.schemas import COMMUNITIES_FINAL_COLUMNS
 from graphrag.index.operations.cluster_graph import cluster_graph
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.compact_graph import CompactGraph
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,7 @@ async def run_workflow(
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=seed,
+        backend=config.cluster_graph.backend,
     )
 
     await write_table_to_storage(output, "communities", context.output_storage)
@@ -57,15 +59,17 @@ def create_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    backend: ClusterGraphBackendType = ClusterGraphBackendType.Graspologic,
 ) -> pd.DataFrame:
     """All the steps to transform final communities."""
-    graph = create_graph(relationships, edge_attr=["weight"])
+    graph = CompactGraph.from_dataframe(relationships)
 
     clusters = cluster_graph(
         graph,
         max_cluster_size,
         use_lcc,
         seed=seed,
+        backend=backend,
     )
 
     communities = pd.DataFrame(
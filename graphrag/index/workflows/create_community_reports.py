@@ -19,6 +19,9 @@ from graphrag.index.operations.finalize_community_reports import (
 from graphrag.index.operations.summarize_communities.explode_communities import (
     explode_communities,
 )
+from graphrag.index.operations.summarize_communities.fingerprint import (
+    graph_community_fingerprints,
+)
 from graphrag.index.operations.summarize_communities.graph_context.context_builder import (
     build_level_context,
     build_local_context,
@@ -26,8 +29,10 @@ from graphrag.index.operations.summarize_communities.graph_context.context_build
 from graphrag.index.operations.summarize_communities.summarize_communities import (
     summarize_communities,
 )
+from graphrag.index.run.utils import create_row_checkpoint
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.utils.storage import (
     load_table_from_storage,
     storage_has_table,
@@ -60,6 +65,12 @@ async def run_workflow(
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
+    checkpoint = create_row_checkpoint(
+        config,
+        context.output_storage,
+        "create_community_reports",
+        signature=summarization_strategy,
+    )
 
     output = await create_community_reports(
         edges_input=edges,
@@ -71,9 +82,14 @@ async def run_workflow(
         summarization_strategy=summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        checkpoint=checkpoint,
+        reuse_unchanged_reports=config.community_reports.reuse_unchanged_reports,
+        stats=context.stats.workflows.setdefault("create_community_reports", {}),
     )
 
     await write_table_to_storage(output, "community_reports", context.output_storage)
+    if checkpoint is not None:
+        await checkpoint.clear()
 
     logger.info("Workflow completed: create_community_reports")
     return WorkflowFunctionOutput(result=output)
@@ -89,8 +105,20 @@ async def create_community_reports(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    checkpoint: RowCheckpoint | None = None,
+    reuse_unchanged_reports: bool = False,
+    stats: dict[str, float] | None = None,
 ) -> pd.DataFrame:
-    """All the steps to transform community reports."""
+    """All the steps to transform community reports.
+
+    If unchanged reports are reused and a stats dict is provided, the numbers of reused and regenerated reports are recorded
+    into it.
+    """
+    fingerprints = (
+        graph_community_fingerprints(communities, entities, edges_input, claims_input)
+        if reuse_unchanged_reports
+        else None
+    )
     nodes = explode_communities(communities, entities)
 
     nodes = _prep_nodes(nodes)
@@ -125,6 +153,9 @@ async def create_community_reports(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        checkpoint=checkpoint,
+        fingerprints=fingerprints,
+        stats=stats,
     )
 
     return finalize_community_reports(community_reports, communities)
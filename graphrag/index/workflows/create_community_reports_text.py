@@ -18,6 +18,9 @@ from graphrag.index.operations.finalize_community_reports import (
 from graphrag.index.operations.summarize_communities.explode_communities import (
     explode_communities,
 )
+from graphrag.index.operations.summarize_communities.fingerprint import (
+    text_community_fingerprints,
+)
 from graphrag.index.operations.summarize_communities.summarize_communities import (
     summarize_communities,
 )
@@ -25,8 +28,10 @@ from graphrag.index.operations.summarize_communities.text_unit_context.context_b
     build_level_context,
     build_local_context,
 )
+from graphrag.index.run.utils import create_row_checkpoint
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
@@ -51,6 +56,12 @@ async def run_workflow(
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
+    checkpoint = create_row_checkpoint(
+        config,
+        context.output_storage,
+        "create_community_reports_text",
+        signature=summarization_strategy,
+    )
 
     output = await create_community_reports_text(
         entities,
@@ -61,9 +72,14 @@ async def run_workflow(
         summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        checkpoint=checkpoint,
+        reuse_unchanged_reports=config.community_reports.reuse_unchanged_reports,
+        stats=context.stats.workflows.setdefault("create_community_reports_text", {}),
     )
 
     await write_table_to_storage(output, "community_reports", context.output_storage)
+    if checkpoint is not None:
+        await checkpoint.clear()
 
     logger.info("Workflow completed: create_community_reports_text")
     return WorkflowFunctionOutput(result=output)
@@ -78,8 +94,20 @@ async def create_community_reports_text(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    checkpoint: RowCheckpoint | None = None,
+    reuse_unchanged_reports: bool = False,
+    stats: dict[str, float] | None = None,
 ) -> pd.DataFrame:
-    """All the steps to transform community reports."""
+    """All the steps to transform community reports.
+
+    If unchanged reports are reused and a stats dict is provided, the numbers of reused and regenerated reports are recorded
+    into it.
+    """
+    fingerprints = (
+        text_community_fingerprints(communities, entities, text_units)
+        if reuse_unchanged_reports
+        else None
+    )
     nodes = explode_communities(communities, entities)
 
     summarization_strategy["extraction_prompt"] = summarization_strategy["text_prompt"]
@@ -103,6 +131,9 @@ async def create_community_reports_text(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        checkpoint=checkpoint,
+        fingerprints=fingerprints,
+        stats=stats,
     )
 
     return finalize_community_reports(community_reports, communities)
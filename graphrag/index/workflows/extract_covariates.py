@@ -5,7 +5,6 @@
 
 import logging
 from typing import Any
-from uuid import uuid4
 
 import pandas as pd
 
@@ -13,12 +12,16 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.data_model.schemas import COVARIATES_FINAL_COLUMNS
 from graphrag.index.operations.extract_covariates.extract_covariates import (
     extract_covariates as extractor,
 )
+from graphrag.index.operations.extract_covariates.finalize_covariates import (
+    finalize_covariates,
+)
+from graphrag.index.run.utils import create_row_checkpoint
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
@@ -31,7 +34,10 @@ async def run_workflow(
     """All the steps to extract and format covariates."""
     logger.info("Workflow started: extract_covariates")
     output = None
-    if config.extract_claims.enabled:
+    if config.extract_claims.enabled and config.extract_claims.joint_extraction:
+        logger.info("Claims were extracted with the graph, skipping claim extraction")
+        output = await load_table_from_storage("covariates", context.output_storage)
+    elif config.extract_claims.enabled:
         text_units = await load_table_from_storage("text_units", context.output_storage)
 
         extract_claims_llm_settings = config.get_language_model_config(
@@ -43,6 +49,12 @@ async def run_workflow(
 
         async_mode = extract_claims_llm_settings.async_mode
         num_threads = extract_claims_llm_settings.concurrent_requests
+        checkpoint = create_row_checkpoint(
+            config,
+            context.output_storage,
+            "extract_covariates",
+            signature=extraction_strategy,
+        )
 
         output = await extract_covariates(
             text_units,
@@ -53,9 +65,12 @@ async def run_workflow(
             async_mode=async_mode,
             entity_types=None,
             num_threads=num_threads,
+            checkpoint=checkpoint,
         )
 
         await write_table_to_storage(output, "covariates", context.output_storage)
+        if checkpoint is not None:
+            await checkpoint.clear()
 
     logger.info("Workflow completed: extract_covariates")
     return WorkflowFunctionOutput(result=output)
@@ -70,6 +85,7 @@ async def extract_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    checkpoint: RowCheckpoint | None = None,
 ) -> pd.DataFrame:
     """All the steps to extract and format covariates."""
     # reassign the id because it will be overwritten in the output by a covariate one
@@ -85,9 +101,7 @@ async def extract_covariates(
         async_mode=async_mode,
         entity_types=entity_types,
         num_threads=num_threads,
+        checkpoint=checkpoint,
     )
     text_units.drop(columns=["text_unit_id"], inplace=True)  # don't pollute the global
-    covariates["id"] = covariates["covariate_type"].apply(lambda _x: str(uuid4()))
-    covariates["human_readable_id"] = covariates.index
-
-    return covariates.loc[:, COVARIATES_FINAL_COLUMNS]
+    return finalize_covariates(covariates)
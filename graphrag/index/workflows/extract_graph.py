@@ -12,14 +12,19 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.operations.extract_covariates.finalize_covariates import (
+    create_claim_covariates,
+)
 from graphrag.index.operations.extract_graph.extract_graph import (
     extract_graph as extractor,
 )
 from graphrag.index.operations.summarize_descriptions.summarize_descriptions import (
     summarize_descriptions,
 )
+from graphrag.index.run.utils import create_row_checkpoint
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
@@ -40,6 +45,22 @@ async def run_workflow(
         config.root_dir, extract_graph_llm_settings
     )
 
+    # in joint mode the claims are extracted here, and the extract_covariates workflow skips its own pass
+    claims = None
+    if config.extract_claims.enabled and config.extract_claims.joint_extraction:
+        extraction_strategy = {
+            **extraction_strategy,
+            **config.extract_claims.resolved_joint_strategy(config.root_dir),
+        }
+        claims = []
+
+    extraction_checkpoint = create_row_checkpoint(
+        config,
+        context.output_storage,
+        "extract_graph",
+        signature=[extraction_strategy, config.extract_graph.entity_types],
+    )
+
     summarization_llm_settings = config.get_language_model_config(
         config.summarize_descriptions.model_id
     )
@@ -57,11 +78,19 @@ async def run_workflow(
         entity_types=config.extract_graph.entity_types,
         summarization_strategy=summarization_strategy,
         summarization_num_threads=summarization_llm_settings.concurrent_requests,
+        extraction_stats=context.stats.workflows.setdefault("extract_graph", {}),
+        extraction_checkpoint=extraction_checkpoint,
+        extracted_claims=claims,
     )
 
     await write_table_to_storage(entities, "entities", context.output_storage)
     await write_table_to_storage(relationships, "relationships", context.output_storage)
 
+    if claims is not None:
+        await write_table_to_storage(
+            create_claim_covariates(claims), "covariates", context.output_storage
+        )
+
     if config.snapshots.raw_graph:
         await write_table_to_storage(
             raw_entities, "raw_entities", context.output_storage
@@ -70,6 +99,9 @@ async def run_workflow(
             raw_relationships, "raw_relationships", context.output_storage
         )
 
+    if extraction_checkpoint is not None:
+        await extraction_checkpoint.clear()
+
     logger.info("Workflow completed: extract_graph")
     return WorkflowFunctionOutput(
         result={
@@ -89,8 +121,14 @@ async def extract_graph(
     entity_types: list[str] | None = None,
     summarization_strategy: dict[str, Any] | None = None,
     summarization_num_threads: int = 4,
+    extraction_stats: dict[str, float] | None = None,
+    extraction_checkpoint: RowCheckpoint | None = None,
+    extracted_claims: list[dict[str, Any]] | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """All the steps to create the base entity graph."""
+    """All the steps to create the base entity graph.
+
+    If an extracted_claims list is provided, claims extracted alongside the graph are appended to it.
+    """
     # this returns a graph for each text unit, to be merged later
     extracted_entities, extracted_relationships = await extractor(
         text_units=text_units,
@@ -102,6 +140,9 @@ async def extract_graph(
         async_mode=extraction_async_mode,
         entity_types=entity_types,
         num_threads=extraction_num_threads,
+        stats=extraction_stats,
+        checkpoint=extraction_checkpoint,
+        claims=extracted_claims,
     )
 
     if not _validate_data(extracted_entities):
@@ -13,6 +13,8 @@ from graphrag.index.typing.workflow import WorkflowFunction
 
 logger = logging.getLogger(__name__)
 
+INCREMENTAL_SUFFIX = "-incremental"
+
 
 class PipelineFactory:
     """A factory class for workflow pipelines."""
@@ -42,7 +44,16 @@ class PipelineFactory:
         config: GraphRagConfig,
         method: IndexingMethod | str = IndexingMethod.Standard,
     ) -> Pipeline:
-        """Create a pipeline generator."""
+        """Create a pipeline generator.
+
+        Update runs with `cluster_graph.incremental_update` use the incremental variant of their pipeline, if registered.
+        """
+        method = method.value if isinstance(method, IndexingMethod) else method
+        if (
+            config.cluster_graph.incremental_update
+            and f"{method}{INCREMENTAL_SUFFIX}" in cls.pipelines
+        ):
+            method = f"{method}{INCREMENTAL_SUFFIX}"
         workflows = config.workflows or cls.pipelines.get(method, [])
         logger.info("Creating pipeline with workflows: %s", workflows)
         return Pipeline([(name, cls.workflows[name]) for name in workflows])
@@ -81,6 +92,24 @@ _update_workflows = [
     "update_text_embeddings",
     "update_clean_state",
 ]
+_fast_update_workflows = [
+    "update_final_documents",
+    "update_entities_relationships",
+    "update_text_units",
+    "update_covariates",
+    "update_communities",
+    "update_community_reports_text",
+    "update_text_embeddings",
+    "update_clean_state",
+]
+# incremental updates re-cluster the merged graph and only report on the changed communities, so the delta is not
+# clustered, reported on or embedded (update_text_embeddings embeds the merged tables)
+_delta_community_workflows = {
+    "create_communities",
+    "create_community_reports",
+    "create_community_reports_text",
+    "generate_text_embeddings",
+}
 PipelineFactory.register_pipeline(
     IndexingMethod.Standard, ["load_input_documents", *_standard_workflows]
 )
@@ -93,5 +122,21 @@ PipelineFactory.register_pipeline(
 )
 PipelineFactory.register_pipeline(
     IndexingMethod.FastUpdate,
-    ["load_update_documents", *_fast_workflows, *_update_workflows],
+    ["load_update_documents", *_fast_workflows, *_fast_update_workflows],
+)
+PipelineFactory.register_pipeline(
+    f"{IndexingMethod.StandardUpdate.value}{INCREMENTAL_SUFFIX}",
+    [
+        "load_update_documents",
+        *[w for w in _standard_workflows if w not in _delta_community_workflows],
+        *_update_workflows,
+    ],
+)
+PipelineFactory.register_pipeline(
+    f"{IndexingMethod.FastUpdate.value}{INCREMENTAL_SUFFIX}",
+    [
+        "load_update_documents",
+        *[w for w in _fast_workflows if w not in _delta_community_workflows],
+        *_fast_update_workflows,
+    ],
 )
@@ -9,13 +9,20 @@ import pandas as pd
 
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.config.models.umap_config import UmapConfig
 from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.finalize_entities import finalize_entities
 from graphrag.index.operations.finalize_relationships import finalize_relationships
+from graphrag.index.operations.snapshot_graph_arrow import snapshot_graph_arrow
 from graphrag.index.operations.snapshot_graphml import snapshot_graphml
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.compact_graph import CompactGraph
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,11 +38,30 @@ async def run_workflow(
         "relationships", context.output_storage
     )
 
+    previous_positions = None
+    if (
+        config.umap.enabled
+        and config.umap.incremental_update
+        and await storage_has_table("entities", context.previous_storage)
+    ):
+        previous_entities = await load_table_from_storage(
+            "entities", context.previous_storage
+        )
+        previous_positions = dict(
+            zip(
+                previous_entities["title"],
+                zip(previous_entities["x"], previous_entities["y"], strict=True),
+                strict=True,
+            )
+        )
+
     final_entities, final_relationships = finalize_graph(
         entities,
         relationships,
         embed_config=config.embed_graph,
         layout_enabled=config.umap.enabled,
+        layout_config=config.umap,
+        previous_positions=previous_positions,
     )
 
     await write_table_to_storage(final_entities, "entities", context.output_storage)
@@ -53,6 +79,13 @@ async def run_workflow(
             storage=context.output_storage,
         )
 
+    if config.snapshots.graph_arrow:
+        await snapshot_graph_arrow(
+            CompactGraph.from_dataframe(final_relationships),
+            name="graph",
+            storage=context.output_storage,
+        )
+
     logger.info("Workflow completed: finalize_graph")
     return WorkflowFunctionOutput(
         result={
@@ -67,10 +100,17 @@ def finalize_graph(
     relationships: pd.DataFrame,
     embed_config: EmbedGraphConfig | None = None,
     layout_enabled: bool = False,
+    layout_config: UmapConfig | None = None,
+    previous_positions: dict[str, tuple[float, float]] | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """All the steps to finalize the entity and relationship formats."""
     final_entities = finalize_entities(
-        entities, relationships, embed_config, layout_enabled
+        entities,
+        relationships,
+        embed_config,
+        layout_enabled,
+        layout_config=layout_config,
+        previous_positions=previous_positions,
     )
     final_relationships = finalize_relationships(relationships)
     return (final_entities, final_relationships)
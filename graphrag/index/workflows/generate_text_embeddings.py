@@ -3,6 +3,7 @@
 
 """A module containing run_workflow method definition."""
 
+import asyncio
 import logging
 
 import pandas as pd
@@ -21,6 +22,7 @@ from graphrag.config.embeddings import (
 )
 from graphrag.config.get_embedding_settings import get_embedding_settings
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.operations.embed_text.batcher import EmbeddingBatcher
 from graphrag.index.operations.embed_text.embed_text import embed_text
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
@@ -155,20 +157,35 @@ async def generate_text_embeddings(
     }
 
     logger.info("Creating embeddings")
-    outputs = {}
+    fields = []
     for field in embedded_fields:
         if embedding_param_map[field]["data"] is None:
             msg = f"Embedding {field} is specified but data table is not in storage. This may or may not be intentional - if you expect it to me here, please check for errors earlier in the logs."
             logger.warning(msg)
         else:
-            outputs[field] = await _run_embeddings(
-                name=field,
-                callbacks=callbacks,
-                cache=cache,
-                text_embed_config=text_embed_config,
-                **embedding_param_map[field],
-            )
-    return outputs
+            fields.append(field)
+
+    # all fields are embedded at once, their batches interleaved under one concurrency budget
+    strategy = text_embed_config["strategy"]
+    shared_strategy = {
+        **strategy,
+        "batcher": EmbeddingBatcher(
+            batch_size=strategy.get("batch_size", 16),
+            batch_max_tokens=strategy.get("batch_max_tokens", 8191),
+            num_threads=strategy.get("num_threads", 4),
+        ),
+    }
+    outputs = await asyncio.gather(*[
+        _run_embeddings(
+            name=field,
+            callbacks=callbacks,
+            cache=cache,
+            strategy=shared_strategy,
+            **embedding_param_map[field],
+        )
+        for field in fields
+    ])
+    return dict(zip(fields, outputs, strict=True))
 
 
 async def _run_embeddings(
@@ -177,7 +194,7 @@ async def _run_embeddings(
     embed_column: str,
     callbacks: WorkflowCallbacks,
     cache: PipelineCache,
-    text_embed_config: dict,
+    strategy: dict,
 ) -> pd.DataFrame:
     """All the steps to generate single embedding."""
     data["embedding"] = await embed_text(
@@ -186,7 +203,7 @@ async def _run_embeddings(
         cache=cache,
         embed_column=embed_column,
         embedding_name=name,
-        strategy=text_embed_config["strategy"],
+        strategy=strategy,
     )
 
     return data.loc[:, ["id", "embedding"]]
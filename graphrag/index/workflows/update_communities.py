@@ -5,11 +5,19 @@
 
 import logging
 
+import pandas as pd
+
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.data_model.schemas import COMMUNITIES_FINAL_COLUMNS
 from graphrag.index.run.utils import get_update_storages
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.update.communities import _update_and_merge_communities
+from graphrag.index.update.communities import (
+    _merge_reclustered_communities,
+    _select_communities_to_recluster,
+    _update_and_merge_communities,
+)
+from graphrag.index.workflows.create_communities import create_communities
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
@@ -26,11 +34,16 @@ async def run_workflow(
         config, context.state["update_timestamp"]
     )
 
-    community_id_mapping = await _update_communities(
-        previous_storage, delta_storage, output_storage
-    )
-
-    context.state["incremental_update_community_id_mapping"] = community_id_mapping
+    if config.cluster_graph.incremental_update:
+        changed_communities = await _update_communities_incrementally(
+            config, context, previous_storage, delta_storage, output_storage
+        )
+        context.state["incremental_update_changed_communities"] = changed_communities
+    else:
+        community_id_mapping = await _update_communities(
+            previous_storage, delta_storage, output_storage
+        )
+        context.state["incremental_update_community_id_mapping"] = community_id_mapping
 
     logger.info("Workflow completed: update_communities")
     return WorkflowFunctionOutput(result=None)
@@ -51,3 +64,48 @@ async def _update_communities(
     await write_table_to_storage(merged_communities, "communities", output_storage)
 
     return community_id_mapping
+
+
+async def _update_communities_incrementally(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    previous_storage: PipelineStorage,
+    delta_storage: PipelineStorage,
+    output_storage: PipelineStorage,
+) -> list[int]:
+    """Re-cluster the communities touched by the delta entities and relationships, and return the ids of the changed communities."""
+    old_communities = await load_table_from_storage("communities", previous_storage)
+    delta_entities = await load_table_from_storage("entities", delta_storage)
+    delta_relationships = await load_table_from_storage("relationships", delta_storage)
+    merged_entities = context.state["incremental_update_merged_entities"]
+    merged_relationships = context.state["incremental_update_merged_relationships"]
+
+    kept_communities, relationships = _select_communities_to_recluster(
+        old_communities,
+        merged_entities,
+        merged_relationships,
+        delta_relationships,
+        delta_entities,
+        use_lcc=config.cluster_graph.use_lcc,
+    )
+    # the selected relationships are already limited to the largest connected component if needed, and may span several
+    # components of their own, which are all clustered
+    reclustered_communities = (
+        create_communities(
+            merged_entities,
+            relationships,
+            max_cluster_size=config.cluster_graph.max_cluster_size,
+            use_lcc=False,
+            seed=config.cluster_graph.seed,
+            backend=config.cluster_graph.backend,
+        )
+        if len(relationships) > 0
+        else pd.DataFrame(columns=pd.Index(COMMUNITIES_FINAL_COLUMNS))
+    )
+    merged_communities, changed_communities = _merge_reclustered_communities(
+        old_communities, kept_communities, reclustered_communities
+    )
+
+    await write_table_to_storage(merged_communities, "communities", output_storage)
+
+    return changed_communities
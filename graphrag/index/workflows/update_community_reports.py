@@ -11,9 +11,19 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.run.utils import get_update_storages
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.update.communities import _update_and_merge_community_reports
+from graphrag.index.update.communities import (
+    _merge_changed_community_reports,
+    _update_and_merge_community_reports,
+)
+from graphrag.index.workflows.create_community_reports import (
+    create_community_reports,
+)
 from graphrag.storage.pipeline_storage import PipelineStorage
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +38,23 @@ async def run_workflow(
         config, context.state["update_timestamp"]
     )
 
-    community_id_mapping = context.state["incremental_update_community_id_mapping"]
-
-    merged_community_reports = await _update_community_reports(
-        previous_storage, delta_storage, output_storage, community_id_mapping
-    )
+    changed_communities = context.state.get("incremental_update_changed_communities")
+    if changed_communities is not None:
+        communities = await load_table_from_storage("communities", output_storage)
+        communities = communities.loc[
+            communities["community"].isin(changed_communities)
+        ].reset_index(drop=True)
+        changed_community_reports = await _create_changed_community_reports(
+            config, context, output_storage, communities
+        )
+        merged_community_reports = await _replace_community_reports(
+            previous_storage, output_storage, changed_community_reports
+        )
+    else:
+        community_id_mapping = context.state["incremental_update_community_id_mapping"]
+        merged_community_reports = await _update_community_reports(
+            previous_storage, delta_storage, output_storage, community_id_mapping
+        )
 
     context.state["incremental_update_merged_community_reports"] = (
         merged_community_reports
@@ -64,3 +86,61 @@ async def _update_community_reports(
     )
 
     return merged_community_reports
+
+
+async def _replace_community_reports(
+    previous_storage: PipelineStorage,
+    output_storage: PipelineStorage,
+    changed_community_reports: pd.DataFrame,
+) -> pd.DataFrame:
+    """Update the community reports output, replacing the reports of the communities that were re-clustered."""
+    old_community_reports = await load_table_from_storage(
+        "community_reports", previous_storage
+    )
+    merged_communities = await load_table_from_storage("communities", output_storage)
+    merged_community_reports = _merge_changed_community_reports(
+        old_community_reports, changed_community_reports, merged_communities
+    )
+
+    await write_table_to_storage(
+        merged_community_reports, "community_reports", output_storage
+    )
+
+    return merged_community_reports
+
+
+async def _create_changed_community_reports(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    output_storage: PipelineStorage,
+    communities: pd.DataFrame,
+) -> pd.DataFrame:
+    """Generate the reports of the changed communities from the merged graph."""
+    edges = context.state["incremental_update_merged_relationships"].copy()
+    entities = context.state["incremental_update_merged_entities"]
+    claims = None
+    if config.extract_claims.enabled and await storage_has_table(
+        "covariates", output_storage
+    ):
+        claims = await load_table_from_storage("covariates", output_storage)
+
+    community_reports_llm_settings = config.get_language_model_config(
+        config.community_reports.model_id
+    )
+    summarization_strategy = config.community_reports.resolved_strategy(
+        config.root_dir, community_reports_llm_settings
+    )
+
+    return await create_community_reports(
+        edges_input=edges,
+        entities=entities,
+        communities=communities,
+        claims_input=claims,
+        callbacks=context.callbacks,
+        cache=context.cache,
+        summarization_strategy=summarization_strategy,
+        async_mode=community_reports_llm_settings.async_mode,
+        num_threads=community_reports_llm_settings.concurrent_requests,
+        reuse_unchanged_reports=config.community_reports.reuse_unchanged_reports,
+        stats=context.stats.workflows.setdefault("update_community_reports", {}),
+    )
@@ -0,0 +1,89 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import logging
+
+import pandas as pd
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.utils import get_update_storages
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.workflows.create_community_reports_text import (
+    create_community_reports_text,
+)
+from graphrag.index.workflows.update_community_reports import (
+    _replace_community_reports,
+    _update_community_reports,
+)
+from graphrag.utils.storage import load_table_from_storage
+
+logger = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """Update the community reports from a incremental index run, generating changed reports from text units."""
+    logger.info("Workflow started: update_community_reports_text")
+    output_storage, previous_storage, delta_storage = get_update_storages(
+        config, context.state["update_timestamp"]
+    )
+
+    changed_communities = context.state.get("incremental_update_changed_communities")
+    if changed_communities is not None:
+        communities = await load_table_from_storage("communities", output_storage)
+        communities = communities.loc[
+            communities["community"].isin(changed_communities)
+        ].reset_index(drop=True)
+        changed_community_reports = await _create_changed_community_reports(
+            config, context, communities
+        )
+        merged_community_reports = await _replace_community_reports(
+            previous_storage, output_storage, changed_community_reports
+        )
+    else:
+        community_id_mapping = context.state["incremental_update_community_id_mapping"]
+        merged_community_reports = await _update_community_reports(
+            previous_storage, delta_storage, output_storage, community_id_mapping
+        )
+
+    context.state["incremental_update_merged_community_reports"] = (
+        merged_community_reports
+    )
+
+    logger.info("Workflow completed: update_community_reports_text")
+    return WorkflowFunctionOutput(result=None)
+
+
+async def _create_changed_community_reports(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    communities: pd.DataFrame,
+) -> pd.DataFrame:
+    """Generate the reports of the changed communities from the merged text units."""
+    entities = context.state["incremental_update_merged_entities"]
+    text_units = context.state["incremental_update_merged_text_units"]
+
+    community_reports_llm_settings = config.get_language_model_config(
+        config.community_reports.model_id
+    )
+    summarization_strategy = config.community_reports.resolved_strategy(
+        config.root_dir, community_reports_llm_settings
+    )
+
+    return await create_community_reports_text(
+        entities,
+        communities,
+        text_units,
+        context.callbacks,
+        context.cache,
+        summarization_strategy,
+        async_mode=community_reports_llm_settings.async_mode,
+        num_threads=community_reports_llm_settings.concurrent_requests,
+        reuse_unchanged_reports=config.community_reports.reuse_unchanged_reports,
+        stats=context.stats.workflows.setdefault("update_community_reports_text", {}),
+    )
@@ -0,0 +1,72 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A file containing prompts definition."""
+
+GRAPH_CLAIM_EXTRACTION_PROMPT = """
+-Goal-
+Given a text document that is potentially relevant to this activity, a list of entity types and a claim description, identify all entities of those types from the text, all relationships among the identified entities, and all claims against the identified entities.
+
+-Steps-
+1. Identify all entities. For each identified entity, extract the following information:
+- entity_name: Name of the entity, capitalized
+- entity_type: One of the following types: [{entity_types}]
+- entity_description: Comprehensive description of the entity's attributes and activities
+Format each entity as ("entity"{tuple_delimiter}<entity_name>{tuple_delimiter}<entity_type>{tuple_delimiter}<entity_description>)
+
+2. From the entities identified in step 1, identify all pairs of (source_entity, target_entity) that are *clearly related* to each other.
+For each pair of related entities, extract the following information:
+- source_entity: name of the source entity, as identified in step 1
+- target_entity: name of the target entity, as identified in step 1
+- relationship_description: explanation as to why you think the source entity and the target entity are related to each other
+- relationship_strength: a numeric score indicating strength of the relationship between the source entity and target entity
+ Format each relationship as ("relationship"{tuple_delimiter}<source_entity>{tuple_delimiter}<target_entity>{tuple_delimiter}<relationship_description>{tuple_delimiter}<relationship_strength>)
+
+3. For each entity identified in step 1, extract all claims associated with the entity. Claims need to match the claim description, and the entity should be the subject of the claim.
+For each claim, extract the following information:
+- subject_entity: name of the entity that is subject of the claim, as identified in step 1. The subject entity is one that committed the action described in the claim.
+- object_entity: name of the entity that is object of the claim, capitalized. The object entity is one that either reports/handles or is affected by the action described in the claim. If object entity is unknown, use **NONE**.
+- claim_type: overall category of the claim, capitalized. Name it in a way that can be repeated across multiple text inputs, so that similar claims share the same claim type
+- claim_status: **TRUE**, **FALSE**, or **SUSPECTED**. TRUE means the claim is confirmed, FALSE means the claim is found to be False, SUSPECTED means the claim is not verified.
+- claim_start_date, claim_end_date: Period when the claim was made, in ISO-8601 format. If the claim was made on a single date rather than a date range, set the same date for both. If date is unknown, return **NONE**.
+- claim_description: Detailed description explaining the reasoning behind the claim, together with all the related evidence and references.
+- claim_source: List of **all** quotes from the original text that are relevant to the claim.
+ Format each claim as ("claim"{tuple_delimiter}<subject_entity>{tuple_delimiter}<object_entity>{tuple_delimiter}<claim_type>{tuple_delimiter}<claim_status>{tuple_delimiter}<claim_start_date>{tuple_delimiter}<claim_end_date>{tuple_delimiter}<claim_description>{tuple_delimiter}<claim_source>)
+
+4. Return output in English as a single list of all the entities, relationships and claims identified in steps 1, 2 and 3. Use **{record_delimiter}** as the list delimiter.
+
+5. When finished, output {completion_delimiter}
+
+######################
+-Examples-
+######################
+Example 1:
+Entity_types: ORGANIZATION,PERSON
+Claim_description: red flags associated with an entity
+Text:
+According to an article on 2022/01/10, Company A was fined for bid rigging while participating in multiple public tenders published by Government Agency B. The company is owned by Person C who was suspected of engaging in corruption activities in 2015.
+######################
+Output:
+("entity"{tuple_delimiter}COMPANY A{tuple_delimiter}ORGANIZATION{tuple_delimiter}Company A is a company that was fined for bid rigging in public tenders published by Government Agency B)
+{record_delimiter}
+("entity"{tuple_delimiter}GOVERNMENT AGENCY B{tuple_delimiter}ORGANIZATION{tuple_delimiter}Government Agency B is a government agency that published multiple public tenders)
+{record_delimiter}
+("entity"{tuple_delimiter}PERSON C{tuple_delimiter}PERSON{tuple_delimiter}Person C is the owner of Company A and was suspected of engaging in corruption activities in 2015)
+{record_delimiter}
+("relationship"{tuple_delimiter}COMPANY A{tuple_delimiter}GOVERNMENT AGENCY B{tuple_delimiter}Company A participated in public tenders published by Government Agency B{tuple_delimiter}6)
+{record_delimiter}
+("relationship"{tuple_delimiter}PERSON C{tuple_delimiter}COMPANY A{tuple_delimiter}Person C is the owner of Company A{tuple_delimiter}9)
+{record_delimiter}
+("claim"{tuple_delimiter}COMPANY A{tuple_delimiter}GOVERNMENT AGENCY B{tuple_delimiter}ANTI-COMPETITIVE PRACTICES{tuple_delimiter}TRUE{tuple_delimiter}2022-01-10T00:00:00{tuple_delimiter}2022-01-10T00:00:00{tuple_delimiter}Company A was found to engage in anti-competitive practices because it was fined for bid rigging in multiple public tenders published by Government Agency B according to an article published on 2022/01/10{tuple_delimiter}According to an article published on 2022/01/10, Company A was fined for bid rigging while participating in multiple public tenders published by Government Agency B.)
+{record_delimiter}
+("claim"{tuple_delimiter}PERSON C{tuple_delimiter}NONE{tuple_delimiter}CORRUPTION{tuple_delimiter}SUSPECTED{tuple_delimiter}2015-01-01T00:00:00{tuple_delimiter}2015-12-30T00:00:00{tuple_delimiter}Person C was suspected of engaging in corruption activities in 2015{tuple_delimiter}The company is owned by Person C who was suspected of engaging in corruption activities in 2015)
+{completion_delimiter}
+
+######################
+-Real Data-
+######################
+Entity_types: {entity_types}
+Claim_description: {claim_description}
+Text: {input_text}
+######################
+Output:"""
@@ -18,3 +18,28 @@ Description List: {description_list}
 #######
 Output:
 """
+
+BATCH_SUMMARIZE_PROMPT = """
+You are a helpful assistant responsible for generating comprehensive summaries of the data provided below.
+You are given a list of items. Each item has an id, one or more entities, and a list of descriptions, all related to the same entity or group of entities.
+For each item, please concatenate all of its descriptions into a single, comprehensive description. Make sure to include information collected from all the descriptions of the item, and only from that item.
+If the provided descriptions are contradictory, please resolve the contradictions and provide a single, coherent summary.
+Make sure each summary is written in third person, and include the entity names so we have the full context.
+Limit each description length to {max_length} words.
+
+Return output as a well-formed JSON-formatted string with the following format, with exactly one summary for every item id:
+{{
+    "summaries": [
+        {{
+            "id": <item id>,
+            "description": <summary of the item descriptions>
+        }}
+    ]
+}}
+
+#######
+-Data-
+Items: {description_batch}
+#######
+Output:
+"""
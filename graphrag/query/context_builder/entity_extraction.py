@@ -44,8 +44,12 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    include_ids: list[str] | list[int] | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    If `include_ids` is provided, the similarity search is limited to the embeddings with those ids.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
@@ -59,6 +63,7 @@ def map_query_to_entities(
             text=query,
             text_embedder=lambda t: text_embedder.embed(t),
             k=k * oversample_scaler,
+            include_ids=include_ids,
         )
         for result in search_results:
             if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
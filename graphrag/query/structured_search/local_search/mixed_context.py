@@ -83,10 +83,15 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.entity_keys: list[int] | list[str] | None = None
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
-        """Filter entity text embeddings by entity keys."""
-        self.entity_text_embeddings.filter_by_id(entity_keys)
+        """Filter entity text embeddings by entity keys.
+
+        The keys are kept on the context builder and passed to each search, so the shared vector store is not modified.
+        An empty list removes the filter.
+        """
+        self.entity_keys = list(entity_keys) if len(entity_keys) > 0 else None  # type: ignore
 
     def build_context(
         self,
@@ -146,6 +151,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            include_ids=self.entity_keys,
         )
 
         # build context
@@ -152,6 +152,10 @@ class FilePipelineStorage(PipelineStorage):
         child_path = str(Path(self._root_dir) / Path(name))
         return FilePipelineStorage(base_dir=child_path, encoding=self._encoding)
 
+    def path(self, key: str) -> Path | None:
+        """Return the path of the file a key is stored in, for writers that stream to the file themselves."""
+        return join_path(self._root_dir, key)
+
     def keys(self) -> list[str]:
         """Return the keys in the storage."""
         return [item.name for item in Path(self._root_dir).iterdir() if item.is_file()]
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 from graphrag.storage.file_pipeline_storage import FilePipelineStorage
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from graphrag.storage.pipeline_storage import PipelineStorage
 
 
@@ -73,6 +75,10 @@ class MemoryPipelineStorage(FilePipelineStorage):
         """Create a child storage instance."""
         return MemoryPipelineStorage()
 
+    def path(self, key: str) -> "Path | None":
+        """Return None, as values are not stored in files."""
+        return None
+
     def keys(self) -> list[str]:
         """Return the keys in the storage."""
         return list(self._storage.keys())
@@ -64,7 +64,11 @@ class MultiVectorStore(BaseVectorStore):
             raise ValueError(message)
 
     def similarity_search_by_vector(
-        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
         all_results = []
@@ -72,7 +76,7 @@ class MultiVectorStore(BaseVectorStore):
             self.index_names, self.embedding_stores, strict=False
         ):
             results = embedding_store.similarity_search_by_vector(
-                query_embedding=query_embedding, k=k
+                query_embedding=query_embedding, k=k, include_ids=include_ids
             )
             mod_results = []
             for r in results:
@@ -81,14 +85,45 @@ class MultiVectorStore(BaseVectorStore):
             all_results += mod_results
         return sorted(all_results, key=lambda x: x.score, reverse=True)[:k]
 
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a batched vector-based similarity search, searching every store once for all vectors."""
+        all_results: list[list[VectorStoreSearchResult]] = [
+            [] for _ in query_embeddings
+        ]
+        for index_name, embedding_store in zip(
+            self.index_names, self.embedding_stores, strict=False
+        ):
+            store_results = embedding_store.similarity_search_by_vectors(
+                query_embeddings=query_embeddings, k=k, include_ids=include_ids
+            )
+            for query_results, results in zip(all_results, store_results, strict=True):
+                for r in results:
+                    r.document.id = str(r.document.id) + f"-{index_name}"
+                query_results += results
+        return [
+            sorted(query_results, key=lambda x: x.score, reverse=True)[:k]
+            for query_results in all_results
+        ]
+
     def similarity_search_by_text(
-        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+        self,
+        text: str,
+        text_embedder: TextEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
         """Perform a text-based similarity search."""
         query_embedding = text_embedder(text)
         if query_embedding:
             return self.similarity_search_by_vector(
-                query_embedding=query_embedding, k=k
+                query_embedding=query_embedding, k=k, include_ids=include_ids
             )
         return []
 
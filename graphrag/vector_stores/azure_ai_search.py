@@ -22,7 +22,7 @@ from azure.search.documents.indexes.models import (
     VectorSearchAlgorithmMetric,
     VectorSearchProfile,
 )
-from azure.search.documents.models import VectorizedQuery
+from azure.search.documents.models import VectorFilterMode, VectorizedQuery
 
 from graphrag.data_model.types import TextEmbedder
 from graphrag.vector_stores.base import (
@@ -32,6 +32,9 @@ from graphrag.vector_stores.base import (
     VectorStoreSearchResult,
 )
 
+# Delimiters tried in order for search.in id filters, the first one no id contains being used
+ID_DELIMITERS = [",", "|", ";", "~", "^", "\t"]
+
 
 class AzureAISearchVectorStore(BaseVectorStore):
     """Azure AI Search vector storage implementation."""
@@ -148,25 +151,36 @@ class AzureAISearchVectorStore(BaseVectorStore):
             # Returning to keep consistency with other methods, but not needed
             return self.query_filter
 
-        # More info about odata filtering here: https://learn.microsoft.com/en-us/azure/search/search-query-odata-search-in-function
-        # search.in is faster that joined and/or conditions
-        id_filter = ",".join([f"{id!s}" for id in include_ids])
-        self.query_filter = f"search.in(id, '{id_filter}', ',')"
+        self.query_filter = _id_filter(include_ids)
 
         # Returning to keep consistency with other methods, but not needed
         # TODO: Refactor on a future PR
         return self.query_filter
 
     def similarity_search_by_vector(
-        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
-        """Perform a vector-based similarity search."""
+        """Perform a vector-based similarity search.
+
+        An id filter is applied by the service before the vector search.
+        """
+        if include_ids is not None and len(include_ids) == 0:
+            return []
+        query_filter = (
+            _id_filter(include_ids) if include_ids is not None else self.query_filter
+        )
         vectorized_query = VectorizedQuery(
             vector=query_embedding, k_nearest_neighbors=k, fields="vector"
         )
 
         response = self.db_connection.search(
             vector_queries=[vectorized_query],
+            filter=query_filter,
+            vector_filter_mode=VectorFilterMode.PRE_FILTER if query_filter else None,
         )
 
         return [
@@ -184,14 +198,31 @@ class AzureAISearchVectorStore(BaseVectorStore):
             for doc in response
         ]
 
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Search several vectors with concurrent requests, the service answering one vector query per request."""
+        return self._similarity_search_concurrently(
+            query_embeddings, k, include_ids=include_ids, **kwargs
+        )
+
     def similarity_search_by_text(
-        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+        self,
+        text: str,
+        text_embedder: TextEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
         """Perform a text-based similarity search."""
         query_embedding = text_embedder(text)
         if query_embedding:
             return self.similarity_search_by_vector(
-                query_embedding=query_embedding, k=k
+                query_embedding=query_embedding, k=k, include_ids=include_ids
             )
         return []
 
@@ -204,3 +235,24 @@ class AzureAISearchVectorStore(BaseVectorStore):
             vector=response.get("vector", []),
             attributes=(json.loads(response.get("attributes", "{}"))),
         )
+
+
+def _id_filter(include_ids: list[str] | list[int]) -> str:
+    """Build an OData filter on a set of ids.
+
+    Quotes in ids are escaped, and the ids are joined with the first delimiter that none of them contains.
+    """
+    # More info about odata filtering here: https://learn.microsoft.com/en-us/azure/search/search-query-odata-search-in-function
+    # search.in is faster that joined and/or conditions
+    ids = [str(id).replace("'", "''") for id in include_ids]
+    delimiter = next(
+        (
+            delimiter
+            for delimiter in ID_DELIMITERS
+            if not any(delimiter in id for id in ids)
+        ),
+        None,
+    )
+    if delimiter is None:
+        return " or ".join(f"id eq '{id}'" for id in ids)
+    return f"search.in(id, '{delimiter.join(ids)}', '{delimiter}')"
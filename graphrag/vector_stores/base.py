@@ -4,13 +4,17 @@
 """Base classes for vector stores."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
-from graphrag.data_model.types import TextEmbedder
+from graphrag.data_model.types import TextBatchEmbedder, TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
 
+# Number of searches a store without batched search runs at once in similarity_search_by_vectors
+DEFAULT_SEARCH_CONCURRENCY: int = 8
+
 
 @dataclass
 class VectorStoreDocument:
@@ -64,21 +68,113 @@ class BaseVectorStore(ABC):
     ) -> None:
         """Load documents into the vector-store."""
 
+    # an optional hook rather than an abstract method, so stores without indices need not implement it
+    def create_index(self) -> None:  # noqa: B027
+        """Build search indices once documents are loaded. Stores that index documents as they are loaded do nothing."""
+
     @abstractmethod
     def similarity_search_by_vector(
-        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
-        """Perform ANN search by vector."""
+        """Perform ANN search by vector.
+
+        If `include_ids` is given, only the documents with these ids are searched. The filter only applies to this call, so
+        concurrent searches can share a store.
+        """
 
     @abstractmethod
     def similarity_search_by_text(
-        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+        self,
+        text: str,
+        text_embedder: TextEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
-        """Perform ANN search by text."""
+        """Perform ANN search by text, only searching the documents with ids in `include_ids` if given."""
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for several vectors, returning the results of every vector in order.
+
+        Stores that can search several vectors in one request override this; by default, vectors are searched one by one.
+        """
+        return [
+            self.similarity_search_by_vector(
+                query_embedding, k, include_ids=include_ids, **kwargs
+            )
+            for query_embedding in query_embeddings
+        ]
+
+    def _similarity_search_concurrently(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Search several vectors with concurrent requests, for stores that answer one vector query per request."""
+        if len(query_embeddings) == 0:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(DEFAULT_SEARCH_CONCURRENCY, len(query_embeddings))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda query_embedding: self.similarity_search_by_vector(
+                        query_embedding, k, include_ids=include_ids, **kwargs
+                    ),
+                    query_embeddings,
+                )
+            )
+
+    def similarity_search_by_texts(
+        self,
+        texts: list[str],
+        text_embedder: TextBatchEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for several texts, embedded in one batch, returning the results of every text in order."""
+        if len(texts) == 0:
+            return []
+        query_embeddings = text_embedder(texts)
+        searched = [
+            index
+            for index, query_embedding in enumerate(query_embeddings)
+            if query_embedding is not None and len(query_embedding) > 0
+        ]
+        results: list[list[VectorStoreSearchResult]] = [[] for _ in texts]
+        for index, text_results in zip(
+            searched,
+            self.similarity_search_by_vectors(
+                [query_embeddings[index] for index in searched],
+                k,
+                include_ids=include_ids,
+                **kwargs,
+            ),
+            strict=True,
+        ):
+            results[index] = text_results
+        return results
 
     @abstractmethod
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
-        """Build a query filter to filter documents by id."""
+        """Build a query filter to filter documents by id.
+
+        The filter is kept on the store and applies to every later search that is not given `include_ids`. Prefer passing
+        `include_ids` to the search methods, which is safe when searches share the store.
+        """
 
     @abstractmethod
     def search_by_id(self, id: str) -> VectorStoreDocument:
@@ -29,6 +29,8 @@ class CosmosDBVectorStore(BaseVectorStore):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
+        # the ids of the stored query filter, which the vector search passes as a query parameter
+        self._filter_ids: list[str] | list[int] | None = None
 
     def connect(self, **kwargs: Any) -> Any:
         """Connect to CosmosDB vector storage."""
@@ -167,16 +169,39 @@ class CosmosDBVectorStore(BaseVectorStore):
                 self._container_client.upsert_item(doc_json)
 
     def similarity_search_by_vector(
-        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
-        """Perform a vector-based similarity search."""
+        """Perform a vector-based similarity search.
+
+        An id filter is passed to the query as a parameter and applied before ranking. Without `include_ids`, the ids of
+        the filter set with `filter_by_id` are used.
+        """
         if self._container_client is None:
             msg = "Container client is not initialized."
             raise ValueError(msg)
+        if include_ids is None:
+            include_ids = self._filter_ids
+        if include_ids is not None and len(include_ids) == 0:
+            return []
 
+        id_condition = (
+            "WHERE ARRAY_CONTAINS(@ids, c.id) " if include_ids is not None else ""
+        )
+        id_params = (
+            [{"name": "@ids", "value": [str(id) for id in include_ids]}]
+            if include_ids is not None
+            else []
+        )
         try:
-            query = f"SELECT TOP {k} c.id, c.text, c.vector, c.attributes, VectorDistance(c.vector, @embedding) AS SimilarityScore FROM c ORDER BY VectorDistance(c.vector, @embedding)"  # noqa: S608
-            query_params = [{"name": "@embedding", "value": query_embedding}]
+            query = f"SELECT TOP {k} c.id, c.text, c.vector, c.attributes, VectorDistance(c.vector, @embedding) AS SimilarityScore FROM c {id_condition}ORDER BY VectorDistance(c.vector, @embedding)"  # noqa: S608
+            query_params = [
+                {"name": "@embedding", "value": query_embedding},
+                *id_params,
+            ]
             items = list(
                 self._container_client.query_items(
                     query=query,
@@ -187,10 +212,11 @@ class CosmosDBVectorStore(BaseVectorStore):
         except (CosmosHttpResponseError, ValueError):
             # Currently, the CosmosDB emulator does not support the VectorDistance function.
             # For emulator or test environments - fetch all items and calculate distance locally
-            query = "SELECT c.id, c.text, c.vector, c.attributes FROM c"
+            query = f"SELECT c.id, c.text, c.vector, c.attributes FROM c {id_condition}"  # noqa: S608
             items = list(
                 self._container_client.query_items(
                     query=query,
+                    parameters=id_params,
                     enable_cross_partition_query=True,
                 )
             )
@@ -228,14 +254,31 @@ class CosmosDBVectorStore(BaseVectorStore):
             for item in items
         ]
 
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Search several vectors with concurrent requests, the service answering one vector query per request."""
+        return self._similarity_search_concurrently(
+            query_embeddings, k, include_ids=include_ids, **kwargs
+        )
+
     def similarity_search_by_text(
-        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+        self,
+        text: str,
+        text_embedder: TextEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
         """Perform a text-based similarity search."""
         query_embedding = text_embedder(text)
         if query_embedding:
             return self.similarity_search_by_vector(
-                query_embedding=query_embedding, k=k
+                query_embedding=query_embedding, k=k, include_ids=include_ids
             )
         return []
 
@@ -243,7 +286,9 @@ class CosmosDBVectorStore(BaseVectorStore):
         """Build a query filter to filter documents by a list of ids."""
         if include_ids is None or len(include_ids) == 0:
             self.query_filter = None
+            self._filter_ids = None
         else:
+            self._filter_ids = list(include_ids)  # type: ignore
             if isinstance(include_ids[0], str):
                 id_filter = ", ".join([f"'{id}'" for id in include_ids])
             else:
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, ClassVar
 from graphrag.config.enums import VectorStoreType
 from graphrag.vector_stores.azure_ai_search import AzureAISearchVectorStore
 from graphrag.vector_stores.cosmosdb import CosmosDBVectorStore
+from graphrag.vector_stores.flat import FlatVectorStore
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
 
 if TYPE_CHECKING:
@@ -86,3 +87,4 @@ VectorStoreFactory.register(
     VectorStoreType.AzureAISearch.value, AzureAISearchVectorStore
 )
 VectorStoreFactory.register(VectorStoreType.CosmosDB.value, CosmosDBVectorStore)
+VectorStoreFactory.register(VectorStoreType.Flat.value, FlatVectorStore)
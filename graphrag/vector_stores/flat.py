@@ -0,0 +1,339 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The memory-mapped flat vector storage implementation package."""
+
+import io
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pyarrow as pa
+from numpy.lib import format as npy_format
+
+from graphrag.data_model.types import TextEmbedder
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+VECTORS_FILE = "vectors.npy"
+SCALES_FILE = "scales.npy"
+NORMS_FILE = "norms.npy"
+DOCUMENTS_FILE_PATTERN = "documents-*.arrow"
+
+# The quantizations that can be configured
+QUANTIZATIONS = ["int8"]
+
+# Number of rows scored per matrix product, which bounds the float32 copy made of int8 rows
+SCORE_BLOCK_ROWS = 65_536
+
+
+class FlatVectorStore(BaseVectorStore):
+    """Flat vector storage implementation, for indexes small enough to be searched exhaustively.
+
+    Each collection is a directory under `db_uri`, holding the L2-normalized vectors as one contiguous `.npy` matrix with
+    their original norms alongside, and the ids, texts and attributes as Arrow IPC files. Vectors are stored as float32,
+    or as int8 with a per-row scale if `quantization` is `int8`, and are rescaled by their norms when documents are
+    returned. The matrix and the document files are memory-mapped, so opening a store reads no vectors and only the ids
+    into memory, texts and attributes are read for the returned rows only, and worker processes share the pages of one
+    file. Searches are exact: cosine similarities come from one matrix product over all rows, and the top k from
+    `argpartition`.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._vectors: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+        self._norms: np.ndarray | None = None
+        self._ids: pd.Series | None = None
+
+    def connect(self, **kwargs: Any) -> Any:
+        """Connect to the vector storage."""
+        self.db_connection = Path(kwargs["db_uri"])
+        self._open()
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        """Load documents into vector storage.
+
+        Appended vectors are written to the end of the matrix in place, so loading documents in batches does not rewrite
+        the vectors loaded before.
+        """
+        documents = [document for document in documents if document.vector is not None]
+        directory = self._directory()
+        if overwrite:
+            # release the memory maps before their files are removed
+            self._close()
+            shutil.rmtree(directory, ignore_errors=True)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if documents:
+            vectors, scales, norms = _encode(
+                np.asarray([document.vector for document in documents], np.float32),
+                self.kwargs.get("quantization"),
+            )
+            _append_rows(directory / VECTORS_FILE, vectors)
+            if scales is not None:
+                _append_rows(directory / SCALES_FILE, scales)
+            _append_rows(directory / NORMS_FILE, norms)
+            part = len(list(directory.glob(DOCUMENTS_FILE_PATTERN)))
+            table = pa.table({
+                "id": [document.id for document in documents],
+                "text": pa.array(
+                    [document.text for document in documents], pa.string()
+                ),
+                "attributes": pa.array(
+                    [json.dumps(document.attributes) for document in documents],
+                    pa.string(),
+                ),
+            })
+            with pa.ipc.new_file(
+                str(directory / f"documents-{part:05d}.arrow"), table.schema
+            ) as writer:
+                writer.write_table(table)
+
+        self._open()
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        """Build a query filter to filter documents by id."""
+        self.query_filter = include_ids.copy() if len(include_ids) > 0 else None
+        return self.query_filter
+
+    def similarity_search_by_vector(
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform an exact vector-based similarity search."""
+        return self.similarity_search_by_vectors(
+            [query_embedding], k, include_ids=include_ids
+        )[0]
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform an exact similarity search for several vectors, scored in one matrix product.
+
+        An id filter is applied as a boolean mask over the rows, and only the rows it selects are scored.
+        """
+        if len(query_embeddings) == 0:
+            return []
+        results: list[list[VectorStoreSearchResult]] = [[] for _ in query_embeddings]
+        if self._vectors is None or k <= 0:
+            return results
+
+        ids = include_ids if include_ids is not None else self.query_filter
+        rows = np.flatnonzero(self._id_mask(ids)) if ids is not None else None
+        queries = _normalize(np.asarray(query_embeddings, np.float32))
+        scores = self._scores(queries, rows)
+        k = min(k, len(scores))
+        if k == 0:
+            return results
+
+        top = np.argpartition(scores, -k, axis=0)[-k:]
+        top_scores = np.take_along_axis(scores, top, axis=0)
+        order = np.argsort(-top_scores, axis=0, kind="stable")
+        top = np.take_along_axis(top, order, axis=0)
+        top_scores = np.take_along_axis(top_scores, order, axis=0)
+        if rows is not None:
+            top = rows[top]
+
+        for query_index, query_results in enumerate(results):
+            query_results.extend(
+                VectorStoreSearchResult(
+                    document=self._document(int(row)), score=float(score)
+                )
+                for row, score in zip(
+                    top[:, query_index], top_scores[:, query_index], strict=True
+                )
+            )
+        return results
+
+    def similarity_search_by_text(
+        self,
+        text: str,
+        text_embedder: TextEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a similarity search using a given input text."""
+        query_embedding = text_embedder(text)
+        if query_embedding:
+            return self.similarity_search_by_vector(
+                query_embedding, k, include_ids=include_ids
+            )
+        return []
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        """Search for a document by id."""
+        if self.document_collection is not None:
+            rows = np.flatnonzero(self._id_mask([id]))
+            if len(rows) > 0:
+                return self._document(int(rows[0]))
+        return VectorStoreDocument(id=id, text=None, vector=None)
+
+    def _directory(self) -> Path:
+        return Path(self.db_connection) / self.collection_name
+
+    def _open(self) -> None:
+        """Memory-map the vectors and documents of the collection and read its ids, if it exists."""
+        self._close()
+        directory = self._directory()
+        vectors_path = directory / VECTORS_FILE
+        if not vectors_path.exists():
+            return
+
+        vectors = np.load(vectors_path, mmap_mode="r")
+        scales_path = directory / SCALES_FILE
+        self._scales = (
+            np.load(scales_path, mmap_mode="r") if scales_path.exists() else None
+        )
+        self._norms = np.load(directory / NORMS_FILE, mmap_mode="r")
+        self.document_collection = pa.concat_tables([
+            pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            for path in sorted(directory.glob(DOCUMENTS_FILE_PATTERN))
+        ])
+        ids = self.document_collection.column("id").to_pandas()
+        if len(ids) != len(vectors):
+            msg = f"Flat vector store collection {directory} has {len(vectors)} vectors for {len(ids)} documents"
+            raise ValueError(msg)
+        self._vectors = vectors
+        self._ids = ids
+
+    def _close(self) -> None:
+        """Drop the memory maps of the collection."""
+        self._vectors = None
+        self._scales = None
+        self._norms = None
+        self._ids = None
+        self.document_collection = None
+
+    def _id_mask(self, include_ids: list[str] | list[int]) -> np.ndarray:
+        """Build a boolean mask of the rows whose id is in `include_ids`."""
+        if self._ids is None:
+            return np.zeros(0, dtype=bool)
+        return self._ids.isin(include_ids).to_numpy()
+
+    def _scores(self, queries: np.ndarray, rows: np.ndarray | None) -> np.ndarray:
+        """Compute the cosine similarity of every (selected) row to every query, as a rows x queries matrix."""
+        if self._vectors is None:
+            return np.empty((0, len(queries)), np.float32)
+        vectors = self._vectors if rows is None else self._vectors[rows]
+        scores = np.empty((len(vectors), len(queries)), np.float32)
+        for start in range(0, len(vectors), SCORE_BLOCK_ROWS):
+            block = vectors[start : start + SCORE_BLOCK_ROWS]
+            scores[start : start + SCORE_BLOCK_ROWS] = (
+                block.astype(np.float32, copy=False) @ queries.T
+            )
+        if self._scales is not None:
+            scales = self._scales if rows is None else self._scales[rows]
+            scores *= scales[:, np.newaxis]
+        return scores
+
+    def _document(self, row: int) -> VectorStoreDocument:
+        if (
+            self._vectors is None
+            or self._norms is None
+            or self.document_collection is None
+        ):
+            msg = "Flat vector store collection is not loaded"
+            raise ValueError(msg)
+        vector = self._vectors[row].astype(np.float32)
+        if self._scales is not None:
+            vector *= self._scales[row]
+        vector *= self._norms[row]
+        doc = self.document_collection.slice(row, 1).to_pylist()[0]
+        return VectorStoreDocument(
+            id=doc["id"],
+            text=doc["text"],
+            vector=vector.tolist(),
+            attributes=json.loads(doc["attributes"]),
+        )
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length, leaving zero rows unchanged."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _encode(
+    vectors: np.ndarray, quantization: str | None
+) -> tuple[np.ndarray, np.ndarray | None, np.ndarray]:
+    """Normalize vectors and, if configured, quantize them to int8 with a per-row scale.
+
+    Returns the encoded vectors, their scales if quantized, and their original norms.
+    """
+    norms = np.linalg.norm(vectors, axis=1).astype(np.float32)
+    vectors = _normalize(vectors)
+    if quantization is None:
+        return vectors, None, norms
+    if quantization not in QUANTIZATIONS:
+        msg = f"Unknown flat vector store quantization: {quantization}. Expected one of {QUANTIZATIONS}"
+        raise ValueError(msg)
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    quantized = np.round(vectors / scales[:, np.newaxis]).astype(np.int8)
+    return quantized, scales.astype(np.float32), norms
+
+
+def _append_rows(path: Path, rows: np.ndarray) -> None:
+    """Append rows to a `.npy` matrix.
+
+    The rows are written to the end of the file and its header is rewritten in place, which numpy pads so that the row
+    count can grow. Files whose header cannot hold the new shape are rewritten whole.
+    """
+    if not path.exists():
+        np.save(path, rows)
+        return
+
+    with path.open("r+b") as file:
+        version = npy_format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = npy_format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = npy_format.read_array_header_2_0(file)
+        if dtype != rows.dtype or fortran_order or shape[1:] != rows.shape[1:]:
+            msg = f"Cannot append {rows.dtype} rows of shape {rows.shape[1:]} to {path}, which holds {dtype} rows of shape {shape[1:]}"
+            raise ValueError(msg)
+
+        header_size = file.tell()
+        header = io.BytesIO()
+        header_fields = {
+            "descr": npy_format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (shape[0] + len(rows), *shape[1:]),
+        }
+        if version == (1, 0):
+            npy_format.write_array_header_1_0(header, header_fields)
+        else:
+            npy_format.write_array_header_2_0(header, header_fields)
+
+        if len(header.getvalue()) == header_size:
+            # the data is written before the header, so an interrupted append leaves the previous matrix readable
+            file.seek(0, os.SEEK_END)
+            file.write(np.ascontiguousarray(rows).tobytes())
+            file.flush()
+            file.seek(0)
+            file.write(header.getvalue())
+            return
+
+    temp_path = path.with_suffix(".tmp.npy")
+    np.save(temp_path, np.concatenate([np.load(path), rows]))
+    temp_path.replace(path)
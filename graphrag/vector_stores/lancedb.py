@@ -4,13 +4,16 @@
 """The LanceDB vector storage implementation package."""
 
 import json  # noqa: I001
-from typing import Any
+from typing import Any, Literal
 
+import numpy as np
 import pyarrow as pa
 
+from graphrag.config.defaults import vector_store_defaults
 from graphrag.data_model.types import TextEmbedder
 
 from graphrag.vector_stores.base import (
+    DEFAULT_VECTOR_SIZE,
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
@@ -18,8 +21,21 @@ from graphrag.vector_stores.base import (
 import lancedb
 
 
+# The ANN index types that can be configured, by their LanceDB names
+INDEX_TYPES: dict[str, Literal["IVF_PQ", "IVF_HNSW_PQ", "IVF_HNSW_SQ"]] = {
+    "ivf_pq": "IVF_PQ",
+    "ivf_hnsw_pq": "IVF_HNSW_PQ",
+    "ivf_hnsw_sq": "IVF_HNSW_SQ",
+}
+
+
 class LanceDBVectorStore(BaseVectorStore):
-    """LanceDB vector storage implementation."""
+    """LanceDB vector storage implementation.
+
+    Vectors are stored as fixed-size float32 lists. After documents are loaded, `create_index` builds a scalar index on
+    `id` and, if `index_type` is configured and the table holds at least `index_min_rows` documents, an ANN index on the
+    vectors, with `index_params` passed on to LanceDB.
+    """
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -38,109 +54,150 @@ class LanceDBVectorStore(BaseVectorStore):
     def load_documents(
         self, documents: list[VectorStoreDocument], overwrite: bool = True
     ) -> None:
-        """Load documents into vector storage."""
-        data = [
-            {
-                "id": document.id,
-                "text": document.text,
-                "vector": document.vector,
-                "attributes": json.dumps(document.attributes),
-            }
-            for document in documents
-            if document.vector is not None
-        ]
-
-        if len(data) == 0:
-            data = None
-
-        schema = pa.schema([
-            pa.field("id", pa.string()),
-            pa.field("text", pa.string()),
-            pa.field("vector", pa.list_(pa.float64())),
-            pa.field("attributes", pa.string()),
-        ])
-        # NOTE: If modifying the next section of code, ensure that the schema remains the same.
-        #       The pyarrow format of the 'vector' field may change if the order of operations is changed
-        #       and will break vector search.
+        """Load documents into vector storage.
+
+        A table written with variable-length float64 vectors by an earlier version is migrated before documents are added.
+        """
+        documents = [document for document in documents if document.vector is not None]
         if overwrite:
-            if data:
-                self.document_collection = self.db_connection.create_table(
-                    self.collection_name, data=data, mode="overwrite"
-                )
-            else:
-                self.document_collection = self.db_connection.create_table(
-                    self.collection_name, schema=schema, mode="overwrite"
-                )
+            self.document_collection = self.db_connection.create_table(
+                self.collection_name,
+                data=_to_arrow(documents, _vector_size(self.kwargs)),
+                mode="overwrite",
+            )
         else:
             # add data to existing table
             self.document_collection = self.db_connection.open_table(
                 self.collection_name
             )
-            if data:
-                self.document_collection.add(data)
+            if _is_legacy_schema(self.document_collection.schema):
+                self.migrate()
+            if documents:
+                self.document_collection.add(
+                    _to_arrow(documents, _vector_size(self.kwargs))
+                )
+
+    def migrate(self) -> None:
+        """Rewrite a table with variable-length float64 vectors to fixed-size float32 vectors, rebuilding its indices."""
+        table = self.document_collection.to_arrow()
+        vectors = table.column("vector").combine_chunks()
+        vector_size = len(vectors[0]) if len(vectors) > 0 else _vector_size(self.kwargs)
+        vector_type = pa.list_(pa.float32(), vector_size)
+        table = table.set_column(
+            table.schema.get_field_index("vector"),
+            pa.field("vector", vector_type),
+            pa.FixedSizeListArray.from_arrays(
+                vectors.flatten().cast(pa.float32()), vector_size
+            ),
+        )
+        self.document_collection = self.db_connection.create_table(
+            self.collection_name, data=table, mode="overwrite"
+        )
+        self.create_index()
+
+    def create_index(self) -> None:
+        """Build a scalar index on id and, if configured and the table is large enough, an ANN index on the vectors."""
+        if self.document_collection is None:
+            return
+        num_rows = self.document_collection.count_rows()
+        if num_rows == 0:
+            return
+        self.document_collection.create_scalar_index("id", replace=True)
+
+        index_type = self.kwargs.get("index_type")
+        min_rows = self.kwargs.get("index_min_rows")
+        if index_type is None or num_rows < (
+            min_rows if min_rows is not None else vector_store_defaults.index_min_rows
+        ):
+            return
+        if index_type not in INDEX_TYPES:
+            msg = f"Unknown LanceDB index type: {index_type}. Expected one of {list(INDEX_TYPES)}"
+            raise ValueError(msg)
+        self.document_collection.create_index(
+            vector_column_name="vector",
+            index_type=INDEX_TYPES[index_type],
+            replace=True,
+            **(self.kwargs.get("index_params") or {}),
+        )
 
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
-        if len(include_ids) == 0:
-            self.query_filter = None
-        else:
-            if isinstance(include_ids[0], str):
-                id_filter = ", ".join([f"'{id}'" for id in include_ids])
-                self.query_filter = f"id in ({id_filter})"
-            else:
-                self.query_filter = (
-                    f"id in ({', '.join([str(id) for id in include_ids])})"
-                )
+        self.query_filter = _id_filter(include_ids) if len(include_ids) > 0 else None
         return self.query_filter
 
     def similarity_search_by_vector(
-        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
-        """Perform a vector-based similarity search."""
-        if self.query_filter:
-            docs = (
-                self.document_collection.search(
-                    query=query_embedding, vector_column_name="vector"
-                )
-                .where(self.query_filter, prefilter=True)
-                .limit(k)
-                .to_list()
-            )
-        else:
-            docs = (
-                self.document_collection.search(
-                    query=query_embedding, vector_column_name="vector"
-                )
-                .limit(k)
-                .to_list()
-            )
-        return [
-            VectorStoreSearchResult(
-                document=VectorStoreDocument(
-                    id=doc["id"],
-                    text=doc["text"],
-                    vector=doc["vector"],
-                    attributes=json.loads(doc["attributes"]),
-                ),
-                score=1 - abs(float(doc["_distance"])),
-            )
-            for doc in docs
-        ]
+        """Perform a vector-based similarity search.
+
+        An id filter is applied before the search, served by the scalar index on `id`.
+        """
+        if include_ids is not None and len(include_ids) == 0:
+            return []
+        query_filter = (
+            _id_filter(include_ids) if include_ids is not None else self.query_filter
+        )
+        query = self.document_collection.search(
+            query=query_embedding, vector_column_name="vector"
+        )
+        if query_filter:
+            query = query.where(query_filter, prefilter=True)
+        return [_to_search_result(doc) for doc in query.limit(k).to_list()]
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Search several vectors in one LanceDB query, whose rows are tagged with the index of their vector."""
+        if len(query_embeddings) == 0 or (
+            include_ids is not None and len(include_ids) == 0
+        ):
+            return [[] for _ in query_embeddings]
+        query_filter = (
+            _id_filter(include_ids) if include_ids is not None else self.query_filter
+        )
+        query = self.document_collection.search(
+            query=np.asarray(query_embeddings, dtype=np.float32),
+            vector_column_name="vector",
+        )
+        if query_filter:
+            query = query.where(query_filter, prefilter=True)
+
+        results: list[list[VectorStoreSearchResult]] = [[] for _ in query_embeddings]
+        for doc in query.limit(k).to_list():
+            results[int(doc.get("query_index", 0))].append(_to_search_result(doc))
+        for query_results in results:
+            query_results.sort(key=lambda result: result.score, reverse=True)
+        return results
 
     def similarity_search_by_text(
-        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+        self,
+        text: str,
+        text_embedder: TextEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
         """Perform a similarity search using a given input text."""
         query_embedding = text_embedder(text)
         if query_embedding:
-            return self.similarity_search_by_vector(query_embedding, k)
+            return self.similarity_search_by_vector(
+                query_embedding, k, include_ids=include_ids
+            )
         return []
 
     def search_by_id(self, id: str) -> VectorStoreDocument:
         """Search for a document by id."""
         doc = (
             self.document_collection.search()
-            .where(f"id == '{id}'", prefilter=True)
+            .where(f"id == {_sql_literal(id)}", prefilter=True)
             .to_list()
         )
         if doc:
@@ -151,3 +208,67 @@ class LanceDBVectorStore(BaseVectorStore):
                 attributes=json.loads(doc[0]["attributes"]),
             )
         return VectorStoreDocument(id=id, text=None, vector=None)
+
+
+def _vector_size(kwargs: dict[str, Any]) -> int:
+    return kwargs.get("vector_size") or DEFAULT_VECTOR_SIZE
+
+
+def _is_legacy_schema(schema: pa.Schema) -> bool:
+    """Return whether vectors are stored in the variable-length float64 format of earlier versions."""
+    vector_type = schema.field("vector").type
+    return not (
+        pa.types.is_fixed_size_list(vector_type)
+        and pa.types.is_float32(vector_type.value_type)
+    )
+
+
+def _to_arrow(
+    documents: list[VectorStoreDocument], default_vector_size: int
+) -> pa.Table:
+    """Convert documents to a table of fixed-size float32 vectors and JSON-encoded attributes."""
+    ids = pa.array([document.id for document in documents])
+    vectors = np.asarray([document.vector for document in documents], dtype=np.float32)
+    vector_size = vectors.shape[1] if vectors.ndim == 2 else default_vector_size
+    schema = pa.schema([
+        pa.field("id", ids.type if len(documents) > 0 else pa.string()),
+        pa.field("text", pa.string()),
+        pa.field("vector", pa.list_(pa.float32(), vector_size)),
+        pa.field("attributes", pa.string()),
+    ])
+    return pa.Table.from_arrays(
+        [
+            ids.cast(schema.field("id").type),
+            pa.array([document.text for document in documents], pa.string()),
+            pa.FixedSizeListArray.from_arrays(pa.array(vectors.ravel()), vector_size),
+            pa.array(
+                [json.dumps(document.attributes) for document in documents],
+                pa.string(),
+            ),
+        ],
+        schema=schema,
+    )
+
+
+def _sql_literal(value: str | int) -> str:
+    """Render an id as a SQL literal, escaping quotes in string ids."""
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
+
+
+def _id_filter(include_ids: list[str] | list[int]) -> str:
+    """Build a filter on a set of ids."""
+    return f"id in ({', '.join(_sql_literal(id) for id in include_ids)})"
+
+
+def _to_search_result(doc: dict[str, Any]) -> VectorStoreSearchResult:
+    return VectorStoreSearchResult(
+        document=VectorStoreDocument(
+            id=doc["id"],
+            text=doc["text"],
+            vector=doc["vector"],
+            attributes=json.loads(doc["attributes"]),
+        ),
+        score=1 - abs(float(doc["_distance"])),
+    )
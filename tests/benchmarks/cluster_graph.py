@@ -0,0 +1,113 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+"""Compare the runtime and modularity of the hierarchical Leiden backends.
+
+Run with `python -m tests.benchmarks.cluster_graph --nodes 50000`.
+"""
+
+import argparse
+import time
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from graspologic.partition import modularity
+
+from graphrag.config.enums import ClusterGraphBackendType
+from graphrag.index.operations.cluster_graph import Communities, cluster_graph
+from graphrag.index.utils.compact_graph import CompactGraph
+
+
+def synthetic_relationships(
+    nodes: int, degree: int, groups: int, mixing: float, seed: int
+) -> pd.DataFrame:
+    """Build a relationships table with planted groups, like an extracted entity graph."""
+    rng = np.random.default_rng(seed)
+    count = nodes * degree // 2
+    sources = rng.integers(0, nodes, count)
+    group_size = max(nodes // groups, 1)
+    local = sources // group_size * group_size + rng.integers(0, group_size, count)
+    targets = np.where(
+        rng.random(count) < mixing, rng.integers(0, nodes, count), local % nodes
+    )
+    names = np.asarray([f"ENTITY {i}" for i in range(nodes)], dtype=object)
+    return pd.DataFrame({
+        "source": names[sources],
+        "target": names[targets],
+        "weight": rng.integers(1, 10, count).astype(float),
+    })
+
+
+def leaf_partition(communities: Communities) -> dict[str, int]:
+    """Return the deepest community of every node."""
+    partition: dict[str, int] = {}
+    for _, community, _, nodes in sorted(communities, key=lambda row: row[0]):
+        for node in nodes:
+            partition[node] = community
+    return partition
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--mixing", type=float, default=0.1)
+    parser.add_argument("--max-cluster-size", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0xDEADBEEF)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    relationships = synthetic_relationships(
+        args.nodes, args.degree, args.groups, args.mixing, args.seed
+    )
+    graph = nx.from_pandas_edgelist(relationships, edge_attr=["weight"])
+    print(
+        f"graph: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges, "
+        f"max_cluster_size={args.max_cluster_size}"
+    )
+
+    results: dict[ClusterGraphBackendType, Communities] = {}
+    for backend in ClusterGraphBackendType:
+        timings = []
+        communities: Communities = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            # time the table-to-communities path, as create_communities runs it
+            communities = cluster_graph(
+                CompactGraph.from_dataframe(relationships),
+                args.max_cluster_size,
+                use_lcc=True,
+                seed=args.seed,
+                backend=backend,
+            )
+            timings.append(time.perf_counter() - start)
+        results[backend] = communities
+
+        level_zero = {
+            node: community
+            for level, community, _, nodes in communities
+            if level == 0
+            for node in nodes
+        }
+        leaves = leaf_partition(communities)
+        clustered = graph.subgraph(level_zero)
+        print(
+            f"{backend.value:>12}: best {min(timings):.3f}s, "
+            f"median {float(np.median(timings)):.3f}s, "
+            f"{len(communities)} communities, "
+            f"{max(level for level, _, _, _ in communities) + 1} levels, "
+            f"modularity level 0 {modularity(clustered, level_zero):.4f}, "
+            f"leaves {modularity(clustered, leaves):.4f}"
+        )
+
+    identical = (
+        results[ClusterGraphBackendType.Graspologic]
+        == results[ClusterGraphBackendType.EdgeList]
+    )
+    print(f"identical communities: {identical}")
+
+
+if __name__ == "__main__":
+    main()
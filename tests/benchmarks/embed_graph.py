@@ -0,0 +1,123 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+"""Compare the runtime of the node2vec backends on a synthetic power-law graph.
+
+Run with `python -m tests.benchmarks.embed_graph --nodes 200000 --workers 1 4 16 --skip-graspologic`.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from graphrag.config.enums import EmbedGraphBackendType
+from graphrag.config.models.embed_graph_config import EmbedGraphConfig
+from graphrag.index.operations.embed_graph.embed_graph import embed_graph
+from graphrag.index.operations.embed_graph.typing import NodeEmbeddings
+from graphrag.index.utils.compact_graph import CompactGraph
+
+
+def power_law_relationships(
+    nodes: int, degree: int, exponent: float, seed: int
+) -> pd.DataFrame:
+    """Build a Chung-Lu relationships table whose node degrees follow a power law, like an extracted entity graph."""
+    rng = np.random.default_rng(seed)
+    expected_degrees = (1 - rng.random(nodes)) ** (-1 / (exponent - 1))
+    probabilities = expected_degrees / expected_degrees.sum()
+    count = nodes * degree // 2
+    sources = rng.choice(nodes, count, p=probabilities)
+    targets = rng.choice(nodes, count, p=probabilities)
+    keep = sources != targets
+    names = np.asarray([f"ENTITY {i}" for i in range(nodes)], dtype=object)
+    return pd.DataFrame({
+        "source": names[sources[keep]],
+        "target": names[targets[keep]],
+        "weight": rng.integers(1, 10, keep.sum()).astype(float),
+    })
+
+
+def neighbor_similarity(
+    embeddings: NodeEmbeddings, relationships: pd.DataFrame, seed: int
+) -> tuple[float, float]:
+    """Return the mean cosine similarity of linked nodes, and of random pairs of nodes."""
+    labels = pd.Index(list(embeddings))
+    vectors = np.asarray(list(embeddings.values()))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    sources = labels.get_indexer(relationships["source"])
+    targets = labels.get_indexer(relationships["target"])
+    linked = (sources >= 0) & (targets >= 0)
+    sources, targets = sources[linked], targets[linked]
+    rng = np.random.default_rng(seed)
+    random_pairs = rng.integers(0, len(labels), (2, len(sources)))
+    return (
+        float(np.mean(np.sum(vectors[sources] * vectors[targets], axis=1))),
+        float(
+            np.mean(np.sum(vectors[random_pairs[0]] * vectors[random_pairs[1]], axis=1))
+        ),
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--degree", type=int, default=6)
+    parser.add_argument("--exponent", type=float, default=2.5)
+    parser.add_argument("--dimensions", type=int, default=128)
+    parser.add_argument("--num-walks", type=int, default=10)
+    parser.add_argument("--walk-length", type=int, default=40)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--node-sample-rate", type=float, default=1.0)
+    parser.add_argument("--skip-graspologic", action="store_true")
+    parser.add_argument("--seed", type=int, default=86)
+    args = parser.parse_args()
+
+    relationships = power_law_relationships(
+        args.nodes, args.degree, args.exponent, args.seed
+    )
+    graph = CompactGraph.from_dataframe(relationships)
+    print(
+        f"graph: {graph.num_nodes} nodes, {graph.num_edges} edges, "
+        f"max degree {graph.degree().max()}, {args.dimensions} dimensions"
+    )
+
+    runs: list[tuple[str, EmbedGraphConfig]] = []
+    base = {
+        "enabled": True,
+        "dimensions": args.dimensions,
+        "num_walks": args.num_walks,
+        "walk_length": args.walk_length,
+        "random_seed": args.seed,
+    }
+    if not args.skip_graspologic:
+        runs.append((
+            "graspologic",
+            EmbedGraphConfig(**base, backend=EmbedGraphBackendType.Graspologic),
+        ))
+    runs.extend(
+        (
+            f"parallel x{workers}",
+            EmbedGraphConfig(
+                **base,
+                backend=EmbedGraphBackendType.Parallel,
+                workers=workers,
+                node_sample_rate=args.node_sample_rate,
+            ),
+        )
+        for workers in args.workers
+    )
+
+    for name, config in runs:
+        start = time.perf_counter()
+        embeddings = embed_graph(CompactGraph.from_dataframe(relationships), config)
+        elapsed = time.perf_counter() - start
+        linked, random_pairs = neighbor_similarity(embeddings, relationships, args.seed)
+        print(
+            f"{name:>14}: {elapsed:.3f}s, {len(embeddings)} nodes embedded, "
+            f"cosine similarity linked {linked:.4f}, random {random_pairs:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -110,6 +110,10 @@ class TestAzureAISearchVectorStore:
 
         filter_query = vector_store.filter_by_id(["doc1", "doc2"])
         assert filter_query == "search.in(id, 'doc1,doc2', ',')"
+        # quotes are escaped, and ids containing the delimiter switch to another one
+        filter_query = vector_store.filter_by_id(["O'Neil", "Smith, John"])
+        assert filter_query == "search.in(id, 'O''Neil|Smith, John', '|')"
+        vector_store.filter_by_id([])
 
         vector_results = vector_store.similarity_search_by_vector(
             [0.1, 0.2, 0.3, 0.4, 0.5], k=2
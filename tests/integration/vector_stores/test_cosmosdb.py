@@ -65,7 +65,8 @@ def test_vector_store_operations():
         vector_results = vector_store.similarity_search_by_vector(
             [0.1, 0.2, 0.3, 0.4, 0.5], k=2
         )
-        assert len(vector_results) > 0
+        # the stored filter applies to searches without include_ids
+        assert [result.document.id for result in vector_results] == ["doc1"]
 
         text_results = vector_store.similarity_search_by_text(
             "test query", mock_embedder, k=2
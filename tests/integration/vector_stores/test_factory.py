@@ -12,6 +12,7 @@ from graphrag.vector_stores.azure_ai_search import AzureAISearchVectorStore
 from graphrag.vector_stores.base import BaseVectorStore
 from graphrag.vector_stores.cosmosdb import CosmosDBVectorStore
 from graphrag.vector_stores.factory import VectorStoreFactory
+from graphrag.vector_stores.flat import FlatVectorStore
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
 
 
@@ -27,6 +28,19 @@ def test_create_lancedb_vector_store():
     assert vector_store.collection_name == "test_collection"
 
 
+def test_create_flat_vector_store():
+    kwargs = {
+        "collection_name": "test_collection",
+        "db_uri": "/tmp/flat",
+        "quantization": "int8",
+    }
+    vector_store = VectorStoreFactory.create_vector_store(
+        VectorStoreType.Flat.value, kwargs
+    )
+    assert isinstance(vector_store, FlatVectorStore)
+    assert vector_store.collection_name == "test_collection"
+
+
 @pytest.mark.skip(reason="Azure AI Search requires credentials and setup")
 def test_create_azure_ai_search_vector_store():
     kwargs = {
@@ -83,6 +97,7 @@ def test_get_vector_store_types():
     vector_store_types = VectorStoreFactory.get_vector_store_types()
     # Check that built-in types are registered
     assert VectorStoreType.LanceDB.value in vector_store_types
+    assert VectorStoreType.Flat.value in vector_store_types
     assert VectorStoreType.AzureAISearch.value in vector_store_types
     assert VectorStoreType.CosmosDB.value in vector_store_types
 
@@ -116,10 +131,23 @@ def test_register_class_directly_works():
         def load_documents(self, documents, overwrite=True):
             pass
 
-        def similarity_search_by_vector(self, query_embedding, k=10, **kwargs):
+        def similarity_search_by_vector(
+            self,
+            query_embedding,
+            k=10,
+            include_ids: list[str] | list[int] | None = None,
+            **kwargs,
+        ):
             return []
 
-        def similarity_search_by_text(self, text, text_embedder, k=10, **kwargs):
+        def similarity_search_by_text(
+            self,
+            text,
+            text_embedder,
+            k=10,
+            include_ids: list[str] | list[int] | None = None,
+            **kwargs,
+        ):
             return []
 
         def filter_by_id(self, include_ids):
@@ -0,0 +1,140 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Integration tests for the flat vector store implementation."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from graphrag.vector_stores.base import VectorStoreDocument
+from graphrag.vector_stores.flat import VECTORS_FILE, FlatVectorStore
+
+
+def _documents(start: int, stop: int) -> list[VectorStoreDocument]:
+    return [
+        VectorStoreDocument(
+            id=str(i),
+            text=f"Document {i}",
+            vector=[float(i == j) * (i + 1) for j in range(4)],
+            attributes={"title": f"Doc {i}"},
+        )
+        for i in range(start, stop)
+    ]
+
+
+def test_vector_store_operations():
+    """Test loading, appending and exact search."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        vector_store = FlatVectorStore(collection_name="test_collection")
+        vector_store.connect(db_uri=temp_dir)
+        assert vector_store.similarity_search_by_vector([1.0, 0.0, 0.0, 0.0]) == []
+
+        vector_store.load_documents(_documents(0, 2))
+        vector_store.load_documents(_documents(2, 4), overwrite=False)
+
+        vectors = np.load(Path(temp_dir) / "test_collection" / VECTORS_FILE)
+        assert vectors.dtype == np.float32
+        assert vectors.shape == (4, 4)
+
+        doc = vector_store.search_by_id("2")
+        assert doc.text == "Document 2"
+        assert doc.attributes == {"title": "Doc 2"}
+        # vectors are searched normalized, but returned as they were loaded
+        assert np.allclose(doc.vector, [0.0, 0.0, 3.0, 0.0])  # type: ignore
+        assert vector_store.search_by_id("missing").text is None
+
+        results = vector_store.similarity_search_by_vector([0.0, 0.1, 1.0, 0.0], k=2)
+        assert [result.document.id for result in results] == ["2", "1"]
+        assert results[0].score > results[1].score
+
+        # a new store over the same directory reads the collection back
+        reopened = FlatVectorStore(collection_name="test_collection")
+        reopened.connect(db_uri=temp_dir)
+        assert reopened.search_by_id("3").text == "Document 3"
+
+        vector_store.load_documents(_documents(0, 1))
+        assert vector_store.search_by_id("3").text is None
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_filtered_and_batched_search():
+    """Test that id filters and batched queries return the same results as single searches."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        vector_store = FlatVectorStore(collection_name="test_collection")
+        vector_store.connect(db_uri=temp_dir)
+        vector_store.load_documents(_documents(0, 4))
+
+        results = vector_store.similarity_search_by_vector(
+            [1.0, 1.0, 0.0, 0.0], k=3, include_ids=["1", "3"]
+        )
+        assert results[0].document.id == "1"
+        assert {result.document.id for result in results} == {"1", "3"}
+        assert (
+            vector_store.similarity_search_by_vector(
+                [1.0, 0.0, 0.0, 0.0], include_ids=[]
+            )
+            == []
+        )
+
+        vector_store.filter_by_id(["0", "2"])
+        results = vector_store.similarity_search_by_vector([0.0, 0.0, 0.0, 1.0], k=4)
+        assert {result.document.id for result in results} == {"0", "2"}
+        vector_store.filter_by_id([])
+
+        queries = [[0.1, 0.2, 0.3, 1.0], [1.0, 0.3, 0.2, 0.1]]
+        batched = vector_store.similarity_search_by_vectors(queries, k=2)
+        for query, query_results in zip(queries, batched, strict=True):
+            single = vector_store.similarity_search_by_vector(query, k=2)
+            assert [r.document.id for r in query_results] == [
+                r.document.id for r in single
+            ]
+        assert [[r.document.id for r in results] for results in batched] == [
+            ["3", "2"],
+            ["0", "1"],
+        ]
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_int8_quantization():
+    """Test that quantized vectors are stored as int8 and scored close to float32 vectors."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(50, 16))
+        documents = [
+            VectorStoreDocument(id=str(i), text=None, vector=vector.tolist())
+            for i, vector in enumerate(vectors)
+        ]
+        vector_store = FlatVectorStore(
+            collection_name="test_collection", quantization="int8"
+        )
+        vector_store.connect(db_uri=temp_dir)
+        vector_store.load_documents(documents[:20])
+        vector_store.load_documents(documents[20:], overwrite=False)
+
+        stored = np.load(Path(temp_dir) / "test_collection" / VECTORS_FILE)
+        assert stored.dtype == np.int8
+        assert stored.shape == (50, 16)
+
+        query = vectors[7]
+        results = vector_store.similarity_search_by_vector(query.tolist(), k=5)
+        assert results[0].document.id == "7"
+        assert abs(results[0].score - 1.0) < 0.01
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        expected = vectors @ query / norms
+        for result in results:
+            assert abs(result.score - expected[int(result.document.id)]) < 0.02
+        assert np.allclose(
+            results[0].document.vector,  # type: ignore
+            vectors[7],
+            atol=float(0.01 * np.linalg.norm(vectors[7])),
+        )
+    finally:
+        shutil.rmtree(temp_dir)
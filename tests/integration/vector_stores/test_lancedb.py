@@ -7,6 +7,8 @@ import shutil
 import tempfile
 
 import numpy as np
+import pyarrow as pa
+import pytest
 
 from graphrag.vector_stores.base import VectorStoreDocument
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
@@ -168,5 +170,162 @@ def test_filter_search():
         ids = [result.document.id for result in results]
         assert "3" not in ids
         assert set(ids).issubset({"1", "2"})
+
+        # a filter passed to the search only applies to that search
+        vector_store.filter_by_id([])
+        results = vector_store.similarity_search_by_vector(
+            [0.1, 0.2, 0.3, 0.4, 0.5], k=3, include_ids=["3"]
+        )
+        assert [result.document.id for result in results] == ["3"]
+        results = vector_store.similarity_search_by_vector(
+            [0.1, 0.2, 0.3, 0.4, 0.5], k=3
+        )
+        assert len(results) == 3
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_float32_schema_and_migration():
+    """Test that vectors are stored as fixed-size float32 lists, and that legacy tables are migrated on append."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        vector_store = LanceDBVectorStore(
+            collection_name="legacy_collection", index_type="ivf_pq", index_min_rows=10
+        )
+        vector_store.connect(db_uri=temp_dir)
+
+        # a table written by earlier versions, with variable-length float64 vectors
+        vector_store.db_connection.create_table(
+            vector_store.collection_name,
+            data=[
+                {
+                    "id": "1",
+                    "text": "This is document 1",
+                    "vector": [0.1, 0.2, 0.3, 0.4, 0.5],
+                    "attributes": '{"title": "Doc 1"}',
+                }
+            ],
+            schema=pa.schema([
+                pa.field("id", pa.string()),
+                pa.field("text", pa.string()),
+                pa.field("vector", pa.list_(pa.float64())),
+                pa.field("attributes", pa.string()),
+            ]),
+        )
+
+        vector_store.load_documents(
+            [
+                VectorStoreDocument(
+                    id="2",
+                    text="This is document 2",
+                    vector=[0.2, 0.3, 0.4, 0.5, 0.6],
+                    attributes={"title": "Doc 2"},
+                )
+            ],
+            overwrite=False,
+        )
+        vector_store.create_index()
+
+        vector_type = vector_store.document_collection.schema.field("vector").type
+        assert vector_type == pa.list_(pa.float32(), 5)
+        assert vector_store.document_collection.count_rows() == 2
+        # too few rows for the ANN index, but the id lookup is still served
+        result = vector_store.search_by_id("1")
+        assert result.attributes["title"] == "Doc 1"
+        assert result.vector is not None
+        assert np.allclose(result.vector, [0.1, 0.2, 0.3, 0.4, 0.5])
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_create_index():
+    """Test that the ANN index is built once the table is large enough, and that unknown index types are rejected."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        vector_store = LanceDBVectorStore(
+            collection_name="indexed_collection",
+            index_type="ivf_pq",
+            index_min_rows=0,
+            index_params={"num_partitions": 2, "num_sub_vectors": 4},
+        )
+        vector_store.connect(db_uri=temp_dir)
+        # no table is created before documents are loaded
+        vector_store.create_index()
+
+        rng = np.random.default_rng(0)
+        vectors = rng.random((300, 16), dtype=np.float32)
+        vector_store.load_documents([
+            VectorStoreDocument(
+                id=str(i), text=f"Document {i}", vector=vector.tolist(), attributes={}
+            )
+            for i, vector in enumerate(vectors)
+        ])
+        vector_store.create_index()
+
+        indexed_columns = {
+            column
+            for index in vector_store.document_collection.list_indices()
+            for column in index.columns
+        }
+        assert indexed_columns == {"id", "vector"}
+        results = vector_store.similarity_search_by_vector(vectors[7].tolist(), k=5)
+        assert len(results) == 5
+
+        invalid_store = LanceDBVectorStore(
+            collection_name="indexed_collection", index_type="flat", index_min_rows=0
+        )
+        invalid_store.connect(db_uri=temp_dir)
+        with pytest.raises(ValueError, match="Unknown LanceDB index type"):
+            invalid_store.create_index()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_batched_search():
+    """Test that several vectors are searched in one query, with results kept per vector."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        vector_store = LanceDBVectorStore(collection_name="batched_collection")
+        vector_store.connect(db_uri=temp_dir)
+        vector_store.load_documents([
+            VectorStoreDocument(
+                id=str(i),
+                text=f"Document {i}",
+                vector=[float(i == j) for j in range(3)],
+                attributes={},
+            )
+            for i in range(3)
+        ])
+
+        queries = [[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+        results = vector_store.similarity_search_by_vectors(queries, k=2)
+        assert len(results) == 2
+        assert [len(query_results) for query_results in results] == [2, 2]
+        assert results[0][0].document.id == "0"
+        assert results[1][0].document.id == "2"
+        for query, query_results in zip(queries, results, strict=True):
+            single = vector_store.similarity_search_by_vector(query, k=2)
+            assert _result_ids([query_results]) == _result_ids([single])
+
+        results = vector_store.similarity_search_by_vectors(
+            queries, k=2, include_ids=["1"]
+        )
+        assert _result_ids(results) == [["1"], ["1"]]
+
+        text_results = vector_store.similarity_search_by_texts(
+            ["first", "", "third"],
+            lambda texts: [
+                {"first": [1.0, 0.0, 0.0], "third": [0.0, 0.0, 1.0]}.get(text, [])
+                for text in texts
+            ],
+            k=1,
+        )
+        assert _result_ids(text_results) == [["0"], [], ["2"]]
     finally:
         shutil.rmtree(temp_dir)
+
+
+def _result_ids(results):
+    return [
+        [result.document.id for result in query_results] for query_results in results
+    ]
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 import graphrag.config.defaults as defs
 from graphrag.config.models.basic_search_config import BasicSearchConfig
 from graphrag.config.models.cache_config import CacheConfig
+from graphrag.config.models.checkpoints_config import CheckpointsConfig
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
 from graphrag.config.models.community_reports_config import CommunityReportsConfig
@@ -121,6 +122,10 @@ def assert_vector_store_configs(
         assert store_a.audience == store_e.audience
         assert store_a.container_name == store_e.container_name
         assert store_a.overwrite == store_e.overwrite
+        assert store_a.index_type == store_e.index_type
+        assert store_a.index_params == store_e.index_params
+        assert store_a.index_min_rows == store_e.index_min_rows
+        assert store_a.quantization == store_e.quantization
         assert store_a.database_name == store_e.database_name
 
 
@@ -192,6 +197,9 @@ def assert_embed_graph_configs(
     assert actual.iterations == expected.iterations
     assert actual.random_seed == expected.random_seed
     assert actual.use_lcc == expected.use_lcc
+    assert actual.backend == expected.backend
+    assert actual.workers == expected.workers
+    assert actual.node_sample_rate == expected.node_sample_rate
 
 
 def assert_text_embedding_configs(
@@ -220,6 +228,7 @@ def assert_snapshots_configs(
 ) -> None:
     assert actual.embeddings == expected.embeddings
     assert actual.graphml == expected.graphml
+    assert actual.graph_arrow == expected.graph_arrow
 
 
 def assert_extract_graph_configs(
@@ -228,6 +237,9 @@ def assert_extract_graph_configs(
     assert actual.prompt == expected.prompt
     assert actual.entity_types == expected.entity_types
     assert actual.max_gleanings == expected.max_gleanings
+    assert actual.adaptive_gleaning == expected.adaptive_gleaning
+    assert actual.min_gleaning_yield == expected.min_gleaning_yield
+    assert actual.gleaning_min_density == expected.gleaning_min_density
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
 
@@ -253,6 +265,8 @@ def assert_extract_graph_nlp_configs(
     assert actual.normalize_edge_weights == expected.normalize_edge_weights
     assert_text_analyzer_configs(actual.text_analyzer, expected.text_analyzer)
     assert actual.concurrent_requests == expected.concurrent_requests
+    assert actual.batch_size == expected.batch_size
+    assert actual.num_processes == expected.num_processes
 
 
 def assert_prune_graph_configs(
@@ -274,6 +288,8 @@ def assert_summarize_descriptions_configs(
     assert actual.max_length == expected.max_length
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
+    assert actual.batch_max_input_tokens == expected.batch_max_input_tokens
+    assert actual.batch_max_item_tokens == expected.batch_max_item_tokens
 
 
 def assert_community_reports_configs(
@@ -285,6 +301,7 @@ def assert_community_reports_configs(
     assert actual.max_input_length == expected.max_input_length
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
+    assert actual.reuse_unchanged_reports == expected.reuse_unchanged_reports
 
 
 def assert_extract_claims_configs(
@@ -296,6 +313,8 @@ def assert_extract_claims_configs(
     assert actual.max_gleanings == expected.max_gleanings
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
+    assert actual.joint_extraction == expected.joint_extraction
+    assert actual.joint_prompt == expected.joint_prompt
 
 
 def assert_cluster_graph_configs(
@@ -304,10 +323,23 @@ def assert_cluster_graph_configs(
     assert actual.max_cluster_size == expected.max_cluster_size
     assert actual.use_lcc == expected.use_lcc
     assert actual.seed == expected.seed
+    assert actual.backend == expected.backend
+    assert actual.incremental_update == expected.incremental_update
+
+
+def assert_checkpoints_configs(
+    actual: CheckpointsConfig, expected: CheckpointsConfig
+) -> None:
+    assert actual.enabled == expected.enabled
+    assert actual.flush_rows == expected.flush_rows
+    assert actual.flush_interval == expected.flush_interval
 
 
 def assert_umap_configs(actual: UmapConfig, expected: UmapConfig) -> None:
     assert actual.enabled == expected.enabled
+    assert actual.sample_size == expected.sample_size
+    assert actual.out_of_core == expected.out_of_core
+    assert actual.incremental_update == expected.incremental_update
 
 
 def assert_local_search_configs(
@@ -413,6 +445,7 @@ def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) ->
     assert_text_embedding_configs(actual.embed_text, expected.embed_text)
     assert_chunking_configs(actual.chunks, expected.chunks)
     assert_snapshots_configs(actual.snapshots, expected.snapshots)
+    assert_checkpoints_configs(actual.checkpoints, expected.checkpoints)
     assert_extract_graph_configs(actual.extract_graph, expected.extract_graph)
     assert_extract_graph_nlp_configs(
         actual.extract_graph_nlp, expected.extract_graph_nlp
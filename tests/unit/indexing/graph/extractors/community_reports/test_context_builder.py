@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+import graphrag.data_model.schemas as schemas
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.summarize_communities.explode_communities import (
+    explode_communities,
+)
+from graphrag.index.operations.summarize_communities.graph_context.context_builder import (
+    build_local_context,
+)
+from graphrag.index.workflows.create_community_reports import (
+    _prep_edges,
+    _prep_nodes,
+)
+
+DATA = "tests/verbs/data"
+
+
+def test_build_local_context_materializes_records_per_community():
+    communities = pd.read_parquet(f"{DATA}/communities.parquet")
+    entities = pd.read_parquet(f"{DATA}/entities.parquet")
+    nodes = _prep_nodes(explode_communities(communities, entities))
+    edges = _prep_edges(pd.read_parquet(f"{DATA}/relationships.parquet"))
+
+    local_contexts = build_local_context(
+        nodes, edges, None, NoopWorkflowCallbacks(), max_context_tokens=600
+    )
+
+    assert sorted(local_contexts[schemas.COMMUNITY_ID].tolist()) == sorted(
+        communities[schemas.COMMUNITY_ID].tolist()
+    )
+    levels = local_contexts[schemas.COMMUNITY_LEVEL].tolist()
+    assert levels == sorted(levels, reverse=True)
+
+    titles = dict(zip(entities["id"], entities[schemas.TITLE], strict=True))
+    for _, row in communities.iterrows():
+        context = local_contexts.loc[
+            local_contexts[schemas.COMMUNITY_ID] == row[schemas.COMMUNITY_ID]
+        ].iloc[0]
+        records = list(context[schemas.ALL_CONTEXT])
+        # records are built again on every iteration
+        assert records == list(context[schemas.ALL_CONTEXT])
+        assert sorted(record[schemas.TITLE] for record in records) == sorted(
+            titles[entity_id] for entity_id in row["entity_ids"]
+        )
+        assert all(len(record[schemas.EDGE_DETAILS]) <= 1 for record in records)
+        assert context[schemas.CONTEXT_EXCEED_FLAG] == (
+            context[schemas.CONTEXT_SIZE] > 600
+        )
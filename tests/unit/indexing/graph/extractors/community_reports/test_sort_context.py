@@ -217,3 +217,22 @@ def test_sort_context_max_tokens():
     assert ctx is not None, "Context is none"
     num = num_tokens(ctx)
     assert num <= 800, f"num_tokens is not less than or equal to 800: {num}"
+
+
+def test_sort_context_keeps_full_context_within_budget():
+    full = sort_context(context)
+    assert sort_context(context, max_context_tokens=num_tokens(full)) == full
+
+
+def test_sort_context_stops_before_first_edge_over_budget():
+    full = sort_context(context)
+    previous = None
+    for max_context_tokens in range(100, num_tokens(full), 50):
+        ctx = sort_context(context, max_context_tokens=max_context_tokens)
+        assert num_tokens(ctx) <= max_context_tokens
+        # the kept relationships are a prefix of the full, sorted relationships
+        relationships = ctx.split("-----Relationships-----\n")[1]
+        assert full.split("-----Relationships-----\n")[1].startswith(relationships)
+        if previous is not None:
+            assert len(ctx) >= len(previous)
+        previous = ctx
@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import logging
+
+import pandas as pd
+import pytest
+
+import graphrag.index.operations.summarize_communities.summarize_communities as summarize_module
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.workflows.create_community_reports import (
+    create_community_reports,
+)
+from graphrag.index.workflows.create_community_reports_text import (
+    create_community_reports_text,
+)
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+DATA = "tests/verbs/data"
+
+
+class RecordingStrategy:
+    def __init__(self, slow_community: int):
+        self.slow_community = slow_community
+        self.contexts: dict[int, str] = {}
+        self.finished: list[int] = []
+
+    async def __call__(self, community, context, level, callbacks, cache, strategy):
+        self.contexts[int(community)] = context
+        if community == self.slow_community:
+            await asyncio.sleep(0.2)
+        self.finished.append(int(community))
+        return {
+            "community": community,
+            "level": level,
+            "title": f"Community {community}",
+            "summary": "",
+            "full_content": f"REPORT OF COMMUNITY {community}",
+            "full_content_json": "{}",
+            "rank": 1.0,
+            "rating_explanation": "",
+            "findings": [],
+        }
+
+
+@pytest.mark.parametrize("text_units", [False, True])
+async def test_summarize_communities_schedules_by_dependency(monkeypatch, text_units):
+    # community 23 is a leaf at the deepest level, under 21, 19 and 10
+    strategy = RecordingStrategy(slow_community=23)
+    monkeypatch.setattr(summarize_module, "load_strategy", lambda _: strategy)
+    communities = pd.read_parquet(f"{DATA}/communities.parquet")
+    entities = pd.read_parquet(f"{DATA}/entities.parquet")
+    summarization_strategy = {
+        "type": "graph_intelligence",
+        "graph_prompt": "",
+        "text_prompt": "",
+        "max_input_length": 600,
+    }
+    if text_units:
+        reports = await create_community_reports_text(
+            entities,
+            communities,
+            pd.read_parquet(f"{DATA}/text_units.parquet"),
+            NoopWorkflowCallbacks(),
+            NoopPipelineCache(),
+            summarization_strategy,
+        )
+    else:
+        reports = await create_community_reports(
+            pd.read_parquet(f"{DATA}/relationships.parquet"),
+            entities,
+            communities,
+            None,
+            NoopWorkflowCallbacks(),
+            NoopPipelineCache(),
+            summarization_strategy,
+        )
+
+    assert sorted(reports["community"].tolist()) == sorted(strategy.finished)
+    # communities that don't wait on the slow leaf finish before it
+    assert strategy.finished.index(23) > max(
+        strategy.finished.index(1), strategy.finished.index(2)
+    )
+    # ancestors of the slow leaf wait for it, and summarize their sub-communities' reports
+    for community in [21, 19, 10]:
+        assert strategy.finished.index(community) > strategy.finished.index(23)
+    assert "REPORT OF COMMUNITY" in strategy.contexts[21]
+
+
+async def test_summarize_communities_reuses_unchanged_reports(
+    monkeypatch, tmp_path, caplog
+):
+    strategy = RecordingStrategy(slow_community=-1)
+    monkeypatch.setattr(summarize_module, "load_strategy", lambda _: strategy)
+    cache = JsonPipelineCache(FilePipelineStorage(base_dir=str(tmp_path)))
+    communities = pd.read_parquet(f"{DATA}/communities.parquet")
+    entities = pd.read_parquet(f"{DATA}/entities.parquet")
+    relationships = pd.read_parquet(f"{DATA}/relationships.parquet")
+
+    stats: dict[str, float] = {}
+
+    async def run(entities: pd.DataFrame) -> pd.DataFrame:
+        strategy.finished.clear()
+        return await create_community_reports(
+            relationships.copy(),
+            entities,
+            communities,
+            None,
+            NoopWorkflowCallbacks(),
+            cache,
+            {"type": "graph_intelligence", "graph_prompt": "", "max_input_length": 600},
+            reuse_unchanged_reports=True,
+            stats=stats,
+        )
+
+    first = await run(entities)
+    assert len(strategy.finished) == len(communities)
+
+    caplog.set_level(logging.INFO)
+    second = await run(entities)
+    assert strategy.finished == []
+    assert "25 reused from unchanged communities, 0 regenerated" in caplog.text
+    assert stats == {"reused_reports": 25, "regenerated_reports": 0}
+    columns = ["community", "level", "title", "full_content"]
+    assert second[columns].equals(first[columns])
+
+    # only the communities holding the changed entity, and their ancestors, are regenerated
+    changed = entities.copy()
+    title = communities.loc[communities["community"] == 23, "entity_ids"].iloc[0][0]
+    changed.loc[changed["id"] == title, "description"] = "A new description"
+    await run(changed)
+    assert sorted(strategy.finished) == [0, 10, 19, 21, 23]
+    assert stats == {"reused_reports": 20, "regenerated_reports": 5}
@@ -0,0 +1,44 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.utils.compact_graph import CompactGraph
+
+EDGES = pd.DataFrame({
+    "source": ["A", "B", "C", "B", "D", "E", "F"],
+    "target": ["B", "C", "C", "A", "E", "F", "D"],
+    "weight": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+})
+
+
+def test_matches_networkx_node_and_edge_order():
+    expected = nx.from_pandas_edgelist(EDGES, edge_attr=["weight"])
+    actual = CompactGraph.from_dataframe(EDGES).to_networkx()
+
+    assert list(actual.nodes) == list(expected.nodes)
+    assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+
+
+def test_degree_counts_self_loops_twice():
+    graph = CompactGraph.from_dataframe(EDGES)
+    expected = nx.from_pandas_edgelist(EDGES)
+
+    assert graph.degree().tolist() == [degree for _, degree in expected.degree]
+    assert graph.edge_combined_degree().tolist() == [
+        expected.degree[source] + expected.degree[target]
+        for source, target in expected.edges
+    ]
+
+
+def test_largest_connected_component_prefers_first_component_on_ties():
+    graph = CompactGraph.from_dataframe(EDGES.iloc[[0, 1, 4, 5]], nodes=["G"])
+
+    lcc = graph.largest_connected_component()
+
+    assert lcc.nodes.tolist() == ["A", "B", "C"]
+    assert lcc.to_dataframe().to_dict("list") == {
+        "source": ["A", "B"],
+        "target": ["B", "C"],
+        "weight": [1.0, 2.0],
+    }
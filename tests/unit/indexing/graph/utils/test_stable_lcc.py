@@ -4,7 +4,10 @@ import unittest
 
 import networkx as nx
 
-from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.index.utils.stable_lcc import (
+    _stable_largest_connected_component_networkx,
+    stable_largest_connected_component,
+)
 
 
 class TestStableLCC(unittest.TestCase):
@@ -46,6 +49,22 @@ class TestStableLCC(unittest.TestCase):
             nx.generate_graphml(graph_out_2)
         )
 
+    def test_matches_networkx_implementation(self):
+        for digraph in [False, True]:
+            graph = nx.DiGraph() if digraph else nx.Graph()
+            names = ["ab", " AB (co)", "a&amp;b", "A B", "AB\tC", "Z", "a"]
+            for i, name in enumerate(names):
+                graph.add_node(name, node_name=i)
+            for i, source in enumerate(names):
+                graph.add_edge(source, names[(i * 3 + 1) % len(names)], degree=i)
+            graph.add_edge("X", "Y", degree=-1)
+
+            expected = _stable_largest_connected_component_networkx(graph.copy())
+            actual = stable_largest_connected_component(graph.copy())
+
+            assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+            assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+
     def _create_strongly_connected_graph(self, digraph=False):
         graph = nx.Graph() if not digraph else nx.DiGraph()
         graph.add_node("1", node_name=1)
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+import pytest
+
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.enums import ModelType
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    BatchSummaryResponse,
+    DescriptionSummaryModel,
+)
+from graphrag.index.operations.summarize_descriptions.summarize_descriptions import (
+    summarize_descriptions,
+)
+from graphrag.language_model.manager import ModelManager
+from tests.unit.indexing.verbs.helpers.mock_llm import create_mock_llm
+from tests.verbs.util import DEFAULT_CHAT_MODEL_CONFIG
+
+STRATEGY = {
+    "type": "graph_intelligence",
+    "llm": {**DEFAULT_CHAT_MODEL_CONFIG, "type": ModelType.MockChat},
+    "max_input_tokens": 1000,
+    "max_summary_length": 100,
+}
+
+ENTITIES = pd.DataFrame({
+    "title": ["A", "B", "C"],
+    "description": [["A is a company"], ["B is a person", "B is a CEO"], ["C", "C"]],
+})
+
+RELATIONSHIPS = pd.DataFrame({
+    "source": ["A"],
+    "target": ["B"],
+    "description": [["B runs A", "B founded A"]],
+})
+
+
+@pytest.fixture(autouse=True)
+def reset_model():
+    # the strategy looks its model up by name, so each test registers its own mock
+    ModelManager().remove_chat("summarize_descriptions")
+    yield
+    ModelManager().remove_chat("summarize_descriptions")
+
+
+async def test_summarize_descriptions_skips_single_descriptions():
+    llm = create_mock_llm(["summary"], "summarize_descriptions")
+
+    entities, relationships = await summarize_descriptions(
+        ENTITIES,
+        RELATIONSHIPS,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        STRATEGY,  # type: ignore
+    )
+
+    # only B and A -> B have more than one unique description
+    assert llm.response_index == 2  # type: ignore
+    assert entities["description"].tolist() == ["A is a company", "summary", "C"]
+    assert relationships["description"].tolist() == ["summary"]
+
+
+async def test_summarize_descriptions_batches_small_items():
+    llm = create_mock_llm(
+        [
+            BatchSummaryResponse(
+                summaries=[
+                    DescriptionSummaryModel(id=0, description="B summary"),
+                    DescriptionSummaryModel(id=1, description="A -> B summary"),
+                ]
+            )
+        ],
+        "summarize_descriptions",
+    )
+
+    entities, relationships = await summarize_descriptions(
+        ENTITIES,
+        RELATIONSHIPS,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        {**STRATEGY, "batch_max_input_tokens": 1000},
+    )
+
+    assert llm.response_index == 1  # type: ignore
+    assert entities["description"].tolist() == ["A is a company", "B summary", "C"]
+    assert relationships["description"].tolist() == ["A -> B summary"]
+
+
+async def test_summarize_descriptions_batch_falls_back_for_missing_items():
+    llm = create_mock_llm(
+        [
+            BatchSummaryResponse(
+                summaries=[DescriptionSummaryModel(id=0, description="B summary")]
+            ),
+            "A -> B summary",
+        ],
+        "summarize_descriptions",
+    )
+
+    _, relationships = await summarize_descriptions(
+        ENTITIES,
+        RELATIONSHIPS,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        {**STRATEGY, "batch_max_input_tokens": 1000},
+    )
+
+    assert llm.response_index == 2  # type: ignore
+    assert relationships["description"].tolist() == ["A -> B summary"]
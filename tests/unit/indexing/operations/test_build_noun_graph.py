@@ -0,0 +1,84 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+from collections.abc import Iterable, Iterator
+
+import pandas as pd
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.index.operations.build_noun_graph.build_noun_graph import (
+    _extract_edges,
+    _extract_nodes,
+)
+from graphrag.index.operations.build_noun_graph.np_extractors.base import (
+    BaseNounPhraseExtractor,
+)
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+NODES = pd.DataFrame({
+    "title": ["APPLE", "BANANA", "CHERRY", "DATE"],
+    "frequency": [3, 2, 2, 1],
+    "text_unit_ids": [["t2", "t1", "t3"], ["t1", "t2"], ["t3", "t1"], ["t4"]],
+})
+
+
+def test_extract_edges_counts_co_occurrences():
+    edges = _extract_edges(NODES, normalize_edge_weights=False)
+
+    assert edges.to_dict("list") == {
+        "source": ["APPLE", "APPLE", "BANANA"],
+        "target": ["BANANA", "CHERRY", "CHERRY"],
+        "weight": [2, 2, 1],
+        "text_unit_ids": [["t1", "t2"], ["t1", "t3"], ["t1"]],
+    }
+
+
+def test_extract_edges_without_co_occurrences():
+    edges = _extract_edges(NODES.iloc[[0, 3]], normalize_edge_weights=True)
+
+    assert edges.empty
+    assert edges.columns.tolist() == ["source", "target", "weight", "text_unit_ids"]
+
+
+class UpperCaseWordExtractor(BaseNounPhraseExtractor):
+    def __init__(self):
+        super().__init__(model_name=None)
+        self.batches: list[list[str]] = []
+
+    def extract(self, text: str) -> list[str]:
+        return sorted({word.upper() for word in text.split()})
+
+    def extract_batch(
+        self, texts: Iterable[str], batch_size: int = 100, n_process: int = 1
+    ) -> Iterator[list[str]]:
+        texts = list(texts)
+        self.batches.append(texts)
+        return super().extract_batch(texts, batch_size, n_process)
+
+    def __str__(self) -> str:
+        return "upper_case_words"
+
+
+async def test_extract_nodes_batches_uncached_texts(tmp_path):
+    extractor = UpperCaseWordExtractor()
+    cache = JsonPipelineCache(FilePipelineStorage(base_dir=str(tmp_path)))
+    text_units = pd.DataFrame({
+        "id": ["t1", "t2", "t3"],
+        "text": ["apple banana", "banana cherry", "apple banana"],
+    })
+
+    nodes = await _extract_nodes(text_units.copy(), extractor, cache=cache)
+    # repeated texts are extracted once, and all texts go through a single batch
+    assert extractor.batches == [["apple banana", "banana cherry"]]
+    assert nodes.to_dict("list") == {
+        "title": ["APPLE", "BANANA", "CHERRY"],
+        "frequency": [2, 3, 1],
+        "text_unit_ids": [["t1", "t3"], ["t1", "t2", "t3"], ["t2"]],
+    }
+
+    more_text_units = pd.DataFrame({
+        "id": ["t1", "t4"],
+        "text": ["apple banana", "date"],
+    })
+    nodes = await _extract_nodes(more_text_units, extractor, cache=cache)
+    assert extractor.batches[1:] == [["date"]]
+    assert nodes["title"].tolist() == ["APPLE", "BANANA", "DATE"]
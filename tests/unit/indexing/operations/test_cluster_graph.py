@@ -0,0 +1,67 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+import pandas as pd
+import pytest
+
+from graphrag.config.enums import ClusterGraphBackendType
+from graphrag.index.operations.cluster_graph import cluster_graph
+from graphrag.index.utils.compact_graph import CompactGraph
+
+
+def _edges() -> pd.DataFrame:
+    graph = nx.connected_caveman_graph(6, 5)
+    names = {node: f"Entity &amp; {node}" for node in graph.nodes}
+    names[0] = "ab (co)"
+    names[1] = "AB"
+    return pd.DataFrame(
+        [
+            (names[source], names[target], float((source * target) % 4 + 1))
+            for source, target in graph.edges
+        ],
+        columns=pd.Index(["source", "target", "weight"]),
+    )
+
+
+@pytest.mark.parametrize("use_lcc", [True, False])
+def test_edge_list_backend_matches_graspologic(use_lcc: bool):
+    edges = _edges()
+
+    expected = cluster_graph(
+        nx.from_pandas_edgelist(edges, edge_attr=["weight"]),
+        max_cluster_size=4,
+        use_lcc=use_lcc,
+        seed=0xDEADBEEF,
+    )
+    actual = cluster_graph(
+        CompactGraph.from_dataframe(edges),
+        max_cluster_size=4,
+        use_lcc=use_lcc,
+        seed=0xDEADBEEF,
+        backend=ClusterGraphBackendType.EdgeList,
+    )
+
+    assert actual == expected
+
+
+def test_edge_list_backend_refines_large_clusters():
+    communities = cluster_graph(
+        CompactGraph.from_dataframe(_edges()),
+        max_cluster_size=3,
+        use_lcc=True,
+        seed=0xDEADBEEF,
+        backend=ClusterGraphBackendType.EdgeList,
+    )
+
+    roots = {
+        community: nodes
+        for level, community, parent, nodes in communities
+        if level == 0 and parent == -1
+    }
+    children = [
+        (parent, nodes) for level, _, parent, nodes in communities if level == 1
+    ]
+    assert children
+    for parent, nodes in children:
+        assert len(roots[parent]) > 3
+        assert set(nodes) <= set(roots[parent])
@@ -0,0 +1,86 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+from itertools import pairwise
+
+import networkx as nx
+import numpy as np
+from graspologic.embed.n2v import _Node2VecGraph
+
+from graphrag.config.enums import EmbedGraphBackendType
+from graphrag.config.models.embed_graph_config import EmbedGraphConfig
+from graphrag.index.operations.embed_graph.embed_graph import embed_graph
+from graphrag.index.operations.embed_graph.embed_node2vec import (
+    _simulate_walks,
+    _walk_batch,
+    _walk_lengths,
+    _WalkGraph,
+)
+from graphrag.index.utils.compact_graph import CompactGraph
+
+
+def _graph() -> nx.Graph:
+    graph = nx.barabasi_albert_graph(200, 2, seed=7)
+    graph = nx.relabel_nodes(graph, {node: f"node {node}" for node in graph})
+    graph.add_edge("isolated a", "isolated b")
+    return graph
+
+
+def _walk_graph(graph: CompactGraph, walk_length: int = 10) -> _WalkGraph:
+    csr = graph.to_csr()
+    return _WalkGraph(
+        indptr=np.asarray(csr.indptr, dtype=np.int64),
+        indices=np.asarray(csr.indices, dtype=np.int64),
+        cumulative_weights=np.concatenate([[0.0], np.cumsum(csr.data)]),
+        walk_lengths=_walk_lengths(graph.degree(), walk_length),
+    )
+
+
+def test_walk_lengths_match_graspologic():
+    degrees = CompactGraph.from_networkx(_graph()).degree()
+    percentiles = np.percentile(degrees, list(range(20, 90, 10)))
+    expected = [
+        _Node2VecGraph._get_walk_length_interpolated(degree, percentiles, 40)  # noqa: SLF001
+        for degree in degrees
+    ]
+
+    assert _walk_lengths(degrees, 40).tolist() == expected
+
+
+def test_walks_follow_edges():
+    graph = CompactGraph.from_networkx(_graph())
+    walk_graph = _walk_graph(graph)
+    edges = {frozenset(edge) for edge in zip(graph.sources, graph.targets, strict=True)}
+
+    walks = _walk_batch(walk_graph, np.arange(graph.num_nodes), seed=1).splitlines()
+
+    assert len(walks) == graph.num_nodes
+    for start, walk in enumerate(walks):
+        nodes = [int(node) for node in walk.split(" ")]
+        assert nodes[0] == start
+        assert len(nodes) == walk_graph.walk_lengths[start]
+        assert all(frozenset(step) in edges for step in pairwise(nodes))
+
+
+def test_walks_do_not_depend_on_workers():
+    graph = CompactGraph.from_networkx(_graph())
+    walk_graph = _walk_graph(graph)
+    batches = [(np.arange(start, start + 50), start) for start in range(0, 200, 50)]
+
+    assert list(_simulate_walks(walk_graph, batches, workers=1)) == list(
+        _simulate_walks(walk_graph, batches, workers=2)
+    )
+
+
+def test_parallel_backend_embeds_largest_connected_component():
+    config = EmbedGraphConfig(
+        enabled=True,
+        dimensions=16,
+        num_walks=2,
+        backend=EmbedGraphBackendType.Parallel,
+        workers=1,
+    )
+
+    embeddings = embed_graph(_graph(), config)
+
+    assert list(embeddings) == sorted(f"NODE {node}" for node in range(200))
+    assert all(len(vector) == 16 for vector in embeddings.values())
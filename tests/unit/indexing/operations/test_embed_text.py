@@ -0,0 +1,165 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import threading
+
+import lancedb
+import pandas as pd
+import pytest
+
+import graphrag.index.operations.embed_text.embed_text as embed_module
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.embed_text.batcher import EmbeddingBatcher
+from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
+
+
+class RecordingVectorStore:
+    def __init__(self):
+        self.second_batch_embedding = threading.Event()
+        self.loads: list[tuple[list[str], bool, bool]] = []
+
+    def load_documents(self, documents, overwrite=True):
+        # the first upload blocks until the next batch is being embedded
+        overlapped = (
+            self.second_batch_embedding.wait(timeout=5) if not self.loads else True
+        )
+        ids = [document.id for document in documents]
+        self.loads.append((ids, overwrite, overlapped))
+
+    def create_index(self):
+        pass
+
+
+async def test_text_embed_with_vector_store_overlaps_embedding_and_upload(
+    monkeypatch,
+):
+    vector_store = RecordingVectorStore()
+
+    async def strategy(texts, callbacks, cache, args):
+        await asyncio.sleep(0)
+        if texts[0] == "text 2":
+            vector_store.second_batch_embedding.set()
+        return TextEmbeddingResult(embeddings=[[1.0, 0.0] for _ in texts])
+
+    monkeypatch.setattr(embed_module, "load_strategy", lambda _: strategy)
+    monkeypatch.setattr(
+        embed_module, "_create_vector_store", lambda config, name: vector_store
+    )
+    input = pd.DataFrame({
+        "id": [str(i) for i in range(5)],
+        "text": [f"text {i}" for i in range(5)],
+    })
+
+    embeddings = await embed_module.embed_text(
+        input=input,
+        callbacks=NoopWorkflowCallbacks(),
+        cache=NoopPipelineCache(),
+        embed_column="text",
+        strategy={"type": "mock", "vector_store": {"batch_size": 2}},
+        embedding_name="entity.description",
+    )
+
+    assert embeddings is not None
+    assert len(embeddings) == 5
+    assert vector_store.loads == [
+        (["0", "1"], True, True),
+        (["2", "3"], False, True),
+        (["4"], False, True),
+    ]
+
+
+async def test_text_embed_with_vector_store_empty_input(monkeypatch, tmp_path):
+    async def strategy(texts, callbacks, cache, args):
+        await asyncio.sleep(0)
+        return TextEmbeddingResult(embeddings=[[1.0, 0.0] for _ in texts])
+
+    monkeypatch.setattr(embed_module, "load_strategy", lambda _: strategy)
+
+    embeddings = await embed_module.embed_text(
+        input=pd.DataFrame({"id": [], "text": []}),
+        callbacks=NoopWorkflowCallbacks(),
+        cache=NoopPipelineCache(),
+        embed_column="text",
+        strategy={
+            "type": "mock",
+            "vector_store": {
+                "type": "lancedb",
+                "db_uri": str(tmp_path),
+                "batch_size": 2,
+            },
+        },
+        embedding_name="entity.description",
+    )
+
+    # nothing is loaded, so no table exists to index
+    assert embeddings == []
+    assert lancedb.connect(str(tmp_path)).table_names() == []
+
+
+class FailingVectorStore:
+    def load_documents(self, documents, overwrite=True):
+        msg = "upload failed"
+        raise RuntimeError(msg)
+
+
+async def test_text_embed_with_vector_store_stops_embedding_on_upload_error(
+    monkeypatch,
+):
+    embedded: list[str] = []
+
+    async def strategy(texts, callbacks, cache, args):
+        await asyncio.sleep(0)
+        embedded.extend(texts)
+        return TextEmbeddingResult(embeddings=[[1.0, 0.0] for _ in texts])
+
+    monkeypatch.setattr(embed_module, "load_strategy", lambda _: strategy)
+    monkeypatch.setattr(
+        embed_module, "_create_vector_store", lambda config, name: FailingVectorStore()
+    )
+    input = pd.DataFrame({
+        "id": [str(i) for i in range(10)],
+        "text": [f"text {i}" for i in range(10)],
+    })
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await embed_module.embed_text(
+            input=input,
+            callbacks=NoopWorkflowCallbacks(),
+            cache=NoopPipelineCache(),
+            embed_column="text",
+            strategy={"type": "mock", "vector_store": {"batch_size": 2}},
+            embedding_name="entity.description",
+        )
+
+    # the producer is cancelled and awaited, so no task is left embedding the remaining batches
+    assert len(embedded) < 10
+    assert [
+        task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+    ] == []
+
+
+class RecordingEmbeddingModel:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def aembed_batch(self, text_list, **kwargs):
+        self.batches.append(text_list)
+        return [[float(len(text)), 1.0] for text in text_list]
+
+
+async def test_embedding_batcher_packs_concurrent_calls():
+    model = RecordingEmbeddingModel()
+    batcher = EmbeddingBatcher(batch_size=4, batch_max_tokens=100, num_threads=2)
+    first = ["a", "bb", "ccc"]
+    second = ["dddd", "eeeee"]
+
+    results = await asyncio.gather(
+        batcher.embed(model, first, [1] * len(first), lambda _: None),  # type: ignore
+        batcher.embed(model, second, [1] * len(second), lambda _: None),  # type: ignore
+    )
+
+    # the partial batches of both calls are sent together, and results are routed back
+    assert model.batches == [["a", "bb", "ccc", "dddd"], ["eeeee"]]
+    assert [embedding[0] for embedding in results[0]] == [1.0, 2.0, 3.0]
+    assert [embedding[0] for embedding in results[1]] == [4.0, 5.0]
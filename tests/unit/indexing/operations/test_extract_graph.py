@@ -0,0 +1,106 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+import pandas as pd
+
+import graphrag.index.operations.extract_graph.extract_graph as extract_module
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.extract_graph.typing import EntityExtractionResult
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+
+async def test_extract_graph_accepts_frames_from_custom_strategies(monkeypatch):
+    async def strategy(docs, entity_types, cache, args):
+        await asyncio.sleep(0)
+        source_id = docs[0].id
+        return EntityExtractionResult(
+            entities=pd.DataFrame({
+                "title": ["A", "B"],
+                "type": ["person", "person"],
+                "description": ["A desc", "B desc"],
+                "source_id": [source_id, source_id],
+            }),  # type: ignore
+            relationships=pd.DataFrame({
+                "source": ["A"],
+                "target": ["B"],
+                "weight": [1.0],
+                "description": ["A knows B"],
+                "source_id": [source_id],
+            }),  # type: ignore
+        )
+
+    monkeypatch.setattr(extract_module, "_load_strategy", lambda _: strategy)
+    text_units = pd.DataFrame({"id": ["1", "2"], "text": ["text 1", "text 2"]})
+
+    entities, relationships = await extract_module.extract_graph(
+        text_units,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        text_column="text",
+        id_column="id",
+        strategy={"type": "custom"},
+    )
+
+    assert entities["title"].tolist() == ["A", "B"]
+    assert entities["frequency"].tolist() == [2, 2]
+    assert relationships[["source", "target"]].to_numpy().tolist() == [["A", "B"]]
+    assert relationships["weight"].tolist() == [2.0]
+    assert relationships["text_unit_ids"].tolist() == [["1", "2"]]
+
+
+async def test_extract_graph_does_not_checkpoint_failed_text_units(monkeypatch):
+    calls: list[str] = []
+    failing = {"2"}
+
+    async def strategy(docs, entity_types, cache, args):
+        await asyncio.sleep(0)
+        calls.append(docs[0].id)
+        if docs[0].id in failing:
+            return EntityExtractionResult([], [], failed_documents=[docs[0].id])
+        return EntityExtractionResult(
+            [
+                {
+                    "title": f"E{docs[0].id}",
+                    "type": "person",
+                    "description": "desc",
+                    "source_id": docs[0].id,
+                }
+            ],
+            [
+                {
+                    "source": f"E{docs[0].id}",
+                    "target": "X",
+                    "weight": 1.0,
+                    "description": "desc",
+                    "source_id": docs[0].id,
+                }
+            ],
+        )
+
+    monkeypatch.setattr(extract_module, "_load_strategy", lambda _: strategy)
+    text_units = pd.DataFrame({"id": ["1", "2"], "text": ["text 1", "text 2"]})
+    storage = MemoryPipelineStorage()
+
+    async def run():
+        return await extract_module.extract_graph(
+            text_units,
+            NoopWorkflowCallbacks(),
+            NoopPipelineCache(),
+            text_column="text",
+            id_column="id",
+            strategy={"type": "custom"},
+            checkpoint=RowCheckpoint(storage, "extract_graph"),
+        )
+
+    entities, _ = await run()
+    assert entities["title"].tolist() == ["E1"]
+
+    # on resume, only the text unit whose extraction failed is extracted again
+    calls.clear()
+    failing.clear()
+    entities, _ = await run()
+    assert calls == ["2"]
+    assert sorted(entities["title"].tolist()) == ["E1", "E2"]
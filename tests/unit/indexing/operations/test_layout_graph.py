@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import numpy as np
+
+from graphrag.index.operations.layout_graph.umap import (
+    _align_to_previous_positions,
+    _embedding_matrix,
+    compute_umap_positions,
+)
+
+
+def test_align_to_previous_positions():
+    rng = np.random.default_rng(0)
+    positions = rng.random((8, 2))
+    labels = [f"node {i}" for i in range(8)]
+    # the previous layout is a rotated, scaled and shifted copy of the new one
+    transform = np.asarray([[0.0, -2.0], [2.0, 0.0]])
+    expected = positions @ transform + [5.0, -3.0]
+    previous = {labels[i]: (expected[i, 0], expected[i, 1]) for i in range(5)}
+
+    aligned = _align_to_previous_positions(positions, labels, previous)
+
+    assert aligned[:5].tolist() == expected[:5].tolist()
+    np.testing.assert_allclose(aligned[5:], expected[5:])
+
+
+def test_compute_umap_positions_on_sample(tmp_path):
+    rng = np.random.default_rng(0)
+    labels = [f"node {i}" for i in range(80)]
+    embeddings = {label: rng.random(8).tolist() for label in labels}
+    vectors = _embedding_matrix(embeddings, labels, tmp_path)
+
+    positions = compute_umap_positions(vectors, labels, sample_size=40)
+
+    assert isinstance(vectors, np.memmap)
+    assert vectors.dtype == np.float32
+    assert [position.label for position in positions] == labels
+    assert all(np.isfinite([p.x for p in positions] + [p.y for p in positions]))
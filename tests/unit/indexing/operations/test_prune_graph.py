@@ -0,0 +1,44 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.index.operations.prune_graph import prune_graph
+
+ENTITIES = pd.DataFrame({
+    "title": ["HUB", "A", "B", "C", "D", "E", "F"],
+    "frequency": [9, 3, 3, 3, 1, 3, 3],
+})
+RELATIONSHIPS = pd.DataFrame({
+    "source": ["HUB", "A", "HUB", "B", "HUB", "HUB", "E"],
+    "target": ["A", "B", "B", "C", "C", "D", "F"],
+    "weight": [1.0, 5.0, 1.0, 6.0, 1.0, 1.0, 7.0],
+})
+
+
+def test_prune_graph_keeps_networkx_order():
+    nodes, edges = prune_graph(
+        ENTITIES, RELATIONSHIPS, min_node_degree=0, min_edge_weight_pct=0
+    )
+
+    assert nodes["title"].tolist() == ["HUB", "A", "B", "C", "D", "E", "F"]
+    # networkx groups edges by their earlier node, and the edge frame sorts each pair
+    assert edges.to_dict("list") == {
+        "source": ["A", "B", "C", "D", "A", "B", "E"],
+        "target": ["HUB", "HUB", "HUB", "HUB", "B", "C", "F"],
+    }
+
+
+def test_prune_graph_removes_ego_low_frequency_and_light_edges():
+    nodes, edges = prune_graph(
+        ENTITIES,
+        RELATIONSHIPS,
+        min_node_freq=2,
+        min_node_degree=0,
+        min_edge_weight_pct=50,
+        remove_ego_nodes=True,
+        lcc_only=True,
+    )
+
+    # A -> B falls under the median weight, leaving B -> C as the first of the two largest components
+    assert nodes["title"].tolist() == ["B", "C"]
+    assert edges.to_dict("list") == {"source": ["B"], "target": ["C"]}
@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.index.operations.snapshot_graph_arrow import (
+    load_graph_snapshot,
+    load_graph_snapshot_from_bytes,
+    snapshot_graph_arrow,
+)
+from graphrag.index.utils.compact_graph import CompactGraph
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+
+async def test_snapshot_round_trip(tmp_path):
+    graph = CompactGraph.from_dataframe(
+        pd.DataFrame({
+            "source": ["A", "B", "C", "A"],
+            "target": ["B", "C", "A", "D"],
+            "weight": [1.0, 2.5, 3.0, 0.5],
+        })
+    )
+
+    await snapshot_graph_arrow(
+        graph, "graph", FilePipelineStorage(base_dir=str(tmp_path))
+    )
+    loaded = load_graph_snapshot(tmp_path)
+
+    assert loaded.nodes.tolist() == ["A", "B", "C", "D"]
+    assert loaded.sources.tolist() == graph.sources.tolist()
+    assert loaded.targets.tolist() == graph.targets.tolist()
+    assert loaded.weights.tolist() == graph.weights.tolist()
+    # the edge arrays are views of the mapped file
+    assert not loaded.sources.flags.writeable
+
+    from_bytes = load_graph_snapshot_from_bytes(
+        (tmp_path / "graph_nodes.arrow").read_bytes(),
+        (tmp_path / "graph_edges.arrow").read_bytes(),
+    )
+    assert from_bytes.nodes.tolist() == loaded.nodes.tolist()
+    assert from_bytes.sources.tolist() == loaded.sources.tolist()
+    assert from_bytes.weights.tolist() == loaded.weights.tolist()
+
+    # storages other than files receive the snapshot as bytes
+    storage = MemoryPipelineStorage()
+    await snapshot_graph_arrow(graph, "graph", storage)
+    from_memory = load_graph_snapshot_from_bytes(
+        await storage.get("graph_nodes.arrow"), await storage.get("graph_edges.arrow")
+    )
+    assert from_memory.nodes.tolist() == loaded.nodes.tolist()
+    assert from_memory.targets.tolist() == loaded.targets.tolist()
@@ -0,0 +1,37 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.enums import IndexingMethod
+from graphrag.index.workflows.factory import PipelineFactory
+from tests.verbs.util import DEFAULT_MODEL_CONFIG
+
+
+def test_incremental_update_pipelines_skip_delta_communities():
+    config = create_graphrag_config({
+        "models": DEFAULT_MODEL_CONFIG,
+        "cluster_graph": {"incremental_update": True},
+    })
+
+    for method in (IndexingMethod.StandardUpdate, IndexingMethod.FastUpdate):
+        names = PipelineFactory.create_pipeline(config, method).names()
+        assert "create_communities" not in names
+        assert "create_community_reports" not in names
+        assert "create_community_reports_text" not in names
+        assert "generate_text_embeddings" not in names
+        assert "update_communities" in names
+        assert "update_text_embeddings" in names
+
+    # full runs are unaffected
+    names = PipelineFactory.create_pipeline(config, IndexingMethod.Standard).names()
+    assert "create_communities" in names
+
+
+def test_update_pipelines_cluster_delta_without_incremental_update():
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+
+    names = PipelineFactory.create_pipeline(
+        config, IndexingMethod.StandardUpdate
+    ).names()
+    assert "create_communities" in names
+    assert "create_community_reports" in names
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.data_model.schemas import COMMUNITY_REPORTS_FINAL_COLUMNS
+from graphrag.index.update.communities import (
+    _merge_changed_community_reports,
+    _merge_reclustered_communities,
+    _select_communities_to_recluster,
+)
+from graphrag.index.workflows.create_communities import create_communities
+
+
+def _relationships(pairs: list[tuple[str, str]], offset: int = 0) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [f"r{offset + i}" for i in range(len(pairs))],
+        "source": [source for source, _ in pairs],
+        "target": [target for _, target in pairs],
+        "weight": 1.0,
+        "text_unit_ids": [[f"t{offset + i}"] for i in range(len(pairs))],
+    })
+
+
+def _clique(prefix: str, size: int) -> list[tuple[str, str]]:
+    return [
+        (f"{prefix}{i}", f"{prefix}{j}")
+        for i in range(size)
+        for j in range(i + 1, size)
+    ]
+
+
+OLD_RELATIONSHIPS = _relationships(_clique("A", 4) + _clique("B", 4))
+DELTA_RELATIONSHIPS = _relationships([("B0", "C0"), ("C0", "C1")], offset=100)
+MERGED_RELATIONSHIPS = pd.concat(
+    [OLD_RELATIONSHIPS, DELTA_RELATIONSHIPS], ignore_index=True
+)
+TITLES = pd.unique(MERGED_RELATIONSHIPS[["source", "target"]].to_numpy().ravel())
+MERGED_ENTITIES = pd.DataFrame({"id": [f"e-{t}" for t in TITLES], "title": TITLES})
+
+
+def _old_communities() -> pd.DataFrame:
+    return create_communities(
+        MERGED_ENTITIES, OLD_RELATIONSHIPS, max_cluster_size=10, use_lcc=False, seed=1
+    )
+
+
+def test_recluster_keeps_untouched_communities():
+    old_communities = _old_communities()
+    kept, relationships = _select_communities_to_recluster(
+        old_communities,
+        MERGED_ENTITIES,
+        MERGED_RELATIONSHIPS,
+        DELTA_RELATIONSHIPS,
+        pd.DataFrame({"title": ["C0", "C1"]}),
+        use_lcc=False,
+    )
+
+    a_community = old_communities.loc[
+        old_communities["entity_ids"].apply(lambda ids: "e-A0" in ids), "community"
+    ]
+    assert kept["community"].tolist() == a_community.tolist()
+    nodes = set(relationships["source"]) | set(relationships["target"])
+    assert nodes == {"B0", "B1", "B2", "B3", "C0", "C1"}
+
+    reclustered = create_communities(
+        MERGED_ENTITIES, relationships, max_cluster_size=10, use_lcc=False, seed=1
+    )
+    merged, changed = _merge_reclustered_communities(old_communities, kept, reclustered)
+
+    assert len(changed) == len(reclustered)
+    assert min(changed) > old_communities["community"].max()
+    assert set(merged["community"]) == set(kept["community"]) | set(changed)
+    assert (merged["title"] == "Community " + merged["community"].astype(str)).all()
+    covered = {entity for ids in merged["entity_ids"] for entity in ids}
+    assert covered == set(MERGED_ENTITIES["id"])
+
+
+def test_recluster_communities_touched_by_delta_entities():
+    old_communities = _old_communities()
+    # A0 is mentioned again by the delta without a new relationship, so its description may have changed
+    kept, relationships = _select_communities_to_recluster(
+        old_communities,
+        MERGED_ENTITIES,
+        OLD_RELATIONSHIPS,
+        DELTA_RELATIONSHIPS.iloc[:0],
+        pd.DataFrame({"title": ["A0"]}),
+        use_lcc=False,
+    )
+
+    b_community = old_communities.loc[
+        old_communities["entity_ids"].apply(lambda ids: "e-B0" in ids), "community"
+    ]
+    assert kept["community"].tolist() == b_community.tolist()
+    nodes = set(relationships["source"]) | set(relationships["target"])
+    assert nodes == {"A0", "A1", "A2", "A3"}
+
+
+def test_merge_changed_community_reports():
+    old_reports = pd.DataFrame({"community": [0, 1, 2], "summary": ["a", "b", "c"]})
+    changed_reports = pd.DataFrame({"community": [3], "summary": ["d"]})
+    merged_communities = pd.DataFrame({"community": [0, 3]})
+
+    merged = _merge_changed_community_reports(
+        old_reports.reindex(columns=COMMUNITY_REPORTS_FINAL_COLUMNS),
+        changed_reports.reindex(columns=COMMUNITY_REPORTS_FINAL_COLUMNS),
+        merged_communities,
+    )
+
+    assert merged["community"].tolist() == [0, 3]
+    assert merged["summary"].tolist() == ["a", "d"]
+    assert merged["human_readable_id"].tolist() == [0, 3]
@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.row_checkpoint import RowCheckpoint
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+
+async def test_derive_from_rows_resumes_from_checkpoint():
+    storage = MemoryPipelineStorage()
+    rows = pd.DataFrame({"id": ["a", "b", "c"], "value": [1, 2, 3]})
+    calls = []
+
+    async def transform(row):  # noqa: RUF029
+        calls.append(row["id"])
+        return {"doubled": row["value"] * 2}
+
+    checkpoint = RowCheckpoint(storage, "test", signature="v1", flush_rows=2)
+    first = await derive_from_rows(rows.iloc[:2], transform, checkpoint=checkpoint)
+    assert await storage.has("test.checkpoint.0.json")
+
+    calls.clear()
+    resumed = RowCheckpoint(storage, "test", signature="v1", flush_rows=2)
+    second = await derive_from_rows(rows, transform, checkpoint=resumed)
+
+    assert calls == ["c"]
+    assert second[:2] == first
+    assert second[2] == {"doubled": 6}
+
+
+async def test_checkpoint_with_different_signature_is_discarded():
+    storage = MemoryPipelineStorage()
+    checkpoint = RowCheckpoint(storage, "test", signature="v1")
+    await checkpoint.add("a", 1)
+    await checkpoint.flush()
+    assert await RowCheckpoint(storage, "test", signature="v1").load() == {"a": 1}
+
+    assert await RowCheckpoint(storage, "test", signature="v2").load() == {}
+    assert not await storage.has("test.checkpoint.0.json")
+
+
+async def test_clear_removes_all_shards():
+    storage = MemoryPipelineStorage()
+    checkpoint = RowCheckpoint(storage, "test", flush_rows=1)
+    await checkpoint.add("a", 1)
+    await checkpoint.add("b", 2)
+    assert await storage.has("test.checkpoint.1.json")
+
+    await checkpoint.clear()
+    assert await RowCheckpoint(storage, "test").load() == {}
@@ -114,11 +114,10 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
 
         # self.assertItemsEqual isn't available yet, or I am just silly
         # so we sort the lists and compare them
-        graph = results.graph
-        assert graph is not None, "No graph returned!"
-
         # convert to strings for more visual comparison
-        edges_str = sorted([f"{edge[0]} -> {edge[1]}" for edge in graph.edges])
+        edges_str = sorted([
+            f"{edge['source']} -> {edge['target']}" for edge in results.relationships
+        ])
         assert edges_str == sorted([
             "TEST_ENTITY_1 -> TEST_ENTITY_2",
             "TEST_ENTITY_1 -> TEST_ENTITY_3",
@@ -156,18 +155,17 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
             ),
         )
 
-        graph = results.graph
-        assert graph is not None, "No graph returned!"
+        nodes = {entity["title"]: entity for entity in results.entities}
 
         # TODO: The edges might come back in any order, but we're assuming they're coming
         # back in the order that we passed in the docs, that might not be true
         assert (
-            graph.nodes["TEST_ENTITY_3"].get("source_id") == "2"
+            nodes["TEST_ENTITY_3"].get("source_id") == "2"
         )  # TEST_ENTITY_3 should be in just 2
         assert (
-            graph.nodes["TEST_ENTITY_2"].get("source_id") == "1"
+            nodes["TEST_ENTITY_2"].get("source_id") == "1"
         )  # TEST_ENTITY_2 should be in just 1
-        ids_str = graph.nodes["TEST_ENTITY_1"].get("source_id") or ""
+        ids_str = nodes["TEST_ENTITY_1"].get("source_id") or ""
         assert sorted(ids_str.split(",")) == sorted([
             "1",
             "2",
@@ -205,14 +203,127 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
             ),
         )
 
-        graph = results.graph
-        assert graph is not None, "No graph returned!"
-        edges = list(graph.edges(data=True))
+        edges = results.relationships
 
         # should only have 2 edges
         assert len(edges) == 2
 
         # Sort by source_id for consistent ordering
-        edge_source_ids = sorted([edge[2].get("source_id", "") for edge in edges])
+        edge_source_ids = sorted([edge.get("source_id", "") for edge in edges])
         assert edge_source_ids[0].split(",") == ["1"]
         assert edge_source_ids[1].split(",") == ["2"]
+
+    async def test_run_extract_graph_adaptive_gleaning_stops_on_low_yield(self):
+        model = create_mock_llm(
+            responses=[
+                """
+                ("entity"<|>TEST_ENTITY_1<|>COMPANY<|>TEST_ENTITY_1 is a test company)
+                ##
+                ("entity"<|>TEST_ENTITY_2<|>COMPANY<|>TEST_ENTITY_2 owns TEST_ENTITY_1)
+                ##
+                """.strip(),
+                """
+                ("entity"<|>TEST_ENTITY_3<|>PERSON<|>TEST_ENTITY_3 is director of TEST_ENTITY_1)
+                ##
+                """.strip(),
+                """
+                ("entity"<|>TEST_ENTITY_3<|>PERSON<|>TEST_ENTITY_3 is director of TEST_ENTITY_1)
+                ##
+                """.strip(),
+                "N",
+            ],
+            name="test_run_extract_graph_adaptive_gleaning_stops_on_low_yield",
+        )
+        results = await run_extract_graph(
+            docs=[Document("text_1", "1")],
+            entity_types=["person"],
+            args={
+                "max_gleanings": 5,
+                "adaptive_gleaning": True,
+                "min_gleaning_yield": 1,
+            },
+            model=model,
+        )
+
+        # the second gleaning only repeats a known entity, so no further calls are made
+        # and the loop check response is never consumed
+        assert results.round_yields == {"1": [2, 1, 0]}
+        assert model.response_index == 3  # type: ignore
+        assert sorted(["TEST_ENTITY_1", "TEST_ENTITY_2", "TEST_ENTITY_3"]) == sorted([
+            entity["title"] for entity in results.entities
+        ])
+
+    async def test_run_extract_graph_adaptive_gleaning_skips_sparse_chunks(self):
+        model = create_mock_llm(
+            responses=[
+                """
+                ("entity"<|>TEST_ENTITY_1<|>COMPANY<|>TEST_ENTITY_1 is a test company)
+                """.strip(),
+                """
+                ("entity"<|>TEST_ENTITY_2<|>COMPANY<|>TEST_ENTITY_2 owns TEST_ENTITY_1)
+                """.strip(),
+            ],
+            name="test_run_extract_graph_adaptive_gleaning_skips_sparse_chunks",
+        )
+        results = await run_extract_graph(
+            docs=[Document("a" * 2000, "1")],
+            entity_types=["person"],
+            args={
+                "max_gleanings": 1,
+                "adaptive_gleaning": True,
+                "gleaning_min_density": 1.0,
+            },
+            model=model,
+        )
+
+        # one entity in 2,000 characters is below the density threshold, so no gleaning happens
+        assert results.round_yields == {"1": [1]}
+        assert model.response_index == 1  # type: ignore
+        assert [entity["title"] for entity in results.entities] == ["TEST_ENTITY_1"]
+
+    async def test_run_extract_graph_merges_duplicate_records(self):
+        results = await run_extract_graph(
+            docs=[Document("text_1", "1")],
+            entity_types=["person"],
+            args={
+                "max_gleanings": 0,
+            },
+            model=create_mock_llm(
+                responses=[
+                    """
+                    ("relationship"<|>TEST_ENTITY_2<|>TEST_ENTITY_1<|>TEST_ENTITY_2 owns TEST_ENTITY_1<|>2)
+                    ##
+                    ("entity"<|>TEST_ENTITY_1<|>COMPANY<|>TEST_ENTITY_1 is a test company)
+                    ##
+                    ("entity"<|>TEST_ENTITY_1<|>COMPANY<|>TEST_ENTITY_1 is a subsidiary)
+                    ##
+                    ("relationship"<|>TEST_ENTITY_1<|>TEST_ENTITY_2<|>TEST_ENTITY_1 is owned by TEST_ENTITY_2<|>3)
+                    """.strip()
+                ],
+                name="test_run_extract_graph_merges_duplicate_records",
+            ),
+        )
+
+        assert results.entities == [
+            {
+                "title": "TEST_ENTITY_2",
+                "type": "",
+                "description": "",
+                "source_id": "1",
+            },
+            {
+                "title": "TEST_ENTITY_1",
+                "type": "COMPANY",
+                "description": "TEST_ENTITY_1 is a test company\nTEST_ENTITY_1 is a subsidiary",
+                "source_id": "1",
+            },
+        ]
+        assert results.relationships == [
+            {
+                "source": "TEST_ENTITY_2",
+                "target": "TEST_ENTITY_1",
+                "weight": 5.0,
+                "description": "TEST_ENTITY_2 owns TEST_ENTITY_1\nTEST_ENTITY_1 is owned by TEST_ENTITY_2",
+                "source_id": "1",
+            }
+        ]
@@ -31,7 +31,11 @@ class MockBaseVectorStore(BaseVectorStore):
         raise NotImplementedError
 
     def similarity_search_by_vector(
-        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+        self,
+        query_embedding: list[float],
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
         return [
             VectorStoreSearchResult(document=document, score=1)
@@ -39,7 +43,12 @@ class MockBaseVectorStore(BaseVectorStore):
         ]
 
     def similarity_search_by_text(
-        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+        self,
+        text: str,
+        text_embedder: TextEmbedder,
+        k: int = 10,
+        include_ids: list[str] | list[int] | None = None,
+        **kwargs: Any,
     ) -> list[VectorStoreSearchResult]:
         return sorted(
             [
@@ -47,6 +56,7 @@ class MockBaseVectorStore(BaseVectorStore):
                     document=document, score=abs(len(text) - len(document.text or ""))
                 )
                 for document in self.documents
+                if include_ids is None or document.id in include_ids
             ],
             key=lambda x: x.score,
         )[:k]
@@ -132,6 +142,30 @@ def test_map_query_to_entities():
         )
     ]
 
+    # the search is limited to the included ids
+    assert map_query_to_entities(
+        query="t22",
+        text_embedding_vectorstore=MockBaseVectorStore([
+            VectorStoreDocument(id=entity.id, text=entity.title, vector=None)
+            for entity in entities
+        ]),
+        text_embedder=ModelManager().get_or_create_embedding_model(
+            model_type="mock_embedding", name="mock"
+        ),
+        all_entities_dict={entity.id: entity for entity in entities},
+        embedding_vectorstore_key=EntityVectorStoreKey.ID,
+        k=1,
+        oversample_scaler=1,
+        include_ids=["8fd6d72a-8e9d-4183-8a97-c38bcc971c83"],
+    ) == [
+        Entity(
+            id="8fd6d72a-8e9d-4183-8a97-c38bcc971c83",
+            short_id="sid4",
+            title="t4444",
+            rank=3,
+        )
+    ]
+
     assert map_query_to_entities(
         query="",
         text_embedding_vectorstore=MockBaseVectorStore([
@@ -3,9 +3,14 @@
 
 from graphrag.config.create_graphrag_config import create_graphrag_config
 from graphrag.config.enums import ModelType
+from graphrag.data_model.schemas import COVARIATES_FINAL_COLUMNS
+from graphrag.index.workflows.extract_covariates import (
+    run_workflow as run_extract_covariates,
+)
 from graphrag.index.workflows.extract_graph import (
     run_workflow,
 )
+from graphrag.language_model.manager import ModelManager
 from graphrag.utils.storage import load_table_from_storage
 
 from .util import (
@@ -27,6 +32,19 @@ MOCK_LLM_ENTITY_RESPONSES = [
     """.strip()
 ]
 
+MOCK_LLM_JOINT_RESPONSES = [
+    """
+    ("entity"<|>COMPANY_A<|>COMPANY<|>Company_A is a test company)
+    ##
+    ("entity"<|>PERSON_C<|>PERSON<|>Person_C is director of Company_A)
+    ##
+    ("relationship"<|>COMPANY_A<|>PERSON_C<|>Company_A and Person_C are related because Person_C is director of Company_A<|>1)
+    ##
+    ("claim"<|>company_a<|>NONE<|>FRAUD<|>SUSPECTED<|>NONE<|>NONE<|>Company_A is suspected of fraud<|>Company_A was investigated for fraud)
+    <|COMPLETE|>
+    """.strip()
+]
+
 MOCK_LLM_SUMMARIZATION_RESPONSES = [
     """
     This is a MOCK response for the LLM. It is summarized!
@@ -76,3 +94,50 @@ async def test_extract_graph():
     # we need to update the mocking to provide somewhat unique graphs so a true merge happens
     # the assertion should grab a node and ensure the description matches the mock description, not the original as we are doing below
     assert nodes_actual["description"].to_numpy()[0] == "Company_A is a test company"
+
+
+async def test_extract_graph_with_joint_claims():
+    context = await create_test_context(
+        storage=["text_units"],
+    )
+    text_units = await load_table_from_storage("text_units", context.output_storage)
+
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    extract_graph_llm_settings = config.get_language_model_config(
+        config.extract_graph.model_id
+    ).model_dump()
+    extract_graph_llm_settings["type"] = ModelType.MockChat
+    extract_graph_llm_settings["responses"] = MOCK_LLM_JOINT_RESPONSES
+    config.extract_graph.strategy = {
+        "type": "graph_intelligence",
+        "llm": extract_graph_llm_settings,
+        "max_gleanings": 0,
+    }
+    config.summarize_descriptions.strategy = {
+        "type": "graph_intelligence",
+        "llm": {
+            **extract_graph_llm_settings,
+            "responses": MOCK_LLM_SUMMARIZATION_RESPONSES,
+        },
+        "max_input_tokens": 1000,
+        "max_summary_length": 100,
+    }
+    config.extract_claims.enabled = True
+    config.extract_claims.joint_extraction = True
+    # models are cached by name, so drop the mock registered by the previous test
+    ModelManager().remove_chat("extract_graph")
+
+    await run_workflow(config, context)
+    # the claims pass must not call a model, so we leave its strategy unconfigured
+    await run_extract_covariates(config, context)
+
+    covariates = await load_table_from_storage("covariates", context.output_storage)
+
+    assert list(covariates.columns) == COVARIATES_FINAL_COLUMNS
+    # the mock returns one claim for each text unit
+    assert len(covariates) == len(text_units)
+    assert set(covariates["text_unit_id"]) == set(text_units["id"])
+    assert covariates["covariate_type"][0] == "claim"
+    assert covariates["subject_id"][0] == "COMPANY_A"
+    assert covariates["status"][0] == "SUSPECTED"
+    assert covariates["source_text"][0] == "Company_A was investigated for fraud"
@@ -364,5 +364,6 @@ def load_knowledge_model(sv: SessionVariables):
     sv.community_reports.value = model.community_reports
     sv.communities.value = model.communities
     sv.text_units.value = model.text_units
+    sv.graph_edges.value = model.graph_edges
 
     return sv
@@ -23,6 +23,9 @@ covariate_table = "output/covariates"
 # name of the table in the graph-indexed data where the text units are stored
 text_unit_table = "output/text_units"
 
+# name of the optional Arrow graph snapshot (snapshots.graph_arrow) in the graph-indexed data
+graph_snapshot = "output/graph"
+
 # default configurations for LLM's answer generation, used in all search types
 # this should be adjusted based on the token limits of the LLM model being used
 # The following setting is for gpt-4-1106-preview (i.e. gpt-4-turbo)
@@ -73,3 +73,20 @@ def get_communities_data(
 ) -> pd.DataFrame:
     """Return a dataframe with communities data from the indexed-data."""
     return _datasource.read(config.communities_table)
+
+
+@st.cache_data(ttl=config.default_ttl)
+def get_graph_edge_data(
+    _datasource: Datasource,
+) -> pd.DataFrame:
+    """Return a dataframe with the source and target titles and weight of every edge of the Arrow graph snapshot, if any."""
+    graph = _datasource.read_graph_snapshot(config.graph_snapshot)
+    if graph is None:
+        return pd.DataFrame(columns=["source", "target", "weight"])
+    edges = pd.DataFrame({
+        "source": graph.nodes[graph.sources],
+        "target": graph.nodes[graph.targets],
+        "weight": graph.weights,
+    })
+    print(f"Graph snapshot edges: {len(edges)}")  # noqa T201
+    return edges
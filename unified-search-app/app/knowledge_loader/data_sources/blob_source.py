@@ -17,6 +17,10 @@ from knowledge_loader.data_sources.typing import Datasource
 
 from graphrag.config.create_graphrag_config import create_graphrag_config
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.operations.snapshot_graph_arrow import (
+    load_graph_snapshot_from_bytes,
+)
+from graphrag.index.utils.compact_graph import CompactGraph
 
 from .default import blob_account_name, blob_container_name
 
@@ -125,3 +129,14 @@ class BlobDatasource(Datasource):
             return None
 
         return graphrag_config
+
+    def read_graph_snapshot(self, name: str) -> CompactGraph | None:
+        """Read Arrow graph snapshot from container."""
+        try:
+            nodes = load_blob_file(self._database, f"{name}_nodes.arrow")
+            edges = load_blob_file(self._database, f"{name}_edges.arrow")
+        except Exception:  # noqa: BLE001
+            logger.warning("Graph snapshot %s does not exist", name)
+            return None
+
+        return load_graph_snapshot_from_bytes(nodes.getvalue(), edges.getvalue())
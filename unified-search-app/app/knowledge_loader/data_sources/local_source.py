@@ -12,6 +12,8 @@ from knowledge_loader.data_sources.typing import Datasource
 
 from graphrag.config.load_config import load_config
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.operations.snapshot_graph_arrow import load_graph_snapshot
+from graphrag.index.utils.compact_graph import CompactGraph
 
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("azure").setLevel(logging.WARNING)
@@ -70,3 +72,11 @@ class LocalDatasource(Datasource):
         cwd = Path(__file__).parent
         root_dir = (cwd / self._base_path).resolve()
         return load_config(root_dir=root_dir)
+
+    def read_graph_snapshot(self, name: str) -> CompactGraph | None:
+        """Read Arrow graph snapshot from local source, memory-mapping its files."""
+        directory = Path(self._base_path) / name
+        if not (directory.parent / f"{directory.name}_edges.arrow").exists():
+            logger.info("Graph snapshot %s does not exist", name)
+            return None
+        return load_graph_snapshot(directory.parent, directory.name)
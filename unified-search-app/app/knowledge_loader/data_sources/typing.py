@@ -10,6 +10,7 @@ from enum import Enum
 import pandas as pd
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.utils.compact_graph import CompactGraph
 
 
 class WriteMode(Enum):
@@ -54,6 +55,10 @@ class Datasource(ABC):
         """Check if table exists method definition."""
         raise NotImplementedError
 
+    def read_graph_snapshot(self, name: str) -> CompactGraph | None:
+        """Read Arrow graph snapshot method definition, returning None if there is no snapshot."""
+        raise NotImplementedError
+
 
 @dataclass
 class VectorIndexConfig:
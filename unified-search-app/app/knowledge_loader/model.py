@@ -15,6 +15,7 @@ from knowledge_loader.data_prep import (
     get_community_report_data,
     get_covariate_data,
     get_entity_data,
+    get_graph_edge_data,
     get_relationship_data,
     get_text_unit_data,
 )
@@ -72,6 +73,14 @@ def load_text_units(dataset: str, _datasource: Datasource) -> pd.DataFrame:
     return get_text_unit_data(dataset, _datasource)
 
 
+@st.cache_data(ttl=default_ttl)
+def load_graph_edges(
+    _datasource: Datasource,
+) -> pd.DataFrame:
+    """Return the edges of the Arrow graph snapshot, or an empty frame if the index has none."""
+    return get_graph_edge_data(_datasource)
+
+
 @dataclass
 class KnowledgeModel:
     """KnowledgeModel class definition."""
@@ -82,6 +91,7 @@ class KnowledgeModel:
     communities: pd.DataFrame
     text_units: pd.DataFrame
     covariates: pd.DataFrame | None = None
+    graph_edges: pd.DataFrame | None = None
 
 
 def load_model(
@@ -99,6 +109,7 @@ def load_model(
     community_reports = load_community_reports(datasource)
     communities = load_communities(datasource)
     text_units = load_text_units(dataset, datasource)
+    graph_edges = load_graph_edges(datasource)
 
     return KnowledgeModel(
         entities=entities,
@@ -107,4 +118,5 @@ def load_model(
         communities=communities,
         text_units=text_units,
         covariates=(None if covariates.empty else covariates),
+        graph_edges=(None if graph_edges.empty else graph_edges),
     )
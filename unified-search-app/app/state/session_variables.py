@@ -28,6 +28,7 @@ class SessionVariables:
         self.communities = SessionVariable([])
         self.community_reports = SessionVariable([])
         self.text_units = SessionVariable([])
+        self.graph_edges = SessionVariable()
         self.question_in_progress = SessionVariable("")
         self.include_global_search = QueryVariable("include_global_search", True)
         self.include_local_search = QueryVariable("include_local_search", True)
@@ -33,7 +33,7 @@ def create_full_graph_ui(sv: SessionVariables):
         communities_entities["level"] == level
     ]
 
-    graph = (
+    nodes = (
         alt.Chart(communities_entities_filtered)
         .mark_circle()
         .encode(
@@ -49,8 +49,27 @@ def create_full_graph_ui(sv: SessionVariables):
             size=alt.Size("degree", scale=alt.Scale(range=[50, 1000]), legend=None),
             tooltip=["id_entities", "type", "description", "community"],
         )
-        .properties(height=1000)
-        .configure_axis(disable=True)
     )
+
+    # the edges are only drawn when the index has an Arrow graph snapshot
+    graph_edges = sv.graph_edges.value
+    if graph_edges is not None and not entities.empty:
+        positions = entities.dropna(subset=["x", "y"]).set_index("title")
+        edges = graph_edges.assign(
+            x=graph_edges["source"].map(positions["x"]),
+            y=graph_edges["source"].map(positions["y"]),
+            x2=graph_edges["target"].map(positions["x"]),
+            y2=graph_edges["target"].map(positions["y"]),
+        ).dropna()
+        layers = [
+            alt.Chart(edges)
+            .mark_rule(opacity=0.15, color="gray")
+            .encode(x="x", y="y", x2="x2", y2="y2"),
+            nodes,
+        ]
+    else:
+        layers = [nodes]
+
+    graph = alt.layer(*layers).properties(height=1000).configure_axis(disable=True)
     st.altair_chart(graph, use_container_width=True)
     return graph